@@ -10,8 +10,18 @@ import os
 from flask import Flask
 
 from app.core.config import get_config
-from app.core.extensions import db, jwt, migrate, limiter, talisman
-from app.core.logger import setup_logging, RequestLoggingMiddleware
+from app.core.extensions import db, jwt, limiter, talisman
+from app.core.logger import init_access_log, setup_logging
+from app.core.events import init_events
+from app.core.cache import init_cache
+from app.core.replicas import configure_replica_binds, init_replicas
+from app.core.pool import init_engine_telemetry
+from app.core.timing import init_server_timing
+from app.core.metrics import init_metrics
+from app.core.json_provider import init_json
+from app.core.compression import init_compression
+from app.core.green import init_green
+from app.core.openapi import init_openapi
 
 
 def create_app(config_class=None):
@@ -23,17 +33,32 @@ def create_app(config_class=None):
         config_class = get_config()
     
     app.config.from_object(config_class)
+    init_json(app)
     
     # Setup structured logging
     log_level = app.config.get('LOG_LEVEL', 'INFO')
     log_file = app.config.get('LOG_FILE', 'app.log')
-    setup_logging(log_level, log_file)
+    setup_logging(
+        log_level,
+        log_file,
+        queue_size=app.config.get('LOG_QUEUE_SIZE', 10000),
+        max_bytes=app.config.get('LOG_MAX_BYTES', 0),
+        backup_count=app.config.get('LOG_BACKUP_COUNT', 5),
+    )
+    init_green(app)
 
     # Initialize Flask extensions
+    replica_binds = configure_replica_binds(app)
     db.init_app(app)
+    init_replicas(app, replica_binds)
+    init_engine_telemetry(app)
+    init_server_timing(app)
+    init_metrics(app)
     jwt.init_app(app)
-    migrate.init_app(app, db)
     limiter.init_app(app)
+    init_events(app)
+    init_cache(app)
+    init_compression(app)
     
     # Initialize Talisman (security headers) with dev-friendly settings
     # In production, use stricter CSP and force HTTPS
@@ -50,32 +75,18 @@ def create_app(config_class=None):
         },
     )
     
-    # Initialize Swagger/OpenAPI documentation
-    from flasgger import Swagger
-    swagger_template = app.config.get('SWAGGER_TEMPLATE', {})
-    swagger_config = {
-        "headers": [],
-        "specs": [
-            {
-                "endpoint": "apispec",
-                "route": "/apispec.json",
-                "rule_filter": lambda rule: True,
-                "model_filter": lambda tag: True,
-            }
-        ],
-        "static_url_path": "/flasgger_static",
-        "swagger_ui": True,
-        "specs_route": "/apidocs/",
-        "openapi": "3.0.0"
-    }
-    Swagger(app, template=swagger_template, config=swagger_config)
+    # Swagger/OpenAPI documentation: precomputed spec if built, else flasgger at runtime
+    init_openapi(app)
     
     # Import and initialize security callbacks (JWT token revocation, etc.)
     with app.app_context():
         from app.core import security  # noqa: F401 - registers JWT callbacks
     
     # Import and register API blueprints
-    from app.api import auth_bp, users_bp, projects_bp, tasks_bp, system_bp, errors_bp
+    from app.api import (
+        auth_bp, users_bp, projects_bp, tasks_bp, search_bp, sync_bp, events_bp, export_bp,
+        import_bp, system_bp, errors_bp,
+    )
     
     # Register error handlers first (app-wide)
     app.register_blueprint(errors_bp)
@@ -85,10 +96,22 @@ def create_app(config_class=None):
     app.register_blueprint(users_bp, url_prefix="/api/users")
     app.register_blueprint(projects_bp, url_prefix="/api/projects")
     app.register_blueprint(tasks_bp, url_prefix="/api/tasks")
+    app.register_blueprint(search_bp, url_prefix="/api/search")
+    app.register_blueprint(sync_bp, url_prefix="/api/sync")
+    app.register_blueprint(events_bp, url_prefix="/api/events")
+    app.register_blueprint(export_bp, url_prefix="/api/export")
+    app.register_blueprint(import_bp, url_prefix="/api/import")
     app.register_blueprint(system_bp)  # /health and /ready at root
     
-    # Add request logging middleware
+    # Register CLI commands
+    from app.cli import import_data_command, migrate_command, openapi_spec_command, startup_profile_command
+    app.cli.add_command(migrate_command)
+    app.cli.add_command(import_data_command)
+    app.cli.add_command(openapi_spec_command)
+    app.cli.add_command(startup_profile_command)
+    
+    # One access log line per request
     if not is_development:
-        app.wsgi_app = RequestLoggingMiddleware(app.wsgi_app)
+        init_access_log(app)
 
     return app
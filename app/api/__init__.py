@@ -11,6 +11,11 @@ auth_bp = Blueprint("auth", __name__)
 users_bp = Blueprint("users", __name__)
 projects_bp = Blueprint("projects", __name__)
 tasks_bp = Blueprint("tasks", __name__)
+search_bp = Blueprint("search", __name__)
+sync_bp = Blueprint("sync", __name__)
+events_bp = Blueprint("events", __name__)
+export_bp = Blueprint("export", __name__)
+import_bp = Blueprint("import", __name__)
 
 # Enable CORS for all blueprints with explicit configuration
 cors_config = {
@@ -24,9 +29,14 @@ CORS(auth_bp, **cors_config)
 CORS(users_bp, **cors_config)
 CORS(projects_bp, **cors_config)
 CORS(tasks_bp, **cors_config)
+CORS(search_bp, **cors_config)
+CORS(sync_bp, **cors_config)
+CORS(events_bp, **cors_config)
+CORS(export_bp, **cors_config)
+CORS(import_bp, **cors_config)
 
 # Import routes after blueprint creation to avoid circular imports
-from app.api import auth, users, projects, tasks
+from app.api import auth, users, projects, tasks, search, sync, events, export, imports
 
 # Import system and error blueprints
 from app.api.system import system_bp
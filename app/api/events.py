@@ -0,0 +1,91 @@
+"""
+Events API Routes
+
+Server-Sent Events stream of the current user's change notifications.
+"""
+import json
+
+from flask import Response, current_app, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.api import events_bp
+from app.core.events import get_broker
+
+# Set by the ASGI app (app.asgi): a callable taking (subscription, heartbeat) that
+# streams the events on the event loop once this view's headers are sent
+STREAM_HANDOFF_KEY = "app.event_stream_handoff"
+
+
+def format_event(payload: dict) -> str:
+    """Format a change notification as an SSE message."""
+    return f"event: {payload['type']}\ndata: {json.dumps(payload)}\n\n"
+
+
+def stream_events(subscription, heartbeat: float):
+    """
+    Yield SSE messages until the client disconnects.
+
+    Runs outside the request context, so it holds no DB session. Between
+    events it blocks on the subscription queue; the heartbeat comment
+    keeps proxies from closing the connection and reveals disconnects.
+    """
+    with subscription:
+        yield f"retry: {int(heartbeat * 1000)}\n\n"
+        while True:
+            payload = subscription.get(timeout=heartbeat)
+            if payload is None:
+                yield ": heartbeat\n\n"
+            else:
+                yield format_event(payload)
+
+
+@events_bp.route("/", methods=["GET"], strict_slashes=False)
+@jwt_required(locations=["headers"])
+def get_events():
+    """
+    Stream change notifications for the current user
+    ---
+    tags:
+      - Events
+    security:
+      - BearerAuth: []
+    description: |
+      Server-Sent Events stream. Each message is named after the change
+      (project.created, project.updated, project.deleted, task.created,
+      task.updated, task.deleted, user.updated) and carries the entity
+      IDs as JSON.
+      A `resync` event means notifications were dropped, and
+      `import.completed` that a bulk import added rows; call /api/sync
+      to catch up. Comment lines are heartbeats.
+    responses:
+      200:
+        description: Event stream opened
+        content:
+          text/event-stream:
+            schema:
+              type: string
+              example: |
+                event: task.updated
+                data: {"type": "task.updated", "id": 12, "project_id": 3}
+      401:
+        description: Missing or invalid token
+    """
+    # Subscribe before returning so nothing committed after this point is missed
+    subscription = get_broker().subscribe(get_jwt_identity())
+    heartbeat = current_app.config.get("EVENTS_HEARTBEAT_SECONDS", 15)
+
+    handoff = request.environ.get(STREAM_HANDOFF_KEY)
+    if handoff is not None:
+        handoff(subscription, heartbeat)
+        body = iter(())  # Streamed, so no Content-Length ends the response early
+    else:
+        body = stream_events(subscription, heartbeat)
+
+    return Response(
+        body,
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        },
+    )
@@ -0,0 +1,79 @@
+"""
+Export API Routes
+
+Handles streaming exports of a user's projects and tasks.
+"""
+from datetime import date
+
+from flask import current_app, request, stream_with_context
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.api import export_bp
+from app.services.export_service import ExportService, FORMATS
+from app.common.response_util import generate_response
+
+MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@export_bp.route("/", methods=["GET"], strict_slashes=False)
+@jwt_required(locations=["headers"])
+def export_data():
+    """
+    Export all projects and tasks of the current user
+    ---
+    tags:
+      - Export
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: format
+        in: query
+        schema:
+          type: string
+          enum: [ndjson, csv]
+          default: ndjson
+        description: One row per project or task, projects first
+      - name: Accept-Encoding
+        in: header
+        schema:
+          type: string
+        description: Send gzip to receive a gzip-compressed stream
+    responses:
+      200:
+        description: |
+          Streamed export. Every row has a `type` (project or task) and `id`;
+          tasks reference their project through `project_id`. CSV columns:
+          type, id, project_id, project_name, task_name, description,
+          due_date, status, created_at, update_at.
+        content:
+          application/x-ndjson:
+            schema:
+              type: string
+            example: |
+              {"type": "project", "id": 3, "project_name": "Website", "description": "Relaunch", "created_at": "2024-01-01T00:00:00", "update_at": "2024-01-01T00:00:00"}
+              {"type": "task", "id": 12, "project_id": 3, "task_name": "Write API docs", "description": null, "due_date": "2024-12-31", "status": "pending", "created_at": "2024-01-01T00:00:00", "update_at": "2024-01-01T00:00:00"}
+          text/csv:
+            schema:
+              type: string
+      401:
+        description: Missing or invalid token
+      422:
+        description: Unsupported format
+    """
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in FORMATS:
+        return generate_response(False, f"format must be one of: {', '.join(FORMATS)}", status_code=422)
+
+    gzip = request.accept_encodings.quality("gzip") > 0
+    user_id = get_jwt_identity()
+    # The generator reads from the DB session, so it needs the request context while streaming
+    body = stream_with_context(ExportService.stream(user_id, export_format, gzip=gzip))
+
+    response = current_app.response_class(body, mimetype=MIMETYPES[export_format])
+    filename = f"export-{date.today().isoformat()}.{export_format}"
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response.headers["Cache-Control"] = "no-store"
+    response.headers["Vary"] = "Accept-Encoding"
+    if gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    return response
@@ -0,0 +1,111 @@
+"""
+Import API Routes
+
+Handles streaming bulk imports of projects and tasks.
+"""
+import gzip
+import io
+
+from flask import current_app, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.api import import_bp
+from app.services.import_service import ImportService, FORMATS
+from app.common.response_util import generate_response
+
+
+@import_bp.route("/", methods=["POST"], strict_slashes=False)
+@jwt_required(locations=["headers"])
+def import_data():
+    """
+    Import projects and tasks from NDJSON or CSV
+    ---
+    tags:
+      - Import
+    security:
+      - BearerAuth: []
+    description: |
+      Accepts the row format of GET /api/export. The body is read as a
+      stream and written in chunks. A task's project_id refers to a project
+      row earlier in the file (by its id) or to an existing project you own.
+      Send `Content-Encoding: gzip` for a compressed body.
+    parameters:
+      - name: format
+        in: query
+        schema:
+          type: string
+          enum: [ndjson, csv]
+        description: Defaults to csv for a text/csv body, ndjson otherwise
+    requestBody:
+      required: true
+      content:
+        application/x-ndjson:
+          schema:
+            type: string
+          example: |
+            {"type": "project", "id": 1, "project_name": "Website", "description": "Relaunch"}
+            {"type": "task", "project_id": 1, "task_name": "Write API docs", "due_date": "2030-12-31", "status": "pending"}
+        text/csv:
+          schema:
+            type: string
+    responses:
+      200:
+        description: Import finished; rows that failed are listed by line
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                success:
+                  type: boolean
+                  example: true
+                message:
+                  type: string
+                  example: Import finished
+                data:
+                  type: object
+                  properties:
+                    projects_imported:
+                      type: integer
+                      example: 1
+                    tasks_imported:
+                      type: integer
+                      example: 1
+                    error_count:
+                      type: integer
+                      example: 0
+                    errors:
+                      type: array
+                      items:
+                        type: object
+                        properties:
+                          line:
+                            type: integer
+                          error:
+                            type: string
+      401:
+        description: Missing or invalid token
+      422:
+        description: Unsupported format or encoding
+      500:
+        description: Database error; rows of earlier chunks stay imported
+    """
+    import_format = request.args.get("format") or ("csv" if request.mimetype == "text/csv" else "ndjson")
+    if import_format not in FORMATS:
+        return generate_response(False, f"format must be one of: {', '.join(FORMATS)}", status_code=422)
+
+    stream = request.stream
+    encoding = request.headers.get("Content-Encoding", "identity").lower()
+    if encoding == "gzip":
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    elif encoding != "identity":
+        return generate_response(False, "Content-Encoding must be gzip or identity", status_code=422)
+
+    text = io.TextIOWrapper(stream, encoding="utf-8", errors="replace", newline="")
+    success, message, summary = ImportService.import_rows(
+        get_jwt_identity(),
+        ImportService.parse(text, import_format),
+        chunk_size=current_app.config.get("IMPORT_CHUNK_SIZE", 1000),
+        max_errors=current_app.config.get("IMPORT_MAX_ERRORS", 100),
+    )
+    return generate_response(success, message, summary, 200 if success else 500)
@@ -10,10 +10,14 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.api import projects_bp
 from app.services.project_service import ProjectService
 from app.common.response_util import generate_response
+from app.common.conditional import conditional_get
+from app.common.response_cache import cached_response
 
 
 @projects_bp.route("/", methods=["GET"], strict_slashes=False)
 @jwt_required(locations=["headers"])
+@conditional_get(ProjectService.get_projects_version)
+@cached_response(ProjectService.get_projects_cache_scopes)
 def get_all_projects():
     """
     Get all projects for the current user
@@ -90,6 +94,8 @@ def get_all_projects():
                     total_items:
                       type: integer
                       example: 50
+      304:
+        description: Not modified since the ETag sent in If-None-Match
       401:
         description: Missing or invalid token
       500:
@@ -195,6 +201,7 @@ def create_project():
 
 @projects_bp.route("/<int:id>", methods=["GET"], strict_slashes=False)
 @jwt_required(locations=["headers"])
+@conditional_get(ProjectService.get_project_version)
 def get_project_by_id(id):
     """
     Get a project by ID
@@ -241,6 +248,8 @@ def get_project_by_id(id):
                     update_at:
                       type: string
                       format: date-time
+      304:
+        description: Not modified since the ETag sent in If-None-Match
       401:
         description: Missing or invalid token
       404:
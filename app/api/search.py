@@ -0,0 +1,104 @@
+"""
+Search API Routes
+
+Handles typeahead suggestions for project pickers and task quick-jump.
+"""
+from flask import request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.api import search_bp
+from app.core.extensions import limiter
+from app.services.search_service import SearchService
+from app.common.response_util import generate_response
+
+MAX_PREFIX_LENGTH = 128
+MAX_SUGGESTIONS = 50
+
+
+@search_bp.route("/suggest", methods=["GET"], strict_slashes=False)
+@jwt_required(locations=["headers"])
+@limiter.limit("120 per minute")  # One request per keystroke; the default limit is far too low
+def suggest():
+    """
+    Suggest project and task names by prefix
+    ---
+    tags:
+      - Search
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: prefix
+        in: query
+        required: true
+        schema:
+          type: string
+          minLength: 1
+          maxLength: 128
+        description: Text typed so far; matches the start of any word in a name
+      - name: limit
+        in: query
+        schema:
+          type: integer
+          default: 10
+          minimum: 1
+          maximum: 50
+        description: Maximum number of suggestions
+    responses:
+      200:
+        description: Suggestions retrieved successfully
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                success:
+                  type: boolean
+                  example: true
+                message:
+                  type: string
+                  example: Suggestions retrieved successfully
+                data:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      type:
+                        type: string
+                        enum: [project, task]
+                        example: task
+                      id:
+                        type: integer
+                        example: 12
+                      name:
+                        type: string
+                        example: Write API docs
+                      project_id:
+                        type: integer
+                        example: 3
+      401:
+        description: Missing or invalid token
+      422:
+        description: Missing prefix or invalid limit
+      500:
+        description: Database error
+    """
+    prefix = request.args.get("prefix", "").strip()
+    if not prefix or len(prefix) > MAX_PREFIX_LENGTH:
+        return generate_response(
+            False, f"prefix must be between 1 and {MAX_PREFIX_LENGTH} characters",
+            status_code=422
+        )
+
+    try:
+        limit = int(request.args.get("limit", 10))
+    except ValueError:
+        return generate_response(False, "Invalid limit parameter", status_code=422)
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+
+    try:
+        user_id = get_jwt_identity()
+        suggestions = SearchService.suggest(user_id, prefix, limit)
+        return generate_response(True, "Suggestions retrieved successfully", suggestions)
+    except SQLAlchemyError as e:
+        return generate_response(False, f"Error retrieving suggestions: {str(e)}", status_code=500)
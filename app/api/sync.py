@@ -0,0 +1,97 @@
+"""
+Sync API Routes
+
+Handles delta sync of projects and tasks for clients.
+"""
+from flask import current_app, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.api import sync_bp
+from app.services.sync_service import SyncService
+from app.common.response_util import generate_response
+
+
+@sync_bp.route("/", methods=["GET"], strict_slashes=False)
+@jwt_required(locations=["headers"])
+def get_changes():
+    """
+    Get projects and tasks changed since a cursor
+    ---
+    tags:
+      - Sync
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: since
+        in: query
+        schema:
+          type: string
+        description: Cursor returned by the previous sync. Omit for a full snapshot.
+    responses:
+      200:
+        description: Changes retrieved successfully
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                success:
+                  type: boolean
+                  example: true
+                message:
+                  type: string
+                  example: Changes retrieved successfully
+                data:
+                  type: object
+                  properties:
+                    projects:
+                      type: array
+                      description: Projects created or updated after the cursor
+                      items:
+                        type: object
+                    tasks:
+                      type: array
+                      description: Tasks created or updated after the cursor
+                      items:
+                        type: object
+                    deleted:
+                      type: object
+                      properties:
+                        projects:
+                          type: array
+                          items:
+                            type: integer
+                        tasks:
+                          type: array
+                          items:
+                            type: integer
+                    cursor:
+                      type: string
+                      example: "1042"
+                    has_more:
+                      type: boolean
+                      description: Call again with the new cursor to fetch the next page
+      401:
+        description: Missing or invalid token
+      422:
+        description: Invalid cursor
+      500:
+        description: Database error
+    """
+    since = request.args.get("since")
+    if since is not None:
+        try:
+            since = int(since)
+        except ValueError:
+            return generate_response(False, "Invalid cursor", status_code=422)
+        if since < 0:
+            return generate_response(False, "Invalid cursor", status_code=422)
+
+    try:
+        user_id = get_jwt_identity()
+        limit = current_app.config.get("SYNC_MAX_CHANGES", 1000)
+        changes = SyncService.get_changes(user_id, since, limit)
+        return generate_response(True, "Changes retrieved successfully", changes)
+    except SQLAlchemyError as e:
+        return generate_response(False, f"Error retrieving changes: {str(e)}", status_code=500)
@@ -1,13 +1,18 @@
 """
 System API Routes
 
-Health check and system status endpoints.
+Health check, system status and metrics endpoints.
 """
 import time
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 from sqlalchemy import text
 
-from app.core.extensions import db
+from app.core.cache import get_cache
+from app.core.extensions import db, limiter, talisman
+from app.core.logger import logging_stats
+from app.core.metrics import metrics_response
+from app.core.pool import pool_stats
+from app.core.replicas import get_replica_router
 
 system_bp = Blueprint("system", __name__)
 
@@ -21,7 +26,8 @@ def health_check():
     Health check endpoint for monitoring.
     
     Returns:
-        200: System healthy with database connection status and uptime
+        200: System healthy with database connection status, uptime,
+             connection pool, cache and logging queue statistics
         503: System unhealthy
     """
     health_status = {
@@ -29,6 +35,18 @@ def health_check():
         "uptime_seconds": round(time.time() - APP_START_TIME, 2),
         "database": "disconnected",
     }
+    cache = get_cache()
+    if cache is not None:
+        health_status["response_cache"] = cache.stats()
+    health_status["database_pool"] = {
+        key or "primary": pool_stats(engine) for key, engine in db.engines.items()
+    }
+    router = get_replica_router(current_app)
+    if router is not None:
+        health_status["replicas"] = router.status()
+    log_stats = logging_stats()
+    if log_stats is not None:
+        health_status["logging"] = log_stats
     
     # Check database connection
     try:
@@ -56,3 +74,15 @@ def readiness_check():
         return jsonify({"ready": True}), 200
     except Exception:
         return jsonify({"ready": False}), 503
+
+
+@system_bp.route("/metrics", methods=["GET"])
+@limiter.exempt
+@talisman(force_https=False)
+def metrics():
+    """
+    Prometheus metrics of all workers (404 unless METRICS_ENABLED).
+
+    Scraped over plain HTTP from inside the network, like /health.
+    """
+    return metrics_response()
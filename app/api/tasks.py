@@ -10,10 +10,14 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.api import tasks_bp
 from app.services.task_service import TaskService
 from app.common.response_util import generate_response
+from app.common.conditional import conditional_get
+from app.common.response_cache import cached_response
 
 
 @tasks_bp.route("/<int:project_id>/tasks", methods=["GET"], strict_slashes=False)
 @jwt_required(locations=["headers"])
+@conditional_get(TaskService.get_tasks_version)
+@cached_response(TaskService.get_tasks_cache_scopes)
 def get_all_tasks_by_project_id(project_id):
     """
     Get all tasks for a project
@@ -73,6 +77,8 @@ def get_all_tasks_by_project_id(project_id):
                       update_at:
                         type: string
                         format: date-time
+      304:
+        description: Not modified since the ETag sent in If-None-Match
       401:
         description: Missing or invalid token
       403:
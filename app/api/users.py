@@ -10,10 +10,13 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.api import users_bp
 from app.services.user_service import UserService
 from app.common.response_util import success_response, error_response
+from app.common.conditional import conditional_get
+from app.common.response_cache import cached_response
 
 
 @users_bp.route("/", methods=["GET"], strict_slashes=False)
 @jwt_required()
+@conditional_get(UserService.get_users_version)
 def get_all_users():
     """
     Get all users (paginated)
@@ -78,6 +81,8 @@ def get_all_users():
                     total_items:
                       type: integer
                       example: 50
+      304:
+        description: Not modified since the ETag sent in If-None-Match
       401:
         description: Missing or invalid token
       422:
@@ -99,6 +104,8 @@ def get_all_users():
 
 @users_bp.route("/<int:user_id>", methods=["GET"], strict_slashes=False)
 @jwt_required()
+@conditional_get(UserService.get_user_version)
+@cached_response(UserService.get_user_cache_scopes)
 def get_user_by_id(user_id):
     """
     Get a user by ID
@@ -146,6 +153,8 @@ def get_user_by_id(user_id):
                             type: integer
                           project_name:
                             type: string
+      304:
+        description: Not modified since the ETag sent in If-None-Match
       401:
         description: Missing or invalid token
       403:
@@ -167,7 +176,7 @@ def get_user_by_id(user_id):
         return jsonify({"error": "You don't have permission to access this user's data"}), 403
 
     try:
-        user = UserService.get_user_by_id(user_id)
+        user = UserService.get_user_with_projects(user_id)
         
         if not user:
             return jsonify({"message": "User not found"}), 404
@@ -0,0 +1,128 @@
+"""
+ASGI Application
+
+Runs the Flask app under an ASGI server (`uvicorn asgi:app`). The event
+loop owns the connections, so slow clients, request uploads and idle
+keep-alive connections cost no thread. Each request, once its body has
+arrived, runs through the regular WSGI app on a bounded thread pool
+(ASGI_THREADS). Views, DB sessions and extensions therefore behave exactly
+as under a WSGI server, and CPU-heavy work such as password hashing never
+runs on the loop.
+
+The event stream is the exception: /api/events runs its view (auth,
+rate limits, headers) on the pool, then hands its subscription back and
+streams on the loop, so an idle SSE connection holds no thread either.
+
+Needs the optional asgiref package.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from app.api.events import STREAM_HANDOFF_KEY, format_event
+
+try:
+    from asgiref.sync import sync_to_async
+    from asgiref.wsgi import WsgiToAsgiInstance
+except ImportError:  # pragma: no cover - asgiref is optional
+    WsgiToAsgiInstance = None
+
+
+async def _wait_for_disconnect(receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def stream_events(subscription, heartbeat: float, send, receive) -> None:
+    """Send SSE messages from a subscription until the client disconnects."""
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        with subscription:
+            while True:
+                waiter = asyncio.ensure_future(subscription.wait(heartbeat))
+                await asyncio.wait({waiter, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnected.done():
+                    waiter.cancel()
+                    return
+                payload = waiter.result()
+                message = ": heartbeat\n\n" if payload is None else format_event(payload)
+                await send({"type": "http.response.body", "body": message.encode("utf-8"), "more_body": True})
+    finally:
+        disconnected.cancel()
+
+
+if WsgiToAsgiInstance is not None:
+    class _Request(WsgiToAsgiInstance):
+        """One request through the WSGI app, on our pool, with the event stream handoff."""
+
+        # asgiref runs the app thread-sensitively, i.e. one request at a time per process
+        _run_wsgi_app = WsgiToAsgiInstance.__dict__["run_wsgi_app"].func
+
+        def __init__(self, wsgi_application, executor: ThreadPoolExecutor):
+            super().__init__(wsgi_application)
+            self.executor = executor
+            self.event_stream = None
+
+        def build_environ(self, scope, body):
+            environ = super().build_environ(scope, body)
+            environ[STREAM_HANDOFF_KEY] = self._hand_off
+            return environ
+
+        def _hand_off(self, subscription, heartbeat: float) -> None:
+            self.event_stream = (subscription, heartbeat)
+
+        async def run_wsgi_app(self, body):
+            run = sync_to_async(self._run_wsgi_app, thread_sensitive=False, executor=self.executor)
+            await run(body)
+
+
+class ASGIApp:
+    """ASGI callable serving a Flask app."""
+
+    def __init__(self, flask_app):
+        if WsgiToAsgiInstance is None:
+            raise RuntimeError("The ASGI mode needs the 'asgiref' package")
+        self.flask_app = flask_app
+        self.executor = ThreadPoolExecutor(
+            max_workers=flask_app.config.get("ASGI_THREADS", 32), thread_name_prefix="asgi-request"
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        request = _Request(self.flask_app, self.executor)
+        status = None
+
+        async def send_unless_handed_off(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            # The WSGI response ends with an empty final body; a handed-off stream continues instead
+            final = message["type"] == "http.response.body" and not message.get("more_body")
+            if final and request.event_stream is not None and status == 200:
+                return
+            await send(message)
+
+        try:
+            await request(scope, receive, send_unless_handed_off)
+        finally:
+            if request.event_stream is not None and status != 200:
+                request.event_stream[0].close()
+        if request.event_stream is not None and status == 200:
+            await stream_events(*request.event_stream, send, receive)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(flask_app) -> ASGIApp:
+    """Wrap a Flask app for an ASGI server."""
+    return ASGIApp(flask_app)
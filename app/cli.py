@@ -0,0 +1,105 @@
+"""
+CLI Commands
+
+Custom `flask` commands for operators.
+"""
+import gzip
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import select
+
+from app.core.extensions import db
+from app.core.openapi import write_spec
+from app.core.startup import measure_startup
+from app.models.user import Users
+from app.services.import_service import ImportService, FORMATS
+
+
+class LazyMigrateGroup(click.Group):
+    """
+    `flask db`: Flask-Migrate's commands, loaded when first invoked.
+
+    Flask-Migrate pulls in alembic, mako and pygments, the slowest imports
+    of the app, and nothing outside these commands (and migrations/env.py,
+    which they run) uses it.
+    """
+
+    def _commands(self) -> click.Group:
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_group
+
+        if "migrate" not in current_app.extensions:
+            Migrate(current_app._get_current_object(), db)
+        return db_group
+
+    def list_commands(self, ctx):
+        return self._commands().list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._commands().get_command(ctx, name)
+
+
+migrate_command = LazyMigrateGroup("db", help="Perform database migrations.")
+
+
+@click.command("import-data")
+@click.argument("email")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "import_format", type=click.Choice(FORMATS),
+              help="Defaults to csv for .csv/.csv.gz files, ndjson otherwise.")
+@with_appcontext
+def import_data_command(email, path, import_format):
+    """Import projects and tasks from an export file into EMAIL's account."""
+    user = db.session.execute(select(Users).where(Users.email == email)).scalars().first()
+    if user is None:
+        raise click.ClickException(f"No user with email {email}")
+
+    if import_format is None:
+        import_format = "csv" if path.endswith((".csv", ".csv.gz")) else "ndjson"
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="") as stream:
+        success, message, summary = ImportService.import_rows(
+            user.id,
+            ImportService.parse(stream, import_format),
+            chunk_size=current_app.config.get("IMPORT_CHUNK_SIZE", 1000),
+            max_errors=current_app.config.get("IMPORT_MAX_ERRORS", 100),
+        )
+
+    click.echo(f"{summary['projects_imported']} projects and {summary['tasks_imported']} tasks imported")
+    for error in summary["errors"]:
+        click.echo(f"line {error['line']}: {error['error']}", err=True)
+    if summary["error_count"] > len(summary["errors"]):
+        click.echo(f"... {summary['error_count'] - len(summary['errors'])} more errors", err=True)
+    if not success:
+        raise click.ClickException(message)
+
+
+@click.command("openapi-spec")
+@click.option("--output", type=click.Path(dir_okay=False),
+              help="Defaults to OPENAPI_SPEC_FILE, which the app serves at /apispec.json.")
+@with_appcontext
+def openapi_spec_command(output):
+    """Build the OpenAPI spec from the view docstrings into a JSON file."""
+    path = output or current_app.config["OPENAPI_SPEC_FILE"]
+    size = write_spec(current_app._get_current_object(), path)
+    click.echo(f"Wrote {path} ({size:,} bytes)")
+
+
+@click.command("startup-profile")
+@click.option("--top", default=15, show_default=True, help="Number of module groups to list.")
+@click.option("--budget", type=float, help="Fail above this many seconds. Defaults to STARTUP_BUDGET_SECONDS.")
+@with_appcontext
+def startup_profile_command(top, budget):
+    """Report the cold start time of create_app(), imports broken down by module."""
+    timings = measure_startup()
+    click.echo(f"import {timings['import'] * 1000:.0f} ms + create_app() {timings['init'] * 1000:.0f} ms "
+               f"= {timings['total'] * 1000:.0f} ms")
+    click.echo("Import time by module (self time, -X importtime):")
+    for name, seconds in sorted(timings["modules"].items(), key=lambda item: -item[1])[:top]:
+        click.echo(f"{seconds * 1000:8.1f} ms  {name}")
+
+    budget = budget if budget is not None else current_app.config.get("STARTUP_BUDGET_SECONDS")
+    if budget and timings["total"] > budget:
+        raise click.ClickException(f"Cold start took {timings['total']:.2f}s, over the {budget:.2f}s budget")
@@ -0,0 +1,62 @@
+"""
+Conditional Request Utilities
+
+ETag / If-None-Match support for read endpoints.
+"""
+import hashlib
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from flask import make_response, request
+from flask_jwt_extended import get_jwt_identity
+
+from app.core.msgpack_codec import MIMETYPE, wants_msgpack
+
+
+def compute_etag(current_user: str, version: Any) -> str:
+    """
+    Build an ETag from the data version and everything else that shapes the payload.
+
+    The endpoint, the requesting user, the normalized query args and the
+    negotiated format are mixed in, so the same version never matches a
+    different listing.
+    """
+    args = sorted(request.args.items(multi=True))
+    parts = [request.endpoint or "", str(current_user), str(version)]
+    if wants_msgpack():
+        parts.append(MIMETYPE)
+    parts.extend(f"{key}={value}" for key, value in args)
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def conditional_get(version_func: Callable[..., Optional[Any]]):
+    """
+    Answer 304 Not Modified when the client's ETag matches the current data version.
+
+    `version_func(current_user, **view_kwargs)` must be cheap: it runs before
+    the view, so a match skips loading and serializing any rows. It returns
+    None when no ETag applies (e.g. the resource is not the caller's).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            current_user = get_jwt_identity()
+            version = version_func(current_user, **kwargs)
+            if version is None:
+                return view(*args, **kwargs)
+
+            etag = compute_etag(current_user, version)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            # Authenticated data: browsers may keep it but must revalidate
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
+    return decorator
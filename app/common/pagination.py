@@ -0,0 +1,22 @@
+"""
+Pagination Utilities
+
+Pagination over column selects for read-only list endpoints.
+"""
+from flask_sqlalchemy.pagination import SelectPagination
+from sqlalchemy import Select
+
+from app.core.extensions import db
+
+
+class RowPagination(SelectPagination):
+    """`db.paginate` that returns `Row` tuples instead of ORM instances."""
+
+    def _query_items(self) -> list:
+        select = self._query_args["select"].limit(self.per_page).offset(self._query_offset)
+        return self._query_args["session"].execute(select).all()
+
+
+def paginate_rows(select: Select, page: int, per_page: int) -> RowPagination:
+    """Paginate a column select like `db.paginate(..., error_out=False)`."""
+    return RowPagination(select=select, session=db.session(), page=page, per_page=per_page, error_out=False)
@@ -0,0 +1,101 @@
+"""
+Response Cache Utilities
+
+Serve repeated reads of the same listing from the per-user response cache.
+"""
+from functools import wraps
+from typing import Callable, List, Optional, Tuple
+
+import structlog
+from flask import current_app, make_response, request
+from flask_jwt_extended import get_jwt_identity
+
+from app.core.cache import get_cache
+from app.core import msgpack_codec
+from app.core.compression import compress, negotiate, set_encoded_body
+
+logger = structlog.get_logger()
+
+
+def normalized_args() -> str:
+    """Query args in a canonical order, so ?a=1&b=2 and ?b=2&a=1 share an entry."""
+    return "&".join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+
+
+def encoded_variant(cache, key: str, body: bytes) -> Optional[Tuple[str, bytes]]:
+    """
+    Get the compressed body the current request should receive, if any.
+
+    Variants are cached next to the plain entry, under the same
+    generation tokens, so each one is compressed once per entry.
+    """
+    encoding = negotiate(len(body))
+    if encoding is None:
+        return None
+    variant_key = f"{key}|{encoding}"
+    try:
+        encoded = cache.get(variant_key)
+        if encoded is None:
+            encoded = compress(body, encoding)
+            cache.set(variant_key, encoded, current_app.config.get("RESPONSE_CACHE_TTL", 300))
+    except Exception as e:
+        logger.error("cache_variant_failed", error=str(e), error_type=type(e).__name__)
+        return None
+    return encoding, encoded
+
+
+def cached_response(scopes_func: Callable[..., Optional[List[str]]]):
+    """
+    Cache successful JSON (or MessagePack) responses per user, route and query args.
+
+    `scopes_func(current_user, **view_kwargs)` names the cache scopes the
+    response reads; committed writes to any of them invalidate the entry.
+    Returning None skips the cache. Cache failures are logged and the view
+    runs uncached. Compressed variants are cached alongside the entry.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return view(*args, **kwargs)
+
+            current_user = get_jwt_identity()
+            scopes = scopes_func(current_user, **kwargs)
+            if scopes is None:
+                return view(*args, **kwargs)
+
+            try:
+                # Tokens are read before the view queries, see app.core.cache
+                # JSON and MessagePack bodies are separate entries
+                mimetype = msgpack_codec.MIMETYPE if msgpack_codec.wants_msgpack() else "application/json"
+                route = request.endpoint if mimetype == "application/json" else f"{request.endpoint}+msgpack"
+                key = cache.build_key(current_user, route, normalized_args(), scopes)
+                body = cache.lookup(key)
+            except Exception as e:
+                logger.error("cache_lookup_failed", error=str(e), error_type=type(e).__name__)
+                return view(*args, **kwargs)
+
+            if body is not None:
+                response = current_app.response_class(body, status=200, mimetype=mimetype)
+                response.headers["X-Cache"] = "HIT"
+                if msgpack_codec.is_available():
+                    response.vary.add("Accept")
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.mimetype != mimetype:
+                    return response
+                body = response.get_data()
+                response.headers["X-Cache"] = "MISS"
+                try:
+                    cache.set(key, body, current_app.config.get("RESPONSE_CACHE_TTL", 300))
+                except Exception as e:
+                    logger.error("cache_store_failed", error=str(e), error_type=type(e).__name__)
+                    return response
+
+            variant = encoded_variant(cache, key, body)
+            if variant is not None:
+                set_encoded_body(response, variant[1], variant[0])
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,258 @@
+"""
+Response Cache
+
+Per-user cache of encoded response bodies with write-driven invalidation.
+
+Entries are keyed by user, route, normalized query args and the current
+generation token of every scope the route reads (e.g. "projects:<user>",
+"tasks:<project>"). Committed writes replace the tokens of the scopes
+they touch, so stale entries become unreachable and age out of the LRU.
+A reader fetches the tokens before querying, so a body built from
+pre-commit data is stored under the old tokens and never served.
+
+`LocalCache` is per process; use `RedisCache` when several workers
+must see each other's invalidations.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+import structlog
+from flask import current_app
+
+from app.core.events import changes_committed
+
+logger = structlog.get_logger()
+
+
+def _new_token() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def scopes_for_change(user_id: str, payload: dict) -> List[str]:
+    """Map a committed change event to the cache scopes it invalidates."""
+    kind, _, change = payload["type"].partition(".")
+    if kind == "project":
+        scopes = [f"projects:{user_id}"]
+        if change == "deleted":
+            scopes.append(f"tasks:{payload['id']}")
+        return scopes
+    if kind == "task":
+        return [f"projects:{user_id}", f"tasks:{payload['project_id']}"]
+    if kind == "user":
+        return [f"user:{user_id}", f"projects:{user_id}"]
+    if kind == "import":
+        return [f"projects:{user_id}"] + [f"tasks:{project_id}" for project_id in payload["project_ids"]]
+    return []
+
+
+class ResponseCache:
+    """Base class holding hit/miss metrics and key construction."""
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def build_key(self, user_id, route: str, args: str, scopes: Iterable[str]) -> str:
+        """Build an entry key from the request identity and the scopes' current tokens."""
+        scopes = list(scopes)
+        tokens = self.generations(scopes)
+        return f"resp:{user_id}:{route}:{args}:" + ",".join(tokens)
+
+    def lookup(self, key: str) -> Optional[bytes]:
+        """Get an entry and count the hit or miss."""
+        value = self.get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def invalidate(self, scopes: Iterable[str]) -> None:
+        """Replace the tokens of the given scopes."""
+        scopes = list(scopes)
+        if not scopes:
+            return
+        self._invalidate(scopes)
+        with self._stats_lock:
+            self.invalidations += len(scopes)
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process."""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+    # Backend interface
+    backend = "none"
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        raise NotImplementedError
+
+    def generations(self, scopes: List[str]) -> List[str]:
+        raise NotImplementedError
+
+    def _invalidate(self, scopes: List[str]) -> None:
+        raise NotImplementedError
+
+
+class LocalCache(ResponseCache):
+    """In-process LRU cache bounded by the total size of stored bodies."""
+
+    backend = "memory"
+
+    def __init__(self, max_bytes: int, max_scopes: int = 100_000):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.max_scopes = max_scopes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._scopes: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        size = len(key) + len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def generations(self, scopes: List[str]) -> List[str]:
+        with self._lock:
+            tokens = []
+            for scope in scopes:
+                token = self._scopes.get(scope)
+                if token is None:
+                    # A forgotten scope just gets a fresh token: old entries become misses
+                    token = self._scopes[scope] = _new_token()
+                    if len(self._scopes) > self.max_scopes:
+                        self._scopes.popitem(last=False)
+                else:
+                    self._scopes.move_to_end(scope)
+                tokens.append(token)
+            return tokens
+
+    def _invalidate(self, scopes: List[str]) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._scopes.pop(scope, None)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update(entries=len(self._entries), bytes=self._size, evictions=self.evictions)
+        return stats
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(key) + len(entry[0])
+
+
+class RedisCache(ResponseCache):
+    """Cache shared by all workers through Redis; Redis handles eviction (maxmemory-policy)."""
+
+    backend = "redis"
+    PREFIX = "cache:"
+    SCOPE_TTL = 86400
+
+    def __init__(self, url: str):
+        super().__init__()
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RESPONSE_CACHE_URL points to Redis but the 'redis' package is not installed") from e
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(self.PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._redis.set(self.PREFIX + key, value, ex=ttl)
+
+    def generations(self, scopes: List[str]) -> List[str]:
+        keys = [f"{self.PREFIX}scope:{scope}" for scope in scopes]
+        tokens = self._redis.mget(keys)
+        for position, token in enumerate(tokens):
+            if token is None:
+                self._redis.set(keys[position], _new_token(), ex=self.SCOPE_TTL, nx=True)
+                token = self._redis.get(keys[position])
+            tokens[position] = token.decode("utf-8") if isinstance(token, bytes) else str(token)
+        return tokens
+
+    def _invalidate(self, scopes: List[str]) -> None:
+        with self._redis.pipeline(transaction=False) as pipe:
+            for scope in scopes:
+                pipe.set(f"{self.PREFIX}scope:{scope}", _new_token(), ex=self.SCOPE_TTL)
+            pipe.execute()
+
+
+def create_cache(url: Optional[str], max_bytes: int) -> Optional[ResponseCache]:
+    """Create a cache for a URL: memory:// (default), redis://, or none:// to disable."""
+    if not url or url.startswith("memory://"):
+        return LocalCache(max_bytes)
+    if url.startswith(("redis://", "rediss://")):
+        return RedisCache(url)
+    if url.startswith("none://"):
+        return None
+    raise ValueError(f"Unsupported RESPONSE_CACHE_URL: {url}")
+
+
+def init_cache(app) -> None:
+    """Attach the configured response cache to the app."""
+    cache = create_cache(
+        app.config.get("RESPONSE_CACHE_URL", "memory://"),
+        app.config.get("RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+    )
+    app.extensions["response_cache"] = cache
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Get the response cache of the current app, if enabled."""
+    return current_app.extensions.get("response_cache")
+
+
+@changes_committed.connect
+def _invalidate_committed(app, changes) -> None:
+    cache = app.extensions.get("response_cache")
+    if cache is None:
+        return
+    scopes = set()
+    for user_id, payload in changes:
+        scopes.update(scopes_for_change(user_id, payload))
+    try:
+        cache.invalidate(sorted(scopes))
+    except Exception as e:
+        logger.error("cache_invalidation_failed", error=str(e), error_type=type(e).__name__)
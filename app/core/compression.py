@@ -0,0 +1,112 @@
+"""
+Response Compression
+
+Compresses text responses above a size threshold with the best encoding
+both sides support: brotli and zstd when their packages are installed,
+gzip always.
+
+Responses that already carry a Content-Encoding, are streamed or are sent
+straight from a file are left alone. The response cache stores the
+compressed variants it produces (see app.common.response_cache) and sets
+Content-Encoding itself, so repeated hits are not compressed again.
+"""
+import gzip
+from typing import Callable, Dict, Optional
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json", "application/x-ndjson", "application/msgpack", "application/javascript", "image/svg+xml",
+}
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    # mtime=0 keeps the output stable, so cached variants are byte-identical
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+CODECS: Dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    CODECS["br"] = lambda data, level: brotli.compress(data, quality=level)
+if zstandard is not None:
+    CODECS["zstd"] = lambda data, level: zstandard.ZstdCompressor(level=level).compress(data)
+
+DEFAULT_LEVELS = {"gzip": 6, "br": 5, "zstd": 3}
+
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    """Whether responses of this type are worth compressing."""
+    return bool(mimetype) and (mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES)
+
+
+def negotiate(size: int) -> Optional[str]:
+    """
+    Pick the encoding for a body of `size` bytes in the current request.
+
+    Follows the client's q-values, then the server order in
+    COMPRESSION_ENCODINGS. Returns None below COMPRESSION_MIN_SIZE or when
+    nothing acceptable is available.
+    """
+    if size < current_app.config.get("COMPRESSION_MIN_SIZE", 1024):
+        return None
+    accepted = request.accept_encodings
+    best, best_quality = None, 0
+    for encoding in current_app.config.get("COMPRESSION_ENCODINGS", ["br", "zstd", "gzip"]):
+        quality = accepted.quality(encoding)
+        if encoding in CODECS and quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress with the configured level of the encoding."""
+    levels = current_app.config.get("COMPRESSION_LEVELS", DEFAULT_LEVELS)
+    return CODECS[encoding](data, levels.get(encoding, DEFAULT_LEVELS[encoding]))
+
+
+def set_encoded_body(response, body: bytes, encoding: str) -> None:
+    """Replace a response body with its encoded form and describe it in the headers."""
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # A strong ETag names the exact bytes, which just changed
+        response.set_etag(etag, weak=True)
+
+
+def _compress_response(response):
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or not 200 <= response.status_code < 300
+        or response.status_code == 204
+        or not is_compressible(response.mimetype)
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate(response.content_length or 0)
+    if encoding is not None:
+        set_encoded_body(response, compress(response.get_data(), encoding), encoding)
+    return response
+
+
+def init_compression(app) -> None:
+    """Compress responses after every request unless COMPRESSION_ENCODINGS is empty."""
+    unknown = set(app.config.get("COMPRESSION_ENCODINGS", [])) - set(DEFAULT_LEVELS)
+    if unknown:
+        raise ValueError(f"Unsupported COMPRESSION_ENCODINGS: {', '.join(sorted(unknown))}")
+    if app.config.get("COMPRESSION_ENCODINGS", ["br", "zstd", "gzip"]):
+        app.after_request(_compress_response)
@@ -10,6 +10,8 @@ from typing import Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
+from app.core.pool import build_engine_options
+
 
 class Settings(BaseSettings):
     """
@@ -26,7 +28,31 @@ class Settings(BaseSettings):
     FLASK_ENV: str = Field(default="development")
     LOG_LEVEL: str = Field(default="INFO")
     LOG_FILE: str = Field(default="app.log")
+    LOG_MAX_BYTES: int = Field(default=0, ge=0)  # Rotate the log file at this size; 0 leaves it to logrotate
+    ACCESS_LOG_SAMPLE_RATE: float = Field(default=1.0, ge=0, le=1)  # Share of successful requests logged
+    SERVER_TIMING: bool = Field(default=False)  # Per-request DB time and query count headers
+    METRICS_ENABLED: bool = Field(default=True)  # Prometheus /metrics (needs prometheus_client)
     REDIS_URL: Optional[str] = Field(default="memory://")
+    RATELIMIT_ENABLED: bool = Field(default=True)  # Only turn off for load tests
+    EVENTS_BROKER_URL: str = Field(default="memory://")  # redis://... to share across workers
+    EVENTS_HEARTBEAT_SECONDS: float = Field(default=15, gt=0)
+    RESPONSE_CACHE_URL: str = Field(default="memory://")  # redis://... to share, none:// to disable
+    DATABASE_REPLICA_URLS: str = Field(default="")  # Comma-separated read-only replica URLs
+    DATABASE_REPLICA_PIN_URL: str = Field(default="memory://")  # redis://... to share pins across workers
+    
+    # Connection pool (PostgreSQL only)
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DB_POOL_TIMEOUT: float = Field(default=30, gt=0)  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = Field(default=1800)  # Seconds; -1 disables
+    DB_POOL_PRE_PING: bool = Field(default=True)
+    DB_PGBOUNCER: bool = Field(default=False)  # Behind PgBouncer transaction pooling: no app-side pool
+    DB_QUERY_CACHE_SIZE: int = Field(default=500, ge=0)  # Compiled statements kept per engine; 0 disables
+    JSON_PROVIDER: str = Field(default="auto")  # auto (orjson if installed), orjson or json
+    COMPRESSION_ENCODINGS: str = Field(default="br,zstd,gzip")  # Server preference; empty disables
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0)  # Bytes; smaller bodies are sent as is
+    OPENAPI_SPEC_FILE: str = Field(default="openapi.json")  # Written by `flask openapi-spec`; served if present
+    SWAGGER_UI: bool = Field(default=True)  # /apidocs/; off skips importing flasgger with a built spec
     
     @field_validator('SECRET_KEY', 'JWT_SECRET_KEY')
     @classmethod
@@ -50,6 +76,15 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URL must be a valid PostgreSQL or SQLite URL")
         return v
     
+    @field_validator('DATABASE_REPLICA_URLS')
+    @classmethod
+    def validate_replica_urls(cls, v: str) -> str:
+        """Validate each replica URL like DATABASE_URL."""
+        for url in filter(None, (url.strip() for url in v.split(","))):
+            if not url.startswith(('postgresql://', 'postgres://', 'sqlite://')):
+                raise ValueError("DATABASE_REPLICA_URLS must be PostgreSQL or SQLite URLs")
+        return v
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -72,6 +107,22 @@ class FlaskConfig:
     # Database configuration
     SQLALCHEMY_DATABASE_URI = settings.DATABASE_URL
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pgbouncer=settings.DB_PGBOUNCER,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    )
+    
+    # Read replicas: authenticated GETs read from these, falling back to the primary
+    DATABASE_REPLICA_URLS = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    DATABASE_REPLICA_PIN_URL = settings.DATABASE_REPLICA_PIN_URL
+    DATABASE_REPLICA_PIN_SECONDS = 5  # Read-your-writes window after a user's commit
+    DATABASE_REPLICA_RETRY_SECONDS = 30  # How long a failed replica stays out of rotation
     
     # JWT Configuration
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
@@ -81,6 +132,7 @@ class FlaskConfig:
     JWT_COOKIE_SECURE = True  # Only send JWT cookies over HTTPS
     
     # Rate Limiting
+    RATELIMIT_ENABLED = settings.RATELIMIT_ENABLED
     RATELIMIT_STORAGE_URL = settings.REDIS_URL
     RATELIMIT_DEFAULT = "200 per day, 50 per hour"
     RATELIMIT_HEADERS_ENABLED = True
@@ -93,8 +145,55 @@ class FlaskConfig:
     # Logging
     LOG_LEVEL = settings.LOG_LEVEL
     LOG_FILE = settings.LOG_FILE
+    LOG_MAX_BYTES = settings.LOG_MAX_BYTES
+    LOG_BACKUP_COUNT = 5  # Rotated files kept
+    LOG_QUEUE_SIZE = 10000  # Records waiting for the log writer before new ones are dropped
+    ACCESS_LOG_SAMPLE_RATE = settings.ACCESS_LOG_SAMPLE_RATE  # Errors and slow requests are always logged
+    ACCESS_LOG_SLOW_MS = 1000  # Requests at least this slow are always logged
+    SERVER_TIMING = settings.SERVER_TIMING  # Server-Timing headers and DB time in the access log
+    
+    # Prometheus metrics at /metrics, summed over workers (PROMETHEUS_MULTIPROC_DIR, see gunicorn.conf.py)
+    METRICS_ENABLED = settings.METRICS_ENABLED
+    METRICS_PUBLISH_SECONDS = 5  # How often a worker copies its pool and cache counters into the metrics
+    
+    # Typeahead search: per-user in-memory prefix index
+    SEARCH_INDEX_MAX_USERS = 1000  # LRU-evicted beyond this many users
+    SEARCH_INDEX_MAX_ENTRIES = 5000  # Keys per user before falling back to the DB
+    SEARCH_INDEX_TTL = 300  # Seconds before an index is rebuilt from the DB
+    
+    # Delta sync: changes returned per /api/sync page
+    SYNC_MAX_CHANGES = 1000
+    
+    # Live change events (SSE)
+    EVENTS_BROKER_URL = settings.EVENTS_BROKER_URL
+    EVENTS_HEARTBEAT_SECONDS = settings.EVENTS_HEARTBEAT_SECONDS
+    EVENTS_QUEUE_SIZE = 100  # Per connection; overflow collapses into a resync event
+    
+    # Per-user response cache for list endpoints
+    RESPONSE_CACHE_URL = settings.RESPONSE_CACHE_URL
+    RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # In-process backend only
+    RESPONSE_CACHE_TTL = 300  # Seconds; writes invalidate entries sooner
+    
+    # Bulk import
+    IMPORT_CHUNK_SIZE = 1000  # Rows per insert batch and transaction
+    IMPORT_MAX_ERRORS = 100  # Row errors listed in the response; the rest are only counted
+    
+    # Cold start of import + create_app() (`flask startup-profile`, tests/test_startup.py)
+    STARTUP_BUDGET_SECONDS = 3.0
+    
+    # ASGI mode (asgi.py): threads running requests per process
+    ASGI_THREADS = 32
+    
+    # Response encoding
+    JSON_PROVIDER = settings.JSON_PROVIDER
+    COMPRESSION_ENCODINGS = [e.strip() for e in settings.COMPRESSION_ENCODINGS.split(",") if e.strip()]
+    COMPRESSION_MIN_SIZE = settings.COMPRESSION_MIN_SIZE
+    COMPRESSION_LEVELS = {"gzip": 6, "br": 5, "zstd": 3}  # brotli and zstd apply when installed
     
     # Swagger/OpenAPI Configuration
+    OPENAPI_SPEC_FILE = settings.OPENAPI_SPEC_FILE
+    OPENAPI_SPEC_MAX_AGE = 86400  # Seconds clients may reuse the built spec; it changes with deployments
+    SWAGGER_UI = settings.SWAGGER_UI
     SWAGGER_TEMPLATE = {
         "openapi": "3.0.0",
         "info": {
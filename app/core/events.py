@@ -0,0 +1,241 @@
+"""
+Change Events
+
+Per-user pub/sub for live change notifications.
+
+Services stage events on the DB session; they are published only after
+the transaction commits. The broker fans them out to subscribers such as
+the SSE stream. `LocalBroker` works within one process; `RedisBroker`
+relays through Redis so every worker process sees every event.
+"""
+import asyncio
+import json
+import queue
+import threading
+from typing import Callable, Dict, Optional, Set
+
+import structlog
+from blinker import Namespace
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.extensions import db
+
+logger = structlog.get_logger()
+
+_PENDING_KEY = "pending_change_events"
+
+# Sent with the app as sender and `changes=[(user_id, payload), ...]` after each commit
+changes_committed = Namespace().signal("changes-committed")
+
+# Sent to a subscriber whose queue overflowed; the client should call /api/sync
+RESYNC_EVENT = {"type": "resync"}
+
+
+class Subscription:
+    """A single listener's bounded event queue."""
+
+    def __init__(self, broker: "LocalBroker", user_id: str, max_size: int):
+        self.broker = broker
+        self.user_id = user_id
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=max_size)
+        self._overflowed = False
+        self._waker: Optional[Callable[[], None]] = None
+
+    def put(self, payload: dict) -> None:
+        """Enqueue without blocking; a full queue collapses into a single resync."""
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self._overflowed = True
+        waker = self._waker
+        if waker is not None:
+            try:
+                waker()
+            except RuntimeError:  # The waiting event loop has closed
+                pass
+
+    def get(self, timeout: float) -> Optional[dict]:
+        """Block until an event arrives, or return None after `timeout` seconds."""
+        if self._overflowed:
+            self._overflowed = False
+            self._drain()
+            return RESYNC_EVENT
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    async def wait(self, timeout: float) -> Optional[dict]:
+        """Like `get`, but waits on the event loop instead of blocking a thread."""
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        # Install the waker before looking, so an event put in between still wakes us
+        self._waker = lambda: loop.call_soon_threadsafe(ready.set)
+        try:
+            payload = self.get(timeout=0)
+            if payload is not None:
+                return payload
+            try:
+                await asyncio.wait_for(ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+            return self.get(timeout=0)
+        finally:
+            self._waker = None
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.broker.unsubscribe(self)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LocalBroker:
+    """In-process broker: events reach subscribers in the same process only."""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+    def subscribe(self, user_id) -> Subscription:
+        """Register a new subscription for a user's events."""
+        subscription = Subscription(self, str(user_id), self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(subscription.user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def publish(self, user_id, payload: dict) -> None:
+        """Deliver an event to the user's subscribers."""
+        self._dispatch(str(user_id), payload)
+
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions in this process."""
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _dispatch(self, user_id: str, payload: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscription in subscribers:
+            subscription.put(payload)
+
+
+class RedisBroker(LocalBroker):
+    """
+    Broker that relays events through Redis pub/sub.
+
+    Each process keeps one pattern subscription, started on first use,
+    and fans incoming messages out to its local subscribers.
+    """
+
+    CHANNEL_PREFIX = "events:"
+
+    def __init__(self, url: str, queue_size: int = 100):
+        super().__init__(queue_size)
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("EVENTS_BROKER_URL points to Redis but the 'redis' package is not installed") from e
+        self._redis = redis.Redis.from_url(url)
+        self._listener: Optional[threading.Thread] = None
+
+    def subscribe(self, user_id) -> Subscription:
+        self._ensure_listener()
+        return super().subscribe(user_id)
+
+    def publish(self, user_id, payload: dict) -> None:
+        self._redis.publish(f"{self.CHANNEL_PREFIX}{user_id}", json.dumps(payload))
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(target=self._listen, name="events-redis-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(f"{self.CHANNEL_PREFIX}*")
+        try:
+            for message in pubsub.listen():
+                channel = message["channel"].decode("utf-8")
+                user_id = channel[len(self.CHANNEL_PREFIX):]
+                self._dispatch(user_id, json.loads(message["data"]))
+        except Exception as e:
+            # Subscribers reconnect through the next subscribe() call
+            logger.error("events_listener_failed", error=str(e), error_type=type(e).__name__)
+
+
+def create_broker(url: Optional[str], queue_size: int = 100) -> LocalBroker:
+    """Create a broker for a URL: memory:// (default) or redis://."""
+    if not url or url.startswith("memory://"):
+        return LocalBroker(queue_size)
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBroker(url, queue_size)
+    raise ValueError(f"Unsupported EVENTS_BROKER_URL: {url}")
+
+
+def init_events(app) -> None:
+    """Attach the configured broker to the app."""
+    app.extensions["events"] = create_broker(
+        app.config.get("EVENTS_BROKER_URL", "memory://"),
+        app.config.get("EVENTS_QUEUE_SIZE", 100),
+    )
+
+
+def get_broker() -> LocalBroker:
+    """Get the broker of the current app."""
+    return current_app.extensions["events"]
+
+
+def publish_after_commit(user_id, event_type: str, **data) -> None:
+    """Stage an event on the current DB session; it is published only if the transaction commits."""
+    payload = {"type": event_type, **data}
+    db.session.info.setdefault(_PENDING_KEY, []).append((str(user_id), payload))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or not has_app_context():
+        return
+    app = current_app._get_current_object()
+    changes_committed.send(app, changes=pending)
+    broker = app.extensions.get("events")
+    if broker is None:
+        return
+    for user_id, payload in pending:
+        try:
+            broker.publish(user_id, payload)
+        except Exception as e:
+            # Notifications are best effort; the write itself already committed
+            logger.error("event_publish_failed", error=str(e), error_type=type(e).__name__)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -4,17 +4,16 @@ Flask Extensions
 Centralized initialization of Flask extensions.
 """
 from flask_jwt_extended import JWTManager
-from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_talisman import Talisman
 
-# Initializing Flask-SQLAlchemy for database management.
-db = SQLAlchemy()
+from app.core.session import RoutingSession
 
-# Initializing Flask-Migrate for handling database migrations.
-migrate = Migrate()
+# Initializing Flask-SQLAlchemy for database management.
+# The routing session sends eligible reads to replicas (see app.core.replicas).
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 # Initializing Flask-JWT-Extended for implementing
 # JSON Web Token (JWT) based authentication.
@@ -31,7 +30,8 @@ limiter = Limiter(
 # Note: CSP and HTTPS forcing disabled for development
 talisman = Talisman()
 
+# Note: Flask-Migrate is only loaded by the `flask db` commands (see app.cli).
+
 # Note: Swagger (flasgger) is initialized directly in the app factory
 # with the template configuration, not as a shared extension.
 
-
@@ -0,0 +1,97 @@
+"""
+Cooperative (gevent) Mode
+
+Serving the app from gevent greenlets lets one process hold thousands of
+connections: a greenlet waiting on a socket yields to the others. That
+only works while nothing blocks the hub:
+
+- The standard library must be monkey-patched before anything imports
+  it (green.py does this first thing); `patch()` also installs a
+  psycopg2 wait callback so PostgreSQL queries yield too.
+- `check_patched()` refuses to start with a module still unpatched, e.g.
+  one imported before `patch()`.
+- `offload()` runs CPU-bound work such as PBKDF2 password hashing on a
+  real OS thread from gevent's pool, so a login doesn't stall every other
+  connection of the worker.
+
+Needs the optional gevent package.
+"""
+try:
+    import gevent
+    from gevent import monkey
+except ImportError:  # pragma: no cover - gevent is optional
+    gevent = None
+
+# Modules the app blocks on: sockets (HTTP, DB, Redis), locks and queues (caches, events), sleeps
+REQUIRED_PATCHES = ("socket", "ssl", "select", "threading", "time")
+
+
+def is_active() -> bool:
+    """Whether this process runs under gevent's monkey patches."""
+    return gevent is not None and monkey.is_module_patched("socket")
+
+
+def patch() -> None:
+    """Monkey-patch the standard library and psycopg2 for gevent."""
+    if gevent is None:
+        raise RuntimeError("The gevent mode needs the 'gevent' package")
+    if not is_active():
+        monkey.patch_all()
+    patch_psycopg()
+
+
+def patch_psycopg() -> None:
+    """Make psycopg2 wait for the server through gevent instead of blocking."""
+    try:
+        from psycopg2 import extensions
+    except ImportError:
+        return
+    extensions.set_wait_callback(_wait_callback)
+
+
+def _wait_callback(conn, timeout=None) -> None:
+    from gevent.socket import wait_read, wait_write
+    from psycopg2 import OperationalError, extensions
+
+    while True:
+        state = conn.poll()
+        if state == extensions.POLL_OK:
+            return
+        if state == extensions.POLL_READ:
+            wait_read(conn.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(conn.fileno(), timeout=timeout)
+        else:
+            raise OperationalError(f"Bad result from poll: {state!r}")
+
+
+def check_patched() -> None:
+    """Raise RuntimeError unless every module the app blocks on is patched."""
+    missing = [name for name in REQUIRED_PATCHES if gevent is None or not monkey.is_module_patched(name)]
+    try:
+        from psycopg2 import extensions
+    except ImportError:
+        extensions = None
+    if extensions is not None and extensions.get_wait_callback() is not _wait_callback:
+        missing.append("psycopg2")
+    if missing:
+        raise RuntimeError(
+            f"gevent mode: not patched: {', '.join(missing)}. "
+            "Call app.core.green.patch() before importing the app (see green.py)"
+        )
+
+
+def offload(func, *args, **kwargs):
+    """Run CPU-bound work on a real thread under gevent; call it directly otherwise."""
+    if not is_active():
+        return func(*args, **kwargs)
+    return gevent.get_hub().threadpool.apply(func, args, kwargs)
+
+
+def init_green(app) -> None:
+    """Check the patches at startup when the process runs under gevent (e.g. gunicorn -k gevent)."""
+    if is_active():
+        # Worker classes patch the stdlib but know nothing of psycopg2
+        patch_psycopg()
+        check_patched()
+        app.extensions["green"] = True
@@ -0,0 +1,107 @@
+"""
+JSON Provider
+
+Flask JSON providers that also answer in MessagePack when the client asks
+for it (see app.core.msgpack_codec), so every `jsonify` response, and the
+envelope of `generate_response`, can be negotiated.
+
+`OrjsonProvider` encodes with orjson; `JSONProvider` with the stdlib
+encoder. Output matches Flask's default provider: sorted keys, dates as
+HTTP dates, Decimal and UUID as strings, compact unless pretty-printing is
+on. The one difference with orjson is that non-ASCII characters are
+written as UTF-8 instead of \\u escapes, which decodes to the same document.
+"""
+from datetime import date, datetime, timezone
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.core import msgpack_codec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+PROVIDERS = ("auto", "orjson", "json")
+
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _http_date(value: date) -> str:
+    """Format like werkzeug's `http_date`, without its timetuple round trip."""
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    elif value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return (
+        f"{_DAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} {value.year:04d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d} GMT"
+    )
+
+
+def _default(o):
+    if isinstance(o, date):
+        return _http_date(o)
+    return DefaultJSONProvider.default(o)
+
+
+class JSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider with MessagePack negotiation."""
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if msgpack_codec.wants_msgpack():
+            response = self._app.response_class(msgpack_codec.packb(obj), mimetype=msgpack_codec.MIMETYPE)
+        else:
+            response = self._json_response(obj)
+        if msgpack_codec.is_available():
+            response.vary.add("Accept")
+        return response
+
+    def _json_response(self, obj):
+        return super().response(obj)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider encoding with orjson."""
+
+    default = staticmethod(_default)
+
+    # Dates go through `default` so they are formatted like the stdlib provider
+    options = 0 if orjson is None else (
+        orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Anything beyond pretty-printing needs the stdlib encoder
+        if set(kwargs) - {"indent"} or kwargs.get("indent") not in (None, 2):
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj, kwargs.get("indent") is not None).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def _json_response(self, obj):
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self._encode(obj, pretty) + b"\n", mimetype=self.mimetype)
+
+    def _encode(self, obj, pretty: bool) -> bytes:
+        option = self.options | orjson.OPT_INDENT_2 if pretty else self.options
+        return orjson.dumps(obj, default=self.default, option=option)
+
+
+def init_json(app) -> None:
+    """Install the JSON provider selected by JSON_PROVIDER (auto, orjson or json) and msgpack bodies."""
+    choice = app.config.get("JSON_PROVIDER", "auto")
+    if choice not in PROVIDERS:
+        raise ValueError(f"JSON_PROVIDER must be one of: {', '.join(PROVIDERS)}")
+    if choice == "orjson" and orjson is None:
+        raise RuntimeError("JSON_PROVIDER=orjson requires the orjson package")
+    if choice != "json" and orjson is not None:
+        app.json = OrjsonProvider(app)
+    else:
+        app.json = JSONProvider(app)
+    app.request_class = msgpack_codec.MsgpackRequest
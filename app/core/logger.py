@@ -1,58 +1,263 @@
 """
 Structured Logging Configuration
 
-JSON-formatted logs for production observability.
-Logs to both console and file.
+JSON-formatted logs for production observability, to the console and a
+file. structlog and standard library records (werkzeug, SQLAlchemy, ...)
+take the same path, so each line is written once per destination:
+
+- The request thread only puts the record on a bounded in-memory queue.
+  When the queue is full the record is dropped and counted instead of
+  waiting for the disk.
+- A listener thread drains the queue in batches, renders the JSON and
+  writes each batch with one write per destination. The file can rotate
+  by size (LOG_MAX_BYTES).
 """
-import sys
+import atexit
 import logging
-import structlog
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
+from typing import List, Optional
+
+import structlog
+from flask import request
+from flask_jwt_extended import get_jwt_identity
+
+_SHARED_PROCESSORS = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+]
+
+# Records written per batch at most; a full batch is still one write per destination
+BATCH_SIZE = 500
+
+
+class BatchWriteMixin:
+    """Collect formatted lines in emit() and write them all in flush()."""
+
+    def _init_batch(self) -> None:
+        self._pending: List[str] = []
+
+    def emit(self, record) -> None:
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._pending or self.stream is None:
+                return
+            try:
+                self.stream.write("".join(self._pending))
+                self.stream.flush()
+            except Exception:
+                self.handleError(None)
+            finally:
+                self._pending.clear()
+
+    def discard_pending(self) -> None:
+        self._pending.clear()
+
+
+class BatchStreamHandler(BatchWriteMixin, logging.StreamHandler):
+    """Console handler writing one batch at a time."""
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._init_batch()
+
+
+class BatchFileHandler(BatchWriteMixin, RotatingFileHandler):
+    """Log file handler writing one batch at a time, rotating by size when max_bytes > 0."""
+
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 0):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._init_batch()
+
+    def flush(self) -> None:
+        if self.maxBytes > 0 and self._pending:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() + sum(len(line) for line in self._pending) >= self.maxBytes:
+                self.doRollover()
+        super().flush()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Put records on a bounded queue; never block the caller, count what doesn't fit."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Rendering happens on the listener thread; only freeze a foreign record's message here
+        if not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """The queue, its handler on the root logger and the listener thread draining it."""
+
+    def __init__(self, handlers: list, queue_size: int):
+        self.handlers = handlers
+        self.queue_size = queue_size
+        self.queue_handler = DroppingQueueHandler(queue.Queue(queue_size))
+        self._reported_drops = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._drain, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write everything queued so far and stop the listener."""
+        if self._thread is None:
+            return
+        self.queue_handler.queue.put(None)
+        self._thread.join(timeout=5)
+        self._thread = None
+        for handler in self.handlers:
+            handler.close()
+
+    def after_fork_in_child(self) -> None:
+        """Give a forked worker its own queue and listener; the parent's thread did not survive the fork."""
+        for handler in self.handlers:
+            handler.discard_pending()
+        self.queue_handler.queue = queue.Queue(self.queue_size)
+        self.queue_handler.dropped = self._reported_drops = 0
+        if self._thread is not None:
+            self.start()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue_handler.queue.qsize(),
+            "queue_size": self.queue_size,
+            "dropped": self.queue_handler.dropped,
+        }
+
+    def _drain(self) -> None:
+        log_queue = self.queue_handler.queue
+        stopping = False
+        while not stopping:
+            batch = [log_queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                stopping = True
+            self._report_drops(batch)
+            for record in batch:
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+
+    def _report_drops(self, batch: list) -> None:
+        dropped = self.queue_handler.dropped
+        if dropped > self._reported_drops:
+            batch.append(logging.makeLogRecord({
+                "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                "msg": {"event": "log_records_dropped", "count": dropped - self._reported_drops,
+                        "total": dropped},
+            }))
+            self._reported_drops = dropped
+
+
+_pipeline: Optional[LogPipeline] = None
+
+
+def _stop_pipeline() -> None:
+    if _pipeline is not None:
+        _pipeline.stop()
+
+
+def _reset_after_fork() -> None:
+    if _pipeline is not None:
+        _pipeline.after_fork_in_child()
+
 
+atexit.register(_stop_pipeline)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
-def setup_logging(log_level: str = "INFO", log_file: str = "app.log"):
+
+def setup_logging(log_level: str = "INFO", log_file: str = "app.log", queue_size: int = 10000,
+                  max_bytes: int = 0, backup_count: int = 5):
     """
-    Configure structured logging with console and file handlers.
-    
+    Configure structured logging through the queue to the console and a file.
+
+    Calling it again (another create_app()) replaces the previous pipeline.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file
+        queue_size: Records held in memory before new ones are dropped
+        max_bytes: Rotate the file at this size; 0 never rotates
+        backup_count: Rotated files kept
     """
+    global _pipeline
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
     # Ensure log directory exists
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
+
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=[*_SHARED_PROCESSORS, structlog.stdlib.ExtraAdder()],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer(),
+        ],
     )
-    
-    # Add file handler
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
-    logging.getLogger().addHandler(file_handler)
-    
-    # Configure structlog
+    handlers = [BatchStreamHandler(sys.stdout), BatchFileHandler(log_file, max_bytes, backup_count)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    if _pipeline is not None:
+        root.removeHandler(_pipeline.queue_handler)
+        _pipeline.stop()
+    _pipeline = LogPipeline(handlers, queue_size)
+    root.addHandler(_pipeline.queue_handler)
+    root.setLevel(level)
+    _pipeline.start()
+
     structlog.configure(
         processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
+            *_SHARED_PROCESSORS,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-    
+
     return structlog.get_logger()
 
 
@@ -61,46 +266,117 @@ def get_logger():
     return structlog.get_logger()
 
 
+def logging_stats() -> Optional[dict]:
+    """Queue depth and dropped records of the logging pipeline, if set up."""
+    return _pipeline.stats() if _pipeline is not None else None
+
+
+ACCESS_LOG_KEY = "app.access_log"
+
+
+def _record_access_details(response):
+    """Keep the route template and user for the access log line; the request context is gone by then."""
+    details = request.environ.get(ACCESS_LOG_KEY)
+    if details is not None:
+        if request.url_rule is not None:
+            details["path"] = request.url_rule.rule
+        try:
+            details["user_id"] = get_jwt_identity()
+        except RuntimeError:
+            pass  # No token checked on this endpoint
+    return response
+
+
+class _LoggedResponse:
+    """Response iterable that counts the bytes sent and logs the request when closed."""
+
+    def __init__(self, iterable, on_close):
+        self.iterable = iterable
+        self.on_close = on_close
+        self.bytes = 0
+
+    def __iter__(self):
+        for chunk in self.iterable:
+            self.bytes += len(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            if hasattr(self.iterable, "close"):
+                self.iterable.close()
+        finally:
+            self.on_close(self.bytes)
+
+
 class RequestLoggingMiddleware:
-    """WSGI middleware to log requests and responses."""
-    
-    def __init__(self, app):
+    """
+    WSGI middleware writing one access log line per request, once the
+    response is closed (i.e. fully sent). Hooks can add fields to the line
+    through environ[ACCESS_LOG_KEY]. Successful requests are sampled at
+    `sample_rate`; errors (status >= 400) and requests slower than
+    `slow_ms` are always logged.
+    """
+
+    def __init__(self, app, sample_rate: float = 1.0, slow_ms: float = 1000):
         self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
         self.logger = structlog.get_logger()
-    
+
     def __call__(self, environ, start_response):
-        # Log request
-        path = environ.get('PATH_INFO', '')
-        method = environ.get('REQUEST_METHOD', '')
-        
-        self.logger.info(
-            "request_started",
-            method=method,
-            path=path,
-            remote_addr=environ.get('REMOTE_ADDR', ''),
-        )
-        
-        # Capture response status
-        response_status = [None]
-        
-        def custom_start_response(status, response_headers, exc_info=None):
-            response_status[0] = status
-            return start_response(status, response_headers, exc_info)
-        
+        start = time.perf_counter()
+        details = environ[ACCESS_LOG_KEY] = {"path": environ.get('PATH_INFO', ''), "user_id": None}
+        status = [None]
+
+        def custom_start_response(status_line, response_headers, exc_info=None):
+            status[0] = int(status_line.split(" ", 1)[0])
+            return start_response(status_line, response_headers, exc_info)
+
+        def log_request(sent_bytes: int) -> None:
+            self._log(environ, details, status[0], time.perf_counter() - start, sent_bytes)
+
         try:
             response = self.app(environ, custom_start_response)
-            self.logger.info(
-                "request_completed",
-                method=method,
-                path=path,
-                status=response_status[0],
-            )
-            return response
         except Exception as e:
             self.logger.exception(
                 "request_failed",
-                method=method,
-                path=path,
+                method=environ.get('REQUEST_METHOD', ''),
+                path=details["path"],
+                duration_ms=round((time.perf_counter() - start) * 1000, 2),
                 error=str(e),
             )
             raise
+        return _LoggedResponse(response, log_request)
+
+    def _log(self, environ, details: dict, status: Optional[int], duration: float, sent_bytes: int) -> None:
+        duration_ms = round(duration * 1000, 2)
+        slow = duration_ms >= self.slow_ms
+        if status is None or status >= 500:
+            log = self.logger.error
+        elif status >= 400 or slow:
+            log = self.logger.warning
+        elif self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        else:
+            log = self.logger.info
+        log(
+            "request",
+            method=environ.get('REQUEST_METHOD', ''),
+            status=status,
+            duration_ms=duration_ms,
+            bytes=sent_bytes,
+            **details,
+            remote_addr=environ.get('REMOTE_ADDR', ''),
+            slow=slow,
+            sample_rate=self.sample_rate,
+        )
+
+
+def init_access_log(app) -> None:
+    """Write an access log line per request, sampled per the app's config."""
+    app.after_request(_record_access_details)
+    app.wsgi_app = RequestLoggingMiddleware(
+        app.wsgi_app,
+        sample_rate=app.config.get("ACCESS_LOG_SAMPLE_RATE", 1.0),
+        slow_ms=app.config.get("ACCESS_LOG_SLOW_MS", 1000),
+    )
@@ -0,0 +1,177 @@
+"""
+Prometheus Metrics
+
+Exported at /metrics in the Prometheus text format:
+
+- http_request_duration_seconds: histogram per method, route template
+  and status (unmatched paths share the "<unmatched>" route).
+- http_requests_in_flight: requests being handled right now.
+- auth_password_hashes_in_progress: PBKDF2 hashes running or waiting
+  for a thread; the auth endpoints queue up behind these.
+- db_pool_* and response_cache_*: per-process pool and cache counters,
+  published at most every METRICS_PUBLISH_SECONDS from the request path
+  (and right before a scrape).
+
+Under gunicorn every worker is its own process, so metrics live in
+prometheus_client's multiprocess mode: each process writes its values to
+memory-mapped files in PROMETHEUS_MULTIPROC_DIR (set by gunicorn.conf.py)
+and /metrics sums them over all workers. Gauges count live processes
+only. Without that variable, metrics are kept in this process.
+
+Recording takes no lock of ours: label children are cached in a plain
+dict, and prometheus_client holds its own lock only for the update.
+Needs the optional prometheus_client package; without it /metrics is a
+404 and a warning is logged at startup.
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import structlog
+from flask import abort, current_app, g, request
+
+from app.core.pool import pool_stats
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - prometheus_client is optional
+    prometheus_client = None
+
+# prometheus_client picks its storage when it's imported; follow the same switch
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+UNMATCHED_ROUTE = "<unmatched>"
+
+_START_KEY = "_metrics_start"
+
+logger = structlog.get_logger()
+
+
+class Metrics:
+    """The app's metric objects, registered once per process."""
+
+    def __init__(self):
+        gauge = dict(multiprocess_mode="livesum")
+        self.request_duration = prometheus_client.Histogram(
+            "http_request_duration_seconds", "Time to handle a request.", ["method", "route", "status"]
+        )
+        self.in_flight = prometheus_client.Gauge(
+            "http_requests_in_flight", "Requests being handled.", **gauge
+        )
+        self.hashing = prometheus_client.Gauge(
+            "auth_password_hashes_in_progress", "Password hashes running or waiting for a thread.", **gauge
+        )
+        self.pool = {
+            key: prometheus_client.Gauge(f"db_pool_{key}", description, ["engine"], **gauge)
+            for key, description in (
+                ("size", "Connections kept in the pool."),
+                ("checked_out", "Connections in use."),
+                ("overflow", "Connections open beyond the pool size."),
+                ("checkouts", "Connections handed out since the process started."),
+                ("timeouts", "Checkouts that timed out since the process started."),
+            )
+        }
+        self.cache = {
+            key: prometheus_client.Gauge(f"response_cache_{key}", description, **gauge)
+            for key, description in (
+                ("hits", "Response cache hits since the process started."),
+                ("misses", "Response cache misses since the process started."),
+                ("invalidations", "Cache scopes invalidated since the process started."),
+            )
+        }
+        self._durations = {}
+        self._published = 0.0
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, status)
+        child = self._durations.get(key)
+        if child is None:
+            child = self._durations[key] = self.request_duration.labels(method, route, str(status))
+        child.observe(seconds)
+
+    def publish_process_stats(self, app, interval: float) -> None:
+        """Copy this process's pool and cache counters into the gauges, at most once per interval."""
+        now = time.monotonic()
+        if now - self._published < interval:
+            return
+        self._published = now
+        for name, engine in app.extensions["sqlalchemy"].engines.items():
+            stats = pool_stats(engine)
+            for key, metric in self.pool.items():
+                if key in stats:
+                    metric.labels(name or "primary").set(stats[key])
+        cache = app.extensions.get("response_cache")
+        if cache is not None:
+            stats = cache.stats()
+            for key, metric in self.cache.items():
+                metric.set(stats[key])
+
+    def render(self) -> bytes:
+        if not MULTIPROCESS:
+            return prometheus_client.generate_latest()
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return prometheus_client.generate_latest(registry)
+
+
+_metrics: Optional[Metrics] = None
+
+
+@contextmanager
+def track_password_hashing():
+    """Count a password hash as in progress while the block runs."""
+    metrics = _metrics
+    if metrics is None:
+        yield
+        return
+    metrics.hashing.inc()
+    try:
+        yield
+    finally:
+        metrics.hashing.dec()
+
+
+def _start_request():
+    setattr(g, _START_KEY, time.perf_counter())
+    _metrics.in_flight.inc()
+
+
+def _record_request(response):
+    started = g.get(_START_KEY)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else UNMATCHED_ROUTE
+        _metrics.observe_request(request.method, route, response.status_code, time.perf_counter() - started)
+        _metrics.publish_process_stats(current_app, current_app.config.get("METRICS_PUBLISH_SECONDS", 5))
+    return response
+
+
+def _end_request(exc):
+    if g.pop(_START_KEY, None) is not None:
+        _metrics.in_flight.dec()
+
+
+def metrics_response():
+    """The /metrics response: every worker's metrics in the Prometheus text format."""
+    if _metrics is None or "metrics" not in current_app.extensions:
+        abort(404)
+    _metrics.publish_process_stats(current_app, 0)
+    return current_app.response_class(_metrics.render(), content_type=prometheus_client.CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app) -> None:
+    """Record request metrics and serve /metrics, if METRICS_ENABLED is on."""
+    global _metrics
+    if not app.config.get("METRICS_ENABLED", False):
+        return
+    if prometheus_client is None:
+        logger.warning("metrics_unavailable", reason="prometheus_client is not installed")
+        return
+    if _metrics is None:
+        if MULTIPROCESS:
+            os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+        _metrics = Metrics()
+    app.extensions["metrics"] = _metrics
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.teardown_request(_end_request)
@@ -0,0 +1,89 @@
+"""
+MessagePack Codec
+
+MessagePack as an alternative to JSON for API clients that ask for it
+with `Accept: application/msgpack`, or send `Content-Type:
+application/msgpack` bodies. Needs the optional msgpack package; without
+it every request and response stays JSON.
+
+Datetimes are sent as the msgpack Timestamp extension (naive values are
+UTC, as in the JSON HTTP dates), dates as extension type 1 holding the
+ISO date. Decimal, UUID and dataclasses are encoded as in JSON. In request
+bodies, dates are decoded back to ISO strings, the form the request
+schemas validate.
+"""
+import dataclasses
+import decimal
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any
+
+from flask import Request, has_request_context, request
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+MIMETYPE = "application/msgpack"
+MIMETYPES = (MIMETYPE, "application/x-msgpack")
+DATE_EXT_TYPE = 1
+
+_NEGOTIABLE = ["application/json", *MIMETYPES]
+
+
+def _default(o: Any):
+    if isinstance(o, datetime):
+        if o.tzinfo is None:
+            o = o.replace(tzinfo=timezone.utc)
+        return msgpack.Timestamp.from_datetime(o)
+    if isinstance(o, date):
+        return msgpack.ExtType(DATE_EXT_TYPE, o.isoformat().encode("ascii"))
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not MessagePack serializable")
+
+
+def _ext_hook(code: int, data: bytes):
+    if code == DATE_EXT_TYPE:
+        return data.decode("ascii")
+    return msgpack.ExtType(code, data)
+
+
+def packb(obj: Any) -> bytes:
+    """Encode an object as MessagePack."""
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode a MessagePack request body; timestamps become aware datetimes."""
+    return msgpack.unpackb(data, ext_hook=_ext_hook, timestamp=3, raw=False)
+
+
+def is_available() -> bool:
+    return msgpack is not None
+
+
+def wants_msgpack() -> bool:
+    """Whether the current request prefers MessagePack over JSON."""
+    if msgpack is None or not has_request_context():
+        return False
+    return request.accept_mimetypes.best_match(_NEGOTIABLE) in MIMETYPES
+
+
+class MsgpackRequest(Request):
+    """Request whose `get_json()` also decodes MessagePack bodies, so views accept both."""
+
+    def get_json(self, force: bool = False, silent: bool = False, cache: bool = True):
+        if msgpack is None or self.mimetype not in MIMETYPES:
+            return super().get_json(force=force, silent=silent, cache=cache)
+        try:
+            return unpackb(self.get_data(cache=cache))
+        except Exception as e:
+            if silent:
+                return None
+            return self.on_json_loading_failed(e)
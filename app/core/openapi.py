@@ -0,0 +1,125 @@
+"""
+OpenAPI Spec
+
+flasgger builds the spec from the YAML docstrings of the views, which is
+slow and pulls in its whole dependency tree. `flask openapi-spec` does it
+once, at image build time, into OPENAPI_SPEC_FILE. When that file exists
+(and the app is not in debug mode, where docstrings change under you):
+
+- /apispec.json serves its bytes as is, with an ETag and a long-lived
+  Cache-Control header; compressed variants are made once.
+- flasgger is only imported for the Swagger UI (SWAGGER_UI), which reads
+  the same /apispec.json.
+
+Without the file, flasgger builds the spec at runtime as before.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from flask import Response, request
+
+from app.core.compression import compress, negotiate, set_encoded_body
+
+SPEC_ENDPOINT = "apispec"
+SPEC_ROUTE = "/apispec.json"
+
+
+def swagger_config() -> dict:
+    """flasgger configuration: one spec at /apispec.json, UI at /apidocs/."""
+    return {
+        "headers": [],
+        "specs": [
+            {
+                "endpoint": SPEC_ENDPOINT,
+                "route": SPEC_ROUTE,
+                "rule_filter": lambda rule: True,
+                "model_filter": lambda tag: True,
+            }
+        ],
+        "static_url_path": "/flasgger_static",
+        "swagger_ui": True,
+        "specs_route": "/apidocs/",
+        "openapi": "3.0.0",
+    }
+
+
+def _swagger(app, register: bool = True):
+    from flasgger import Swagger
+
+    swagger = Swagger(template=app.config.get("SWAGGER_TEMPLATE", {}), config=swagger_config())
+    if register:
+        swagger.init_app(app)
+    else:
+        # Only reads the app's routes; registers no views on it
+        swagger.app = app
+    return swagger
+
+
+def build_spec(app) -> dict:
+    """Build the spec of every registered route from the view docstrings."""
+    swagger = getattr(app, "swag", None) or _swagger(app, register=False)
+    with app.test_request_context():
+        return swagger.get_apispecs(SPEC_ENDPOINT)
+
+
+def write_spec(app, path: str) -> int:
+    """Write the spec as stable, sorted JSON; returns its size in bytes."""
+    body = json.dumps(build_spec(app), sort_keys=True, indent=2).encode("utf-8") + b"\n"
+    with open(path, "wb") as spec_file:
+        spec_file.write(body)
+    return len(body)
+
+
+class PrecomputedSpec:
+    """The bytes of a built spec and their compressed variants."""
+
+    def __init__(self, body: bytes, max_age: int):
+        self.body = body
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.max_age = max_age
+        self._encoded: Dict[str, bytes] = {}
+
+    @classmethod
+    def load(cls, path: Optional[str], max_age: int) -> Optional["PrecomputedSpec"]:
+        if not path or not os.path.isfile(path):
+            return None
+        with open(path, "rb") as spec_file:
+            return cls(spec_file.read(), max_age)
+
+    def response(self) -> Response:
+        response = Response(self.body, mimetype="application/json")
+        response.set_etag(self.etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = self.max_age
+        response.make_conditional(request)
+        if response.status_code == 200:
+            response.vary.add("Accept-Encoding")
+            encoding = negotiate(len(self.body))
+            if encoding is not None:
+                if encoding not in self._encoded:
+                    self._encoded[encoding] = compress(self.body, encoding)
+                set_encoded_body(response, self._encoded[encoding], encoding)
+        return response
+
+
+def init_openapi(app) -> None:
+    """Serve the precomputed spec if there is one, else let flasgger build it."""
+    spec = None
+    if not app.debug:
+        spec = PrecomputedSpec.load(
+            app.config.get("OPENAPI_SPEC_FILE"), app.config.get("OPENAPI_SPEC_MAX_AGE", 86400)
+        )
+
+    if spec is None:
+        _swagger(app)
+        return
+
+    app.extensions["openapi_spec"] = spec
+    if app.config.get("SWAGGER_UI", True):
+        _swagger(app)
+        # Keep flasgger's route, which the UI links to, but never let it parse docstrings
+        app.view_functions[f"flasgger.{SPEC_ENDPOINT}"] = spec.response
+    else:
+        app.add_url_rule(SPEC_ROUTE, SPEC_ENDPOINT, spec.response)
@@ -0,0 +1,135 @@
+"""
+Connection Pool
+
+Engine options built from Settings, plus connection pool and statement
+cache telemetry for /health.
+"""
+import threading
+import time
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that counts checkouts, timeouts and time spent waiting for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_seconds = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._record(time.perf_counter() - start, timed_out=True)
+            raise
+        self._record(time.perf_counter() - start)
+        return connection
+
+    def _record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._stats_lock:
+            self.checkouts += 1
+            self.checkout_seconds += seconds
+            if timed_out:
+                self.timeouts += 1
+
+
+class StatementCacheStats:
+    """Compiled statement cache hits and misses of one engine."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def record(self, context) -> None:
+        dialect = context.dialect
+        with self._lock:
+            if context.cache_hit is dialect.CACHE_HIT:
+                self.hits += 1
+            elif context.cache_hit is dialect.CACHE_MISS:
+                self.misses += 1
+            else:
+                self.uncached += 1
+
+
+_statement_stats: "WeakKeyDictionary[Engine, StatementCacheStats]" = WeakKeyDictionary()
+
+
+def build_engine_options(database_url: str, pool_size: int, max_overflow: int, pool_timeout: float,
+                         pool_recycle: int, pool_pre_ping: bool, pgbouncer: bool,
+                         query_cache_size: int = 500) -> dict:
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for a database URL.
+
+    Only PostgreSQL gets pool options; SQLite keeps Flask-SQLAlchemy's
+    defaults. In PgBouncer mode the app holds no pool of its own (NullPool)
+    and lets PgBouncer multiplex server connections.
+    """
+    options = {"query_cache_size": query_cache_size}
+    if not database_url.startswith(("postgresql://", "postgres://")):
+        return options
+    if pgbouncer:
+        return {**options, "poolclass": NullPool}
+    return {
+        **options,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+    }
+
+
+def pool_stats(engine: Engine) -> Dict[str, Optional[float]]:
+    """Current state of an engine's pool."""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow())
+    if isinstance(pool, InstrumentedQueuePool):
+        with pool._stats_lock:
+            stats.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                avg_checkout_ms=round(pool.checkout_seconds / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+            )
+    cache = engine._compiled_cache
+    statements = _statement_stats.get(engine)
+    if cache is not None and statements is not None:
+        with statements._lock:
+            stats["statement_cache"] = {
+                "size": len(cache),
+                "capacity": cache.capacity,
+                "hits": statements.hits,
+                "misses": statements.misses,
+                "uncached": statements.uncached,
+            }
+    return stats
+
+
+def _watch_statement_cache(engine: Engine) -> None:
+    stats = _statement_stats[engine] = StatementCacheStats()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_cache_use(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and context.compiled is not None:
+            stats.record(context)
+
+
+def init_engine_telemetry(app) -> None:
+    """Count compiled statement cache hits on every engine of the app."""
+    with app.app_context():
+        for engine in app.extensions["sqlalchemy"].engines.values():
+            if engine not in _statement_stats:
+                _watch_statement_cache(engine)
@@ -0,0 +1,58 @@
+"""
+Worker Processes
+
+Helpers for pre-forking servers (see gunicorn.conf.py): the memory of a
+process, to report how much of a forked worker is still shared with the
+master, and resetting state a worker must not inherit from it.
+"""
+import os
+import resource
+from typing import Dict, Union
+
+_SMAPS_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared_clean",
+    "Shared_Dirty": "shared_dirty",
+    "Private_Clean": "private_clean",
+    "Private_Dirty": "private_dirty",
+}
+
+
+def memory_usage(pid: Union[int, str] = "self") -> Dict[str, int]:
+    """
+    Memory of a process in KiB: rss, pss, shared and private.
+
+    Reads /proc/<pid>/smaps_rollup (Linux 4.14+). Elsewhere only the peak
+    RSS of the current process is known, returned as rss.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as smaps:
+            lines = smaps.read().splitlines()
+    except OSError:
+        if pid not in ("self", os.getpid()):
+            raise
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"rss": peak // 1024 if os.uname().sysname == "Darwin" else peak}
+
+    usage = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        if name in _SMAPS_FIELDS:
+            usage[_SMAPS_FIELDS[name]] = int(value.split()[0])
+    usage["shared"] = usage.pop("shared_clean", 0) + usage.pop("shared_dirty", 0)
+    usage["private"] = usage.pop("private_clean", 0) + usage.pop("private_dirty", 0)
+    return usage
+
+
+def reset_after_fork(app) -> None:
+    """
+    Drop database connections inherited from the master.
+
+    Sharing a socket between processes corrupts the protocol stream, so a
+    freshly forked worker forgets the pooled connections without closing
+    them (the master still owns them) and opens its own.
+    """
+    with app.app_context():
+        for engine in app.extensions["sqlalchemy"].engines.values():
+            engine.dispose(close=False)
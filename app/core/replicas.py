@@ -0,0 +1,236 @@
+"""
+Read Replicas
+
+Routes the reads of authenticated GET requests to read-only replicas.
+
+Each URL in DATABASE_REPLICA_URLS becomes an extra SQLAlchemy bind, so
+Flask-SQLAlchemy builds its engine exactly like the primary's. A request
+is routed once its JWT identity is known; the token checks before that,
+and every write, run on the primary. Users whose changes were just
+committed are pinned to the primary for DATABASE_REPLICA_PIN_SECONDS so
+they read their own writes despite replication lag.
+
+A replica that fails to connect is skipped for DATABASE_REPLICA_RETRY_SECONDS
+and its reads fall back to the next replica or the primary.
+"""
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional
+
+import structlog
+from flask import g, has_request_context, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from app.core.events import changes_committed
+from app.core.extensions import db
+
+logger = structlog.get_logger()
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+BIND_PREFIX = "replica_"
+
+# Per-request routing decision; None means the primary
+_ROUTE_KEY = "db_read_engine"
+
+
+class Replica:
+    """A replica bind and its health."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.verified = False  # Probed successfully since it last failed
+        self.down_until = 0.0
+
+    @property
+    def engine(self) -> Engine:
+        return db.engines[self.name]
+
+    @property
+    def healthy(self) -> bool:
+        return self.verified or self.down_until <= time.monotonic()
+
+    def is_available(self, retry_seconds: float) -> bool:
+        """Whether reads may use this replica, probing it first if it is unverified."""
+        if self.verified:
+            return True
+        if self.down_until > time.monotonic():
+            return False
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            self.mark_down(retry_seconds, e)
+            return False
+        self.verified = True
+        return True
+
+    def mark_down(self, retry_seconds: float, error: BaseException) -> None:
+        """Take the replica out of rotation until the retry window passes."""
+        self.verified = False
+        self.down_until = time.monotonic() + retry_seconds
+        logger.warning("replica_unavailable", replica=self.name, error=str(error))
+
+
+class LocalPins:
+    """In-process read-your-writes pins."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pins: Dict[str, float] = {}
+
+    def pin(self, user_id: str, seconds: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._pins) > 10_000:
+                self._pins = {user: until for user, until in self._pins.items() if until > now}
+            self._pins[user_id] = now + seconds
+
+    def is_pinned(self, user_id: str) -> bool:
+        with self._lock:
+            until = self._pins.get(user_id)
+        return until is not None and until > time.monotonic()
+
+
+class RedisPins:
+    """Read-your-writes pins shared by all workers through Redis."""
+
+    PREFIX = "replica-pin:"
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("DATABASE_REPLICA_PIN_URL points to Redis but the 'redis' package is not installed") from e
+        self._redis = redis.Redis.from_url(url)
+
+    def pin(self, user_id: str, seconds: float) -> None:
+        self._redis.set(self.PREFIX + user_id, 1, px=max(1, int(seconds * 1000)))
+
+    def is_pinned(self, user_id: str) -> bool:
+        return bool(self._redis.exists(self.PREFIX + user_id))
+
+
+def create_pins(url: Optional[str]):
+    """Create a pin store for a URL: memory:// (default) or redis://."""
+    if not url or url.startswith("memory://"):
+        return LocalPins()
+    if url.startswith(("redis://", "rediss://")):
+        return RedisPins(url)
+    raise ValueError(f"Unsupported DATABASE_REPLICA_PIN_URL: {url}")
+
+
+class ReplicaRouter:
+    """Chooses the engine for the reads of the current request."""
+
+    def __init__(self, names: List[str], pins, pin_seconds: float, retry_seconds: float):
+        self.replicas = [Replica(name) for name in names]
+        self.pins = pins
+        self.pin_seconds = pin_seconds
+        self.retry_seconds = retry_seconds
+        self._next = itertools.count()
+
+    def read_engine(self) -> Optional[Engine]:
+        """The replica engine for this request's reads, or None for the primary."""
+        if not has_request_context() or request.method not in READ_METHODS:
+            return None
+        if _ROUTE_KEY in g:
+            return g.get(_ROUTE_KEY)
+        try:
+            user_id = get_jwt_identity()
+        except RuntimeError:
+            user_id = None
+        if user_id is None:
+            # Token checks run before the identity is known; keep them on the primary
+            return None
+        engine = None
+        try:
+            if not self.pins.is_pinned(str(user_id)):
+                engine = self._choose()
+        except Exception as e:
+            logger.error("replica_routing_failed", error=str(e), error_type=type(e).__name__)
+        setattr(g, _ROUTE_KEY, engine)
+        return engine
+
+    def pin(self, user_id: str) -> None:
+        """Send the user's reads to the primary for the pin window."""
+        self.pins.pin(str(user_id), self.pin_seconds)
+
+    def status(self) -> List[dict]:
+        """Health of each replica, for /health."""
+        return [{"name": replica.name, "healthy": replica.healthy} for replica in self.replicas]
+
+    def _choose(self) -> Optional[Engine]:
+        start = next(self._next)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if replica.is_available(self.retry_seconds):
+                return replica.engine
+        return None
+
+
+def _watch_replica(replica: Replica, retry_seconds: float) -> None:
+    @event.listens_for(replica.engine, "handle_error")
+    def _on_error(context):
+        # Lost or refused connections take the replica out of rotation
+        if context.is_disconnect or context.connection is None:
+            replica.mark_down(retry_seconds, context.original_exception)
+
+
+def configure_replica_binds(app) -> List[str]:
+    """
+    Add a bind per replica URL to SQLALCHEMY_BINDS.
+
+    Must run before db.init_app(app) so the engines are created with it.
+    """
+    urls = app.config.get("DATABASE_REPLICA_URLS") or []
+    if isinstance(urls, str):
+        urls = [url.strip() for url in urls.split(",") if url.strip()]
+    names = [f"{BIND_PREFIX}{index}" for index in range(len(urls))]
+    if names:
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        binds.update(zip(names, urls))
+        app.config["SQLALCHEMY_BINDS"] = binds
+    return names
+
+
+def init_replicas(app, names: List[str]) -> None:
+    """Attach the replica router to the app; does nothing without replicas."""
+    if not names:
+        return
+    router = ReplicaRouter(
+        names,
+        create_pins(app.config.get("DATABASE_REPLICA_PIN_URL", "memory://")),
+        app.config.get("DATABASE_REPLICA_PIN_SECONDS", 5),
+        app.config.get("DATABASE_REPLICA_RETRY_SECONDS", 30),
+    )
+    app.extensions["replicas"] = router
+    for name in names:
+        # Replicas get their schema through replication; keep create_all/drop_all off them
+        db.metadatas.pop(name, None)
+    with app.app_context():
+        for replica in router.replicas:
+            _watch_replica(replica, router.retry_seconds)
+
+    @app.before_request
+    def _reset_read_route():
+        g.pop(_ROUTE_KEY, None)
+
+
+def get_replica_router(app) -> Optional[ReplicaRouter]:
+    """Get the replica router of an app, if replicas are configured."""
+    return app.extensions.get("replicas")
+
+
+@changes_committed.connect
+def _pin_writers(app, changes) -> None:
+    router = get_replica_router(app)
+    if router is None:
+        return
+    for user_id in {user_id for user_id, _ in changes}:
+        try:
+            router.pin(user_id)
+        except Exception as e:
+            logger.error("replica_pin_failed", error=str(e), error_type=type(e).__name__)
@@ -7,16 +7,21 @@ from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from app.core.extensions import db, jwt
+from app.core.green import offload
+from app.core.metrics import track_password_hashing
 
 
 def hash_password(password: str) -> str:
     """Hash a password using werkzeug's secure hashing (bcrypt-like)."""
-    return generate_password_hash(password, method='pbkdf2:sha256:600000')
+    # PBKDF2 is CPU-bound for ~0.5 s; under gevent it must not hold the hub
+    with track_password_hashing():
+        return offload(generate_password_hash, password, method='pbkdf2:sha256:600000')
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify a password against its hash."""
-    return check_password_hash(password_hash, password)
+    with track_password_hashing():
+        return offload(check_password_hash, password_hash, password)
 
 
 # JWT Token Revocation Callback
@@ -49,7 +54,7 @@ def check_if_token_revoked(jwt_header, jwt_payload) -> bool:
     
     if user_id and iat:
         try:
-            user = Users.query.get(int(user_id))
+            user = db.session.get(Users, int(user_id))
             if user and user.token_valid_after:
                 # Convert iat to datetime for comparison
                 token_issued_at = datetime.fromtimestamp(iat)
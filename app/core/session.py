@@ -0,0 +1,26 @@
+"""
+Database Session
+
+Session class that lets read-only requests run their queries on a replica.
+"""
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain reads to the replica chosen for the request.
+
+    Flushes and INSERT/UPDATE/DELETE statements always use the primary.
+    Which reads may go to a replica is decided by app.core.replicas.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and not isinstance(clause, UpdateBase) and has_app_context():
+            router = current_app.extensions.get("replicas")
+            if router is not None:
+                engine = router.read_engine()
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
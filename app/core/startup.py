@@ -0,0 +1,61 @@
+"""
+Startup Profile
+
+What a cold worker pays before serving: importing the app package and
+running create_app(). Measured in a fresh interpreter with
+`-X importtime`, so nothing is already in sys.modules, and broken down by
+module. Used by `flask startup-profile` and the startup budget test.
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Optional
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+_PROBE = """
+import json, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app()
+print(json.dumps({"import": imported - start, "init": time.perf_counter() - imported}))
+"""
+
+
+def module_group(name: str) -> str:
+    """Group app modules by subpackage (app.api, app.core, ...) and others by distribution."""
+    parts = name.split(".")
+    return ".".join(parts[:2]) if parts[0] == "app" else parts[0]
+
+
+def parse_importtime(output: str) -> Dict[str, float]:
+    """Seconds spent importing each module group, from `-X importtime` output (self times)."""
+    groups: Dict[str, float] = defaultdict(float)
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        groups[module_group(name.strip())] += int(self_us) / 1_000_000
+    return dict(groups)
+
+
+def measure_startup(env: Optional[dict] = None) -> dict:
+    """
+    Cold start timings in seconds: import, init, total and modules
+    (group -> import seconds). The child process gets `env` (default: this
+    process's environment), so it builds the app the way a worker would.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=ROOT, env=env if env is not None else os.environ.copy(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"create_app() failed in a fresh interpreter:\n{result.stderr[-2000:]}")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["total"] = timings["import"] + timings["init"]
+    timings["modules"] = parse_importtime(result.stderr)
+    return timings
@@ -0,0 +1,75 @@
+"""
+Server Timing
+
+Per-request database instrumentation: cursor execute hooks count the
+queries of a request and add up their time. The totals go out in a
+Server-Timing header, which browser dev tools show next to the request:
+
+    Server-Timing: db;dur=12.41, app;dur=3.02, queries;desc="7"
+
+`app` is the time spent outside the database, from before_request to
+after_request. The same numbers are added to the access log line. Off
+unless SERVER_TIMING is set; then no hooks are installed at all.
+"""
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from app.core.logger import ACCESS_LOG_KEY
+
+_TIMING_KEY = "_server_timing"
+
+
+class RequestTiming:
+    """Queries and database seconds of one request."""
+
+    __slots__ = ("started", "queries", "db_seconds")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info[_TIMING_KEY] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        timing = g.get(_TIMING_KEY)
+        if timing is not None:
+            timing.queries += 1
+            timing.db_seconds += time.perf_counter() - conn.info[_TIMING_KEY]
+
+
+def _start_timing():
+    setattr(g, _TIMING_KEY, RequestTiming())
+
+
+def _add_server_timing(response):
+    timing = g.get(_TIMING_KEY)
+    if timing is None:
+        return response
+    db_ms = timing.db_seconds * 1000
+    app_ms = (time.perf_counter() - timing.started) * 1000 - db_ms
+    response.headers.add("Server-Timing", f'db;dur={db_ms:.2f}, app;dur={app_ms:.2f}, queries;desc="{timing.queries}"')
+    details = request.environ.get(ACCESS_LOG_KEY)
+    if details is not None:
+        details["db_ms"] = round(db_ms, 2)
+        details["queries"] = timing.queries
+    return response
+
+
+def init_server_timing(app) -> None:
+    """Instrument the app's engines and add Server-Timing headers, if SERVER_TIMING is on."""
+    if not app.config.get("SERVER_TIMING", False):
+        return
+    with app.app_context():
+        for engine in app.extensions["sqlalchemy"].engines.values():
+            if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    app.before_request(_start_timing)
+    app.after_request(_add_server_timing)
@@ -0,0 +1,69 @@
+"""
+Change Log Model
+
+Records the latest change to each project and task, per owner, so
+clients can sync deltas. Deletes are kept as tombstones.
+"""
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import delete, insert
+
+from app.core.extensions import db
+
+
+class ChangeLog(db.Model):
+    """Model to store the most recent change per user and entity."""
+    __tablename__ = "change_log"
+    __table_args__ = (
+        db.Index("ix_change_log_user_id_id", "user_id", "id"),
+        db.Index("ix_change_log_user_entity", "user_id", "entity_type", "entity_id"),
+        # Cursors rely on IDs never being reused after compaction deletes
+        {"sqlite_autoincrement": True},
+    )
+
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+    id = db.Column(db.Integer, primary_key=True)  # Doubles as the sync cursor
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity_type = db.Column(db.String(10), nullable=False)  # 'project' or 'task'
+    entity_id = db.Column(db.Integer, nullable=False)
+    action = db.Column(db.String(10), nullable=False)  # 'upsert' or 'delete'
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ChangeLog {self.action} {self.entity_type} {self.entity_id}>"
+
+    @classmethod
+    def record(cls, user_id: int, entity_type: str, entity_ids: Iterable[int], action: str) -> None:
+        """
+        Record a change within the current transaction.
+
+        Older entries for the same entities are replaced, so the table holds
+        one row per entity and a sync returns each changed entity once.
+        """
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return
+        db.session.execute(
+            delete(cls)
+            .where(
+                cls.user_id == user_id,
+                cls.entity_type == entity_type,
+                cls.entity_id.in_(entity_ids),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.execute(
+            insert(cls),
+            [
+                {
+                    "user_id": user_id,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "action": action,
+                }
+                for entity_id in entity_ids
+            ],
+        )
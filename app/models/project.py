@@ -1,3 +1,5 @@
+from sqlalchemy import bindparam, select
+
 from app.core.extensions import db
 
 
@@ -21,3 +23,18 @@ class Projects(db.Model):
     def __repr__(self):
         return f"<Project {self.project_name}>"
 
+    @classmethod
+    def is_owned_by(cls, project_id: int, user_id) -> bool:
+        """Check if a project exists and belongs to the user."""
+        return db.session.execute(
+            _OWNERSHIP_CHECK, {"project_id": project_id, "user_id": int(user_id)}
+        ).first() is not None
+
+
+# Built once; every request reuses the cached compiled form
+_OWNERSHIP_CHECK = (
+    select(Projects.id)
+    .where(Projects.id == bindparam("project_id"), Projects.user_id == bindparam("user_id"))
+    .limit(1)
+)
+
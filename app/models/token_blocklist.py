@@ -4,6 +4,8 @@ Token Blocklist Model
 Stores revoked JWT tokens for logout functionality.
 """
 from datetime import datetime
+from sqlalchemy import bindparam, select
+
 from app.core.extensions import db
 
 
@@ -24,7 +26,7 @@ class TokenBlocklist(db.Model):
     @classmethod
     def is_token_revoked(cls, jti: str) -> bool:
         """Check if a token is in the blocklist."""
-        return cls.query.filter_by(jti=jti).first() is not None
+        return db.session.execute(_REVOKED_CHECK, {"jti": jti}).first() is not None
     
     @classmethod
     def add_token(cls, jti: str, token_type: str, user_id: int = None, expires_at: datetime = None):
@@ -38,3 +40,7 @@ class TokenBlocklist(db.Model):
         db.session.add(token)
         db.session.commit()
         return token
+
+
+# Runs on every authenticated request; built once so its compiled form is cached
+_REVOKED_CHECK = select(TokenBlocklist.id).where(TokenBlocklist.jti == bindparam("jti")).limit(1)
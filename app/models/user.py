@@ -1,3 +1,5 @@
+from sqlalchemy import update
+
 from app.core.extensions import db
 
 
@@ -15,6 +17,8 @@ class Users(db.Model):
     )
     # Timestamp-based token revocation: tokens issued before this time are invalid
     token_valid_after = db.Column(db.TIMESTAMP, nullable=True)
+    # Incremented by every write to the user's data; drives conditional GETs
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     projects = db.relationship(
         "Projects", backref="users", cascade="all, delete-orphan"
@@ -23,3 +27,14 @@ class Users(db.Model):
     def __repr__(self):
         return f"<User {self.email}>"
 
+    @classmethod
+    def bump_data_version(cls, user_id) -> None:
+        """Increment a user's data version within the current transaction."""
+        # Keep update_at untouched: a version bump is not a profile change
+        db.session.execute(
+            update(cls)
+            .where(cls.id == user_id)
+            .values(data_version=cls.data_version + 1, update_at=cls.update_at)
+            .execution_options(synchronize_session=False)
+        )
+
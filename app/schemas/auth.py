@@ -4,8 +4,7 @@ Authentication Schemas
 Pydantic models with strict validation for security.
 """
 import re
-import bleach
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 # Security patterns to block
@@ -21,7 +20,8 @@ def sanitize_string(value: str, max_length: int = 255) -> str:
         return value
     # Strip whitespace
     value = value.strip()
-    # Remove HTML tags
+    # Remove HTML tags (bleach is imported on first use: it is slow to import at boot)
+    import bleach
     value = bleach.clean(value, tags=[], strip=True)
     # Limit length
     return value[:max_length]
@@ -36,6 +36,9 @@ def check_sql_injection(value: str, field_name: str) -> str:
 
 class LoginRequest(BaseModel):
     """Schema for login request with strict validation."""
+    # Built on first validation: EmailStr imports email-validator, slow at boot
+    model_config = ConfigDict(defer_build=True)
+    
     email: EmailStr = Field(..., description="Valid email address")
     password: str = Field(..., min_length=1, max_length=128)
     
@@ -48,6 +51,8 @@ class LoginRequest(BaseModel):
 
 class RegisterRequest(BaseModel):
     """Schema for registration request with security validation."""
+    model_config = ConfigDict(defer_build=True)
+    
     name: str = Field(..., min_length=2, max_length=100, description="User's display name")
     email: EmailStr = Field(..., description="Valid email address")
     password: str = Field(..., min_length=8, max_length=128, description="Secure password")
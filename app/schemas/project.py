@@ -60,6 +60,18 @@ class ProjectResponse(BaseModel):
             update_at=project.update_at
         )
 
+    @staticmethod
+    def dump_orm_project(project) -> dict:
+        """Serialize a Project row straight to the `from_orm_project(project).model_dump()` dict."""
+        return {
+            "project_id": project.id,
+            "project_name": project.project_name,
+            "description": project.description,
+            "user_id": project.user_id,
+            "created_at": project.created_at,
+            "update_at": project.update_at,
+        }
+
 
 class ProjectBasicResponse(BaseModel):
     """Basic project response for updates."""
@@ -96,3 +108,17 @@ class ProjectWithTasks(ProjectResponse):
             update_at=project.update_at,
             task=[TaskResponse.from_orm_task(t) for t in project.tasks]
         )
+
+    @staticmethod
+    def dump_orm_project(project) -> dict:
+        """Serialize a Project row and its tasks straight to the `model_dump()` dict."""
+        from app.schemas.task import TaskResponse
+        return {
+            "project_id": project.id,
+            "project_name": project.project_name,
+            "description": project.description,
+            "user_id": project.user_id,
+            "created_at": project.created_at,
+            "update_at": project.update_at,
+            "task": [TaskResponse.dump_orm_task(t) for t in project.tasks],
+        }
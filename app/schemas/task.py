@@ -70,6 +70,24 @@ class TaskResponse(BaseModel):
             update_at=task.update_at
         )
 
+    @staticmethod
+    def dump_orm_task(task) -> dict:
+        """
+        Serialize a Task row straight to the dict `from_orm_task(task).model_dump()` returns.
+
+        Skips building the model, for list endpoints returning many rows.
+        """
+        return {
+            "task_id": task.id,
+            "task_name": task.task_name,
+            "description": task.description,
+            "due_date": task.due_date,
+            "status": task.status,
+            "project_id": task.project_id,
+            "created_at": task.created_at,
+            "update_at": task.update_at,
+        }
+
 
 class TaskBasicResponse(BaseModel):
     """Basic task response for updates."""
@@ -4,7 +4,6 @@ User Schemas
 Pydantic models with strict validation for User operations.
 """
 import re
-import bleach
 from datetime import datetime
 from typing import Optional, List, Any
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
@@ -15,12 +14,16 @@ def sanitize_string(value: str, max_length: int = 255) -> str:
     if not value:
         return value
     value = value.strip()
+    import bleach  # On first use: slow to import at boot
     value = bleach.clean(value, tags=[], strip=True)
     return value[:max_length]
 
 
 class UserBase(BaseModel):
     """Base user schema with common validated fields."""
+    # Built on first validation: EmailStr imports email-validator, slow at boot
+    model_config = ConfigDict(defer_build=True)
+    
     name: str = Field(..., min_length=2, max_length=100)
     email: EmailStr
     
@@ -50,6 +53,8 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     """Schema for updating a user with validation."""
+    model_config = ConfigDict(defer_build=True)
+    
     username: str = Field(..., min_length=2, max_length=100)
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=128)
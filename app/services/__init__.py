@@ -3,3 +3,7 @@ from app.services.auth_service import AuthService
 from app.services.user_service import UserService
 from app.services.project_service import ProjectService
 from app.services.task_service import TaskService
+from app.services.search_service import SearchService
+from app.services.sync_service import SyncService
+from app.services.export_service import ExportService
+from app.services.import_service import ImportService
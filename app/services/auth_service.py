@@ -6,6 +6,7 @@ Business logic for user authentication, registration, and logout.
 from datetime import datetime
 from typing import Optional, Tuple
 from flask_jwt_extended import create_access_token, create_refresh_token, decode_token
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import IntegrityError
 
 from app.core.extensions import db
@@ -13,6 +14,8 @@ from app.core.security import hash_password, verify_password
 from app.models.user import Users
 from app.models.token_blocklist import TokenBlocklist
 
+_USER_BY_EMAIL = select(Users).where(Users.email == bindparam("email"))
+
 
 class AuthService:
     """Service class for authentication operations."""
@@ -54,7 +57,7 @@ class AuthService:
             return False, "Incomplete data. Please provide all required fields.", None
 
         try:
-            user = Users.query.filter_by(email=email).first()
+            user = db.session.execute(_USER_BY_EMAIL, {"email": email}).scalars().first()
             
             if not user:
                 return False, "User not found", None
@@ -122,7 +125,7 @@ class AuthService:
             Tuple of (success, message)
         """
         try:
-            user = Users.query.get(user_id)
+            user = db.session.get(Users, user_id)
             if not user:
                 return False, "User not found"
             
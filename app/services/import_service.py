@@ -0,0 +1,256 @@
+"""
+Import Service
+
+Bulk import of projects and tasks from NDJSON or CSV.
+
+Accepts the row format produced by the export endpoint. Rows are parsed
+from a text stream one at a time, validated with the create schemas and
+written in chunks, each chunk in its own transaction. Tasks go through
+COPY on PostgreSQL (except in gevent mode) and a multi-row executemany
+elsewhere. A bad row is reported with its line number and does not stop
+the import.
+
+A task's `project_id` refers either to a project row earlier in the same
+file (by its exported `id`) or to an existing project the user owns.
+"""
+import csv
+import io
+import json
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core import green
+from app.core.extensions import db
+from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.user import Users
+from app.schemas.project import ProjectCreate
+from app.schemas.task import TaskCreate
+from app.services.search_service import SearchService
+from app.services.sync_service import SyncService
+
+FORMATS = ("ndjson", "csv")
+TASK_COLUMNS = ("task_name", "description", "due_date", "status", "project_id")
+
+# (line number, row, error)
+ParsedRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+    )
+
+
+def _copy_value(value) -> str:
+    """Encode a value for COPY's text format."""
+    if value is None:
+        return "\\N"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+class ImportResult:
+    """Counts and per-row errors of an import."""
+
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.projects = 0
+        self.tasks = 0
+        self.error_count = 0
+        self.errors: List[dict] = []
+
+    def add_error(self, line: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": message})
+
+    def to_dict(self) -> dict:
+        return {
+            "projects_imported": self.projects,
+            "tasks_imported": self.tasks,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+
+class _Importer:
+    """State of one import run: pending chunks and the project ID mapping."""
+
+    def __init__(self, user_id: int, chunk_size: int, result: ImportResult):
+        self.user_id = user_id
+        self.chunk_size = chunk_size
+        self.result = result
+        # psycopg2 has no COPY while a wait callback is installed (gevent mode)
+        self.use_copy = db.session.get_bind().dialect.name == "postgresql" and not green.is_active()
+        self.project_ids: Dict[str, int] = {}  # Exported project id -> new id
+        self.owned: Dict[int, bool] = {}  # Existing project id -> owned by the user
+        self.pending_projects: List[Tuple[Optional[str], dict]] = []
+        self.pending_tasks: List[dict] = []
+
+    def add(self, line: int, row: dict) -> None:
+        kind = row.get("type")
+        if kind == "project":
+            self._add_project(line, row)
+        elif kind == "task":
+            self._add_task(line, row)
+        else:
+            self.result.add_error(line, "type must be 'project' or 'task'")
+
+    def finish(self) -> None:
+        self._flush_projects()
+        self._flush_tasks()
+
+    def _add_project(self, line: int, row: dict) -> None:
+        try:
+            data = ProjectCreate.model_validate(row)
+        except ValidationError as e:
+            self.result.add_error(line, _validation_message(e))
+            return
+        source_id = str(row["id"]) if row.get("id") is not None else None
+        values = {"project_name": data.project_name, "description": data.description, "user_id": self.user_id}
+        self.pending_projects.append((source_id, values))
+        if len(self.pending_projects) >= self.chunk_size:
+            self._flush_projects()
+
+    def _add_task(self, line: int, row: dict) -> None:
+        # Tasks may reference projects still waiting in the buffer
+        self._flush_projects()
+        try:
+            data = TaskCreate.model_validate(row)
+        except ValidationError as e:
+            self.result.add_error(line, _validation_message(e))
+            return
+        project_id = self._resolve_project(data.project_id)
+        if project_id is None:
+            self.result.add_error(line, f"project_id: unknown project {data.project_id}")
+            return
+        self.pending_tasks.append({
+            "task_name": data.task_name,
+            "description": data.description,
+            "due_date": date.fromisoformat(data.due_date),
+            "status": data.status,
+            "project_id": project_id,
+        })
+        if len(self.pending_tasks) >= self.chunk_size:
+            self._flush_tasks()
+
+    def _resolve_project(self, reference: int) -> Optional[int]:
+        mapped = self.project_ids.get(str(reference))
+        if mapped is not None:
+            return mapped
+        if reference not in self.owned:
+            self.owned[reference] = Projects.is_owned_by(reference, self.user_id)
+        return reference if self.owned[reference] else None
+
+    def _flush_projects(self) -> None:
+        if not self.pending_projects:
+            return
+        pending, self.pending_projects = self.pending_projects, []
+        new_ids = db.session.execute(
+            insert(Projects).returning(Projects.id, sort_by_parameter_order=True),
+            [values for _, values in pending],
+        ).scalars().all()
+        SyncService.record_import(self.user_id, new_ids, [], new_ids)
+        db.session.commit()
+        for (source_id, _), new_id in zip(pending, new_ids):
+            if source_id is not None:
+                self.project_ids[source_id] = new_id
+        self.result.projects += len(new_ids)
+
+    def _flush_tasks(self) -> None:
+        if not self.pending_tasks:
+            return
+        pending, self.pending_tasks = self.pending_tasks, []
+        touched = sorted({task["project_id"] for task in pending})
+        new_ids = self._copy_tasks(pending, touched) if self.use_copy else self._insert_tasks(pending)
+        SyncService.record_import(self.user_id, [], new_ids, touched)
+        db.session.commit()
+        self.result.tasks += len(pending)
+
+    @staticmethod
+    def _insert_tasks(pending: List[dict]) -> List[int]:
+        return db.session.execute(insert(Tasks).returning(Tasks.id), pending).scalars().all()
+
+    def _copy_tasks(self, pending: List[dict], touched: List[int]) -> List[int]:
+        # Lock the owner's row first so no other write to these projects interleaves,
+        # then every task ID above the previous maximum belongs to this chunk
+        Users.bump_data_version(self.user_id)
+        last_id = db.session.execute(
+            select(func.coalesce(func.max(Tasks.id), 0)).where(Tasks.project_id.in_(touched))
+        ).scalar()
+
+        buffer = io.StringIO()
+        for task in pending:
+            buffer.write("\t".join(_copy_value(task[column]) for column in TASK_COLUMNS))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor = db.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY tasks ({', '.join(TASK_COLUMNS)}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+        return db.session.execute(
+            select(Tasks.id).where(Tasks.project_id.in_(touched), Tasks.id > last_id)
+        ).scalars().all()
+
+
+class ImportService:
+    """Service class for bulk imports."""
+
+    @staticmethod
+    def parse(stream: Iterable[str], import_format: str) -> Iterator[ParsedRow]:
+        """Parse a text stream into rows, yielding parse errors in place of bad rows."""
+        if import_format == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                # Empty CSV cells are missing values
+                yield reader.line_num, {key: value or None for key, value in row.items()}, None
+            return
+
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None, "Invalid JSON"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Each line must be a JSON object"
+                continue
+            yield line_number, row, None
+
+    @staticmethod
+    def import_rows(user_id, rows: Iterable[ParsedRow], chunk_size: int = 1000,
+                    max_errors: int = 100) -> Tuple[bool, str, dict]:
+        """
+        Import parsed rows for a user.
+
+        Returns:
+            Tuple of (success, message, summary). Rows committed before a
+            database error stay imported.
+        """
+        result = ImportResult(max_errors)
+        importer = _Importer(int(user_id), chunk_size, result)
+        try:
+            for line, row, error in rows:
+                if error is not None:
+                    result.add_error(line, error)
+                else:
+                    importer.add(line, row)
+            importer.finish()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            return False, f"Error importing data: {str(e)}", result.to_dict()
+        finally:
+            if result.projects or result.tasks:
+                SearchService.data_imported(user_id)
+        return True, "Import finished", result.to_dict()
@@ -4,11 +4,38 @@ Project Service
 Business logic for project operations.
 """
 from typing import List, Optional, Tuple
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.common.pagination import paginate_rows
 from app.core.extensions import db
 from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.user import Users
 from app.schemas.project import ProjectResponse, ProjectBasicResponse, ProjectWithTasks
+from app.services.search_service import SearchService
+from app.services.sync_service import SyncService
+from app.services.task_service import TASK_ROW_COLUMNS
+
+# Hot read statements, built once at import so SQLAlchemy's compiled cache serves them
+_USER_PROJECT_ROWS = (
+    select(
+        Projects.id.label("project_id"), Projects.project_name, Projects.description,
+        Projects.user_id, Projects.created_at, Projects.update_at,
+    )
+    .where(Projects.user_id == bindparam("user_id"))
+    .order_by(Projects.id)
+)
+_PAGE_TASK_ROWS = (
+    select(*TASK_ROW_COLUMNS)
+    .where(Tasks.project_id.in_(bindparam("project_ids", expanding=True)))
+    .order_by(Tasks.id)
+)
+_PROJECT_VERSION = (
+    select(Users.data_version)
+    .join(Projects, Projects.user_id == Users.id)
+    .where(Projects.id == bindparam("project_id"), Users.id == bindparam("user_id"))
+)
 
 
 class ProjectService:
@@ -27,11 +54,17 @@ class ProjectService:
         Returns:
             Dictionary with 'data' and 'meta' keys for paginated response
         """
-        pagination = Projects.query.filter_by(user_id=user_id).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        pagination = paginate_rows(_USER_PROJECT_ROWS.params(user_id=int(user_id)), page, per_page)
+        projects = [row._asdict() for row in pagination.items]
+        tasks_by_project = {project["project_id"]: [] for project in projects}
+        if projects:
+            # One query for the tasks of the whole page
+            for row in db.session.execute(_PAGE_TASK_ROWS, {"project_ids": list(tasks_by_project)}):
+                tasks_by_project[row.project_id].append(row._asdict())
+        for project in projects:
+            project["task"] = tasks_by_project[project["project_id"]]
         return {
-            "data": [ProjectWithTasks.from_orm_project(p).model_dump() for p in pagination.items],
+            "data": projects,
             "meta": {
                 "page": pagination.page,
                 "per_page": pagination.per_page,
@@ -40,16 +73,38 @@ class ProjectService:
             }
         }
 
+    @staticmethod
+    def get_projects_version(current_user: str) -> Optional[int]:
+        """
+        Get the data version behind the user's project list.
+        
+        The user row is already in the identity map from the token
+        revocation check, so this normally costs no query.
+        """
+        user = db.session.get(Users, int(current_user))
+        return user.data_version if user else None
+
+    @staticmethod
+    def get_projects_cache_scopes(current_user: str) -> List[str]:
+        """Response cache scopes read by the user's project list."""
+        return [f"projects:{current_user}"]
+
+    @staticmethod
+    def get_project_version(current_user: str, id: int) -> Optional[int]:
+        """Get the owner's data version for a project, or None if the user doesn't own it."""
+        return db.session.execute(
+            _PROJECT_VERSION, {"project_id": id, "user_id": int(current_user)}
+        ).scalar()
+
     @staticmethod
     def get_project_by_id(project_id: int) -> Optional[Projects]:
         """Get a project by ID."""
-        return Projects.query.get(project_id)
+        return db.session.get(Projects, project_id)
 
     @staticmethod
     def check_project_permission(project_id: int, user_id: str) -> bool:
         """Check if user owns the project."""
-        project = Projects.query.filter_by(id=project_id, user_id=user_id).first()
-        return project is not None
+        return Projects.is_owned_by(project_id, user_id)
 
     @staticmethod
     def create_project(project_name: str, description: str, user_id: str) -> Tuple[bool, str, Optional[dict]]:
@@ -69,8 +124,12 @@ class ProjectService:
                 user_id=user_id
             )
             db.session.add(new_project)
+            db.session.flush()
+            SyncService.record_project_change(user_id, new_project.id, SyncService.CREATED)
             db.session.commit()
-            return True, "Project successfully created", ProjectWithTasks.from_orm_project(new_project).model_dump()
+            project_data = ProjectWithTasks.from_orm_project(new_project).model_dump()
+            SearchService.project_saved(new_project)
+            return True, "Project successfully created", project_data
         except SQLAlchemyError as e:
             db.session.rollback()
             return False, f"Error creating project: {str(e)}", None
@@ -89,8 +148,11 @@ class ProjectService:
         try:
             project.project_name = project_name
             project.description = description
+            SyncService.record_project_change(project.user_id, project.id)
             db.session.commit()
-            return True, "Project successfully updated", ProjectBasicResponse.from_orm_project(project).model_dump()
+            project_data = ProjectBasicResponse.from_orm_project(project).model_dump()
+            SearchService.project_saved(project)
+            return True, "Project successfully updated", project_data
         except SQLAlchemyError as e:
             db.session.rollback()
             return False, f"Error updating project: {str(e)}", None
@@ -104,8 +166,11 @@ class ProjectService:
             Tuple of (success, message)
         """
         try:
+            project_id = project.id
+            SyncService.record_project_deleted(project)
             db.session.delete(project)
             db.session.commit()
+            SearchService.project_deleted(project_id)
             return True, "Project successfully deleted"
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -0,0 +1,367 @@
+"""
+Search Service
+
+Typeahead suggestions over project and task names.
+
+Each user gets a lazily built in-memory prefix index, kept in a bounded
+LRU registry on the app. The project and task services keep warm indexes
+in sync on every write. Cold or oversized indexes are answered with a
+LIKE query, which the pg_trgm indexes serve on PostgreSQL.
+"""
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import func, or_, select
+
+from app.core.extensions import db
+from app.models.project import Projects
+from app.models.task import Tasks
+
+
+def _normalize(value: str) -> str:
+    """Lowercase and collapse whitespace so keys and prefixes compare equal."""
+    return " ".join(value.lower().split())
+
+
+def _word_keys(name: str) -> List[str]:
+    """Return the name suffixes starting at each word, e.g. 'a b' -> ['a b', 'b']."""
+    normalized = _normalize(name)
+    keys = [normalized] if normalized else []
+    for position, char in enumerate(normalized):
+        if char == " ":
+            keys.append(normalized[position + 1:])
+    return keys
+
+
+class PrefixIndex:
+    """
+    Sorted-key prefix index for a single user's project and task names.
+
+    Every word of a name is indexed as a key, so "Write API docs" is found
+    by "wri", "api" and "doc". Lookups are a bisect into the sorted keys.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.overflow = False
+        self.created_at = time.monotonic()
+        self.project_ids = set()
+        self._keys: List[Tuple[str, str, int]] = []
+        self._docs: Dict[Tuple[str, int], dict] = {}
+        self._doc_keys: Dict[Tuple[str, int], List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, kind: str, item_id: int, name: str, project_id: int) -> None:
+        """Insert or replace a document; marks the index as overflowed past the budget."""
+        if self.overflow:
+            return
+        self.remove(kind, item_id)
+        keys = _word_keys(name or "")
+        if len(self._keys) + len(keys) > self.max_entries:
+            self._mark_overflow()
+            return
+        doc_id = (kind, item_id)
+        self._docs[doc_id] = {
+            "type": kind,
+            "id": item_id,
+            "name": name,
+            "project_id": project_id,
+        }
+        self._doc_keys[doc_id] = keys
+        for key in keys:
+            bisect.insort(self._keys, (key, kind, item_id))
+        if kind == "project":
+            self.project_ids.add(item_id)
+
+    def remove(self, kind: str, item_id: int) -> None:
+        """Remove a document if present."""
+        doc_id = (kind, item_id)
+        keys = self._doc_keys.pop(doc_id, None)
+        if keys is None:
+            return
+        self._docs.pop(doc_id, None)
+        for key in keys:
+            position = bisect.bisect_left(self._keys, (key, kind, item_id))
+            if position < len(self._keys) and self._keys[position] == (key, kind, item_id):
+                del self._keys[position]
+        if kind == "project":
+            self.project_ids.discard(item_id)
+
+    def remove_project(self, project_id: int) -> None:
+        """Remove a project together with all of its tasks."""
+        task_ids = [
+            doc["id"] for doc in self._docs.values()
+            if doc["type"] == "task" and doc["project_id"] == project_id
+        ]
+        for task_id in task_ids:
+            self.remove("task", task_id)
+        self.remove("project", project_id)
+
+    def search(self, prefix: str, limit: int) -> List[dict]:
+        """Return up to `limit` documents with a word starting with `prefix`."""
+        prefix = _normalize(prefix)
+        seen = set()
+        results = []
+        position = bisect.bisect_left(self._keys, (prefix,))
+        while position < len(self._keys) and len(results) < limit:
+            key, kind, item_id = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            if (kind, item_id) not in seen:
+                seen.add((kind, item_id))
+                results.append(self._docs[(kind, item_id)])
+            position += 1
+        return _rank(results, prefix)
+
+    def _mark_overflow(self) -> None:
+        """Drop all entries; an oversized index is served from the database."""
+        self.overflow = True
+        self.project_ids = set()
+        self._keys = []
+        self._docs = {}
+        self._doc_keys = {}
+
+
+def _rank(results: List[dict], prefix: str) -> List[dict]:
+    """Order whole-name matches before word matches, then alphabetically."""
+    return sorted(
+        results,
+        key=lambda doc: (
+            not _normalize(doc["name"]).startswith(prefix),
+            doc["type"] != "project",
+            _normalize(doc["name"]),
+        ),
+    )
+
+
+class SearchIndexRegistry:
+    """Thread-safe LRU registry of per-user prefix indexes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes: "OrderedDict[str, PrefixIndex]" = OrderedDict()
+        self._project_owners: Dict[int, str] = {}
+
+    def get(self, user_id: str, ttl: float) -> Optional[PrefixIndex]:
+        """Return the user's index if warm and not older than `ttl` seconds."""
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                return None
+            if time.monotonic() - index.created_at > ttl:
+                self._discard(user_id)
+                return None
+            self._indexes.move_to_end(user_id)
+            return index
+
+    def put(self, user_id: str, index: PrefixIndex, max_users: int) -> None:
+        """Store an index, evicting the least recently used users past `max_users`."""
+        with self._lock:
+            self._discard(user_id)
+            self._indexes[user_id] = index
+            for project_id in index.project_ids:
+                self._project_owners[project_id] = user_id
+            while len(self._indexes) > max_users:
+                oldest = next(iter(self._indexes))
+                self._discard(oldest)
+
+    def search(self, index: PrefixIndex, prefix: str, limit: int) -> Optional[List[dict]]:
+        """Search a warm index under the lock, since writes change it in place; None once it has overflowed."""
+        with self._lock:
+            if index.overflow:
+                return None
+            return index.search(prefix, limit)
+
+    def discard(self, user_id: str) -> None:
+        """Forget a user's index."""
+        with self._lock:
+            self._discard(user_id)
+
+    def add(self, user_id: str, kind: str, item_id: int, name: str, project_id: int) -> None:
+        """Add a document to the user's index if it is warm."""
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                return
+            index.add(kind, item_id, name, project_id)
+            if kind == "project" and not index.overflow:
+                self._project_owners[item_id] = user_id
+
+    def add_task(self, task_id: int, name: str, project_id: int) -> None:
+        """Add a task to whichever warm index owns its project."""
+        with self._lock:
+            index = self._index_for_project(project_id)
+            if index is not None:
+                index.add("task", task_id, name, project_id)
+
+    def remove_task(self, task_id: int, project_id: int) -> None:
+        """Remove a task from whichever warm index owns its project."""
+        with self._lock:
+            index = self._index_for_project(project_id)
+            if index is not None:
+                index.remove("task", task_id)
+
+    def remove_project(self, project_id: int) -> None:
+        """Remove a project and its tasks from its owner's warm index."""
+        with self._lock:
+            index = self._index_for_project(project_id)
+            if index is not None:
+                index.remove_project(project_id)
+            self._project_owners.pop(project_id, None)
+
+    def _index_for_project(self, project_id: int) -> Optional[PrefixIndex]:
+        user_id = self._project_owners.get(project_id)
+        return self._indexes.get(user_id) if user_id is not None else None
+
+    def _discard(self, user_id: str) -> None:
+        index = self._indexes.pop(user_id, None)
+        if index is None:
+            return
+        for project_id in index.project_ids:
+            if self._project_owners.get(project_id) == user_id:
+                del self._project_owners[project_id]
+
+
+def _registry() -> SearchIndexRegistry:
+    """Get the registry for the current app, creating it on first use."""
+    return current_app.extensions.setdefault("search_index", SearchIndexRegistry())
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards in user input."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SearchService:
+    """Service class for typeahead search."""
+
+    @staticmethod
+    def suggest(user_id: str, prefix: str, limit: int = 10) -> List[dict]:
+        """
+        Get name suggestions for the user's projects and tasks.
+
+        Args:
+            user_id: The user's ID
+            prefix: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of suggestion dictionaries
+        """
+        user_id = str(user_id)
+        config = current_app.config
+        registry = _registry()
+
+        index = registry.get(user_id, config.get("SEARCH_INDEX_TTL", 300))
+        if index is None:
+            # Cold: answer from the database, then warm the index for the next keystroke
+            results = SearchService._query_suggestions(user_id, prefix, limit)
+            registry.put(
+                user_id,
+                SearchService._build_index(user_id, config.get("SEARCH_INDEX_MAX_ENTRIES", 5000)),
+                config.get("SEARCH_INDEX_MAX_USERS", 1000),
+            )
+            return results
+
+        results = registry.search(index, prefix, limit)
+        if results is None:
+            return SearchService._query_suggestions(user_id, prefix, limit)
+        return results
+
+    @staticmethod
+    def _build_index(user_id: str, max_entries: int) -> PrefixIndex:
+        """Load the user's project and task names into a new prefix index."""
+        index = PrefixIndex(max_entries)
+        projects = db.session.execute(
+            select(Projects.id, Projects.project_name)
+            .where(Projects.user_id == user_id)
+            .limit(max_entries + 1)
+        )
+        for project_id, name in projects:
+            index.add("project", project_id, name, project_id)
+            if index.overflow:
+                return index
+
+        tasks = db.session.execute(
+            select(Tasks.id, Tasks.task_name, Tasks.project_id)
+            .join(Projects, Tasks.project_id == Projects.id)
+            .where(Projects.user_id == user_id)
+            .limit(max_entries + 1)
+        )
+        for task_id, name, project_id in tasks:
+            index.add("task", task_id, name, project_id)
+            if index.overflow:
+                break
+        return index
+
+    @staticmethod
+    def _query_suggestions(user_id: str, prefix: str, limit: int) -> List[dict]:
+        """Match name and word prefixes in the database (pg_trgm-backed on PostgreSQL)."""
+        pattern = _escape_like(_normalize(prefix))
+
+        def matches(column):
+            lowered = func.lower(column)
+            return or_(
+                lowered.like(f"{pattern}%", escape="\\"),
+                lowered.like(f"% {pattern}%", escape="\\"),
+            )
+
+        projects = db.session.execute(
+            select(Projects.id, Projects.project_name)
+            .where(Projects.user_id == user_id, matches(Projects.project_name))
+            .limit(limit)
+        )
+        tasks = db.session.execute(
+            select(Tasks.id, Tasks.task_name, Tasks.project_id)
+            .join(Projects, Tasks.project_id == Projects.id)
+            .where(Projects.user_id == user_id, matches(Tasks.task_name))
+            .limit(limit)
+        )
+        results = [
+            {"type": "project", "id": project_id, "name": name, "project_id": project_id}
+            for project_id, name in projects
+        ]
+        results.extend(
+            {"type": "task", "id": task_id, "name": name, "project_id": project_id}
+            for task_id, name, project_id in tasks
+        )
+        return _rank(results, _normalize(prefix))[:limit]
+
+    @staticmethod
+    def project_saved(project: Projects) -> None:
+        """Sync a created or updated project into its owner's warm index."""
+        _registry().add(str(project.user_id), "project", project.id, project.project_name, project.id)
+
+    @staticmethod
+    def project_deleted(project_id: int) -> None:
+        """Drop a deleted project and its tasks from the warm index."""
+        _registry().remove_project(project_id)
+
+    @staticmethod
+    def task_saved(task: Tasks, previous_project_id: Optional[int] = None) -> None:
+        """Sync a created or updated task into its owner's warm index."""
+        registry = _registry()
+        if previous_project_id is not None and previous_project_id != task.project_id:
+            registry.remove_task(task.id, previous_project_id)
+        registry.add_task(task.id, task.task_name, task.project_id)
+
+    @staticmethod
+    def task_deleted(task_id: int, project_id: int) -> None:
+        """Drop a deleted task from the warm index."""
+        _registry().remove_task(task_id, project_id)
+
+    @staticmethod
+    def user_deleted(user_id) -> None:
+        """Forget a deleted user's index."""
+        _registry().discard(str(user_id))
+
+    @staticmethod
+    def data_imported(user_id) -> None:
+        """Forget a user's index after a bulk import; the next suggestion rebuilds it."""
+        _registry().discard(str(user_id))
@@ -0,0 +1,178 @@
+"""
+Sync Service
+
+Change tracking for projects and tasks, and delta sync for clients.
+"""
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+
+from app.core.events import publish_after_commit
+from app.core.extensions import db
+from app.models.change_log import ChangeLog
+from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.user import Users
+from app.schemas.project import ProjectResponse
+from app.schemas.task import TaskResponse
+
+
+def _action(change: str) -> str:
+    """Map a change kind to the change log action."""
+    return ChangeLog.DELETE if change == SyncService.DELETED else ChangeLog.UPSERT
+
+
+class SyncService:
+    """Service class for change tracking and delta sync."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+    @staticmethod
+    def record_project_change(user_id, project_id: int, change: str = UPDATED) -> None:
+        """
+        Record a project write within the current transaction.
+
+        Bumps the owner's data version first: the row lock it takes
+        serializes the owner's writes, so change IDs are handed out in
+        commit order and a cursor can never skip a late commit.
+        """
+        Users.bump_data_version(user_id)
+        ChangeLog.record(int(user_id), "project", [project_id], _action(change))
+        publish_after_commit(user_id, f"project.{change}", id=project_id)
+
+    @staticmethod
+    def record_project_deleted(project: Projects) -> None:
+        """Record tombstones for a project and every task it cascades to."""
+        Users.bump_data_version(project.user_id)
+        ChangeLog.record(project.user_id, "task", [task.id for task in project.tasks], ChangeLog.DELETE)
+        ChangeLog.record(project.user_id, "project", [project.id], ChangeLog.DELETE)
+        publish_after_commit(project.user_id, "project.deleted", id=project.id)
+
+    @staticmethod
+    def record_task_change(project_id: int, task_ids: Iterable[int], change: str = UPDATED) -> None:
+        """Record task writes under the owner of `project_id` within the current transaction."""
+        # Ownership checks already loaded the project, so this is an identity map hit
+        project = db.session.get(Projects, project_id)
+        if project is None:
+            return
+        task_ids = list(task_ids)
+        Users.bump_data_version(project.user_id)
+        ChangeLog.record(project.user_id, "task", task_ids, _action(change))
+        for task_id in task_ids:
+            publish_after_commit(project.user_id, f"task.{change}", id=task_id, project_id=project_id)
+
+    @staticmethod
+    def record_task_moved(task_id: int, previous_project_id: int, project_id: int) -> None:
+        """
+        Record a task moved to another project within the current transaction.
+
+        The previous owner gets a tombstone and a task.deleted event only
+        if the move changed owners; within one owner it is just an update.
+        """
+        previous = db.session.get(Projects, previous_project_id)
+        current = db.session.get(Projects, project_id)
+        if previous is not None and (current is None or previous.user_id != current.user_id):
+            SyncService.record_task_change(previous_project_id, [task_id], SyncService.DELETED)
+        SyncService.record_task_change(project_id, [task_id])
+
+    @staticmethod
+    def record_import(user_id, project_ids: Iterable[int], task_ids: Iterable[int],
+                      touched_project_ids: Iterable[int]) -> None:
+        """
+        Record one chunk of a bulk import within the current transaction.
+
+        Publishes a single import.completed event instead of one per row;
+        clients should fetch the rows through /api/sync.
+        """
+        project_ids, task_ids = list(project_ids), list(task_ids)
+        Users.bump_data_version(user_id)
+        if project_ids:
+            ChangeLog.record(int(user_id), "project", project_ids, ChangeLog.UPSERT)
+        if task_ids:
+            ChangeLog.record(int(user_id), "task", task_ids, ChangeLog.UPSERT)
+        publish_after_commit(
+            user_id, "import.completed",
+            projects=len(project_ids), tasks=len(task_ids), project_ids=sorted(set(touched_project_ids))
+        )
+
+    @staticmethod
+    def get_changes(user_id: str, since: Optional[int] = None, limit: int = 1000) -> dict:
+        """
+        Get projects and tasks changed after a cursor.
+
+        Args:
+            user_id: The user's ID
+            since: Cursor from a previous sync; None returns a full snapshot
+            limit: Maximum number of changes per page
+
+        Returns:
+            Dictionary with changed rows, tombstones, the next cursor and has_more
+        """
+        user_id = int(user_id)
+        if since is None:
+            return SyncService._get_snapshot(user_id)
+
+        changes = db.session.execute(
+            select(ChangeLog.id, ChangeLog.entity_type, ChangeLog.entity_id, ChangeLog.action)
+            .where(ChangeLog.user_id == user_id, ChangeLog.id > since)
+            .order_by(ChangeLog.id)
+            .limit(limit + 1)
+        ).all()
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        upserts = {"project": [], "task": []}
+        deleted = {"project": [], "task": []}
+        for _, entity_type, entity_id, action in changes:
+            target = deleted if action == ChangeLog.DELETE else upserts
+            target[entity_type].append(entity_id)
+
+        projects = []
+        if upserts["project"]:
+            projects = db.session.execute(
+                select(Projects)
+                .where(Projects.user_id == user_id, Projects.id.in_(upserts["project"]))
+                .order_by(Projects.id)
+            ).scalars()
+        tasks = []
+        if upserts["task"]:
+            tasks = db.session.execute(
+                select(Tasks)
+                .join(Projects, Tasks.project_id == Projects.id)
+                .where(Projects.user_id == user_id, Tasks.id.in_(upserts["task"]))
+                .order_by(Tasks.id)
+            ).scalars()
+
+        return {
+            "projects": [ProjectResponse.dump_orm_project(p) for p in projects],
+            "tasks": [TaskResponse.dump_orm_task(t) for t in tasks],
+            "deleted": {"projects": deleted["project"], "tasks": deleted["task"]},
+            "cursor": str(changes[-1][0] if changes else since),
+            "has_more": has_more,
+        }
+
+    @staticmethod
+    def _get_snapshot(user_id: int) -> dict:
+        """Get every project and task with the cursor to continue from."""
+        # Read the cursor first: anything committed after it is re-sent next time
+        cursor = db.session.execute(
+            select(func.coalesce(func.max(ChangeLog.id), 0)).where(ChangeLog.user_id == user_id)
+        ).scalar()
+        projects = db.session.execute(
+            select(Projects).where(Projects.user_id == user_id).order_by(Projects.id)
+        ).scalars()
+        tasks = db.session.execute(
+            select(Tasks)
+            .join(Projects, Tasks.project_id == Projects.id)
+            .where(Projects.user_id == user_id)
+            .order_by(Tasks.id)
+        ).scalars()
+        return {
+            "projects": [ProjectResponse.dump_orm_project(p) for p in projects],
+            "tasks": [TaskResponse.dump_orm_task(t) for t in tasks],
+            "deleted": {"projects": [], "tasks": []},
+            "cursor": str(cursor),
+            "has_more": False,
+        }
@@ -5,12 +5,37 @@ Business logic for task operations.
 """
 from datetime import datetime, date
 from typing import List, Optional, Tuple
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.extensions import db
 from app.models.task import Tasks
 from app.models.project import Projects
+from app.models.user import Users
 from app.schemas.task import TaskResponse, TaskBasicResponse
+from app.services.search_service import SearchService
+from app.services.sync_service import SyncService
+
+# Columns of a task in list responses, labelled like TaskResponse. List endpoints
+# select these instead of Tasks so rows skip ORM hydration and the identity map
+TASK_ROW_COLUMNS = (
+    Tasks.id.label("task_id"), Tasks.task_name, Tasks.description, Tasks.due_date,
+    Tasks.status, Tasks.project_id, Tasks.created_at, Tasks.update_at,
+)
+
+# Hot read statements, built once at import so SQLAlchemy's compiled cache serves them
+_PROJECT_TASK_ROWS = (
+    select(*TASK_ROW_COLUMNS)
+    .join(Projects, Tasks.project_id == Projects.id)
+    .where(Tasks.project_id == bindparam("project_id"))
+    .order_by(Tasks.id)
+)
+_PROJECT_TASK = select(Tasks).where(Tasks.id == bindparam("task_id"), Tasks.project_id == bindparam("project_id"))
+_TASKS_VERSION = (
+    select(Users.data_version)
+    .join(Projects, Projects.user_id == Users.id)
+    .where(Projects.id == bindparam("project_id"), Users.id == bindparam("user_id"))
+)
 
 
 class TaskService:
@@ -19,14 +44,24 @@ class TaskService:
     @staticmethod
     def has_permission(project_id: int, user_id: str) -> bool:
         """Check if user has permission to access a project's tasks."""
-        project = Projects.query.filter_by(id=project_id, user_id=user_id).first()
-        return project is not None
+        return Projects.is_owned_by(project_id, user_id)
 
     @staticmethod
     def is_valid_project(project_id: int, user_id: str) -> bool:
         """Check if a project exists and belongs to the user."""
-        project = Projects.query.filter_by(id=project_id, user_id=user_id).first()
-        return project is not None
+        return Projects.is_owned_by(project_id, user_id)
+
+    @staticmethod
+    def get_tasks_version(current_user: str, project_id: int) -> Optional[int]:
+        """Get the owner's data version behind a project's task list, or None if not owned."""
+        return db.session.execute(
+            _TASKS_VERSION, {"project_id": project_id, "user_id": int(current_user)}
+        ).scalar()
+
+    @staticmethod
+    def get_tasks_cache_scopes(current_user: str, project_id: int) -> List[str]:
+        """Response cache scopes read by a project's task list."""
+        return [f"tasks:{project_id}"]
 
     @staticmethod
     def validate_due_date(due_date_str: str) -> Tuple[bool, str, Optional[date]]:
@@ -55,24 +90,21 @@ class TaskService:
         Returns:
             List of task dictionaries
         """
-        tasks = db.session.execute(
-            db.select(Tasks)
-            .join(Projects, Tasks.project_id == Projects.id)
-            .filter(Tasks.project_id == project_id)
-            .order_by(Tasks.id)
-        ).scalars()
+        rows = db.session.execute(_PROJECT_TASK_ROWS, {"project_id": project_id})
         
-        return [TaskResponse.from_orm_task(task).model_dump() for task in tasks]
+        return [row._asdict() for row in rows]
 
     @staticmethod
     def get_task_by_id(task_id: int) -> Optional[Tasks]:
         """Get a task by ID."""
-        return Tasks.query.filter_by(id=task_id).first()
+        return db.session.get(Tasks, task_id)
 
     @staticmethod
     def get_task_by_id_and_project(task_id: int, project_id: int) -> Optional[Tasks]:
         """Get a task by ID and project ID."""
-        return Tasks.query.filter_by(id=task_id, project_id=project_id).first()
+        return db.session.execute(
+            _PROJECT_TASK, {"task_id": task_id, "project_id": project_id}
+        ).scalars().first()
 
     @staticmethod
     def create_task(
@@ -97,8 +129,12 @@ class TaskService:
                 project_id=project_id
             )
             db.session.add(new_task)
+            db.session.flush()
+            SyncService.record_task_change(project_id, [new_task.id], SyncService.CREATED)
             db.session.commit()
-            return True, "Task successfully created", TaskResponse.from_orm_task(new_task).model_dump()
+            task_data = TaskResponse.from_orm_task(new_task).model_dump()
+            SearchService.task_saved(new_task)
+            return True, "Task successfully created", task_data
         except SQLAlchemyError as e:
             db.session.rollback()
             return False, f"Error creating task: {str(e)}", None
@@ -119,13 +155,20 @@ class TaskService:
             Tuple of (success, message, task_data)
         """
         try:
+            previous_project_id = task.project_id
             task.task_name = task_name
             task.description = description
             task.due_date = due_date
             task.status = status
             task.project_id = project_id
+            if previous_project_id != project_id:
+                SyncService.record_task_moved(task.id, previous_project_id, project_id)
+            else:
+                SyncService.record_task_change(project_id, [task.id])
             db.session.commit()
-            return True, "Task successfully updated", TaskBasicResponse.from_orm_task(task).model_dump()
+            task_data = TaskBasicResponse.from_orm_task(task).model_dump()
+            SearchService.task_saved(task, previous_project_id)
+            return True, "Task successfully updated", task_data
         except SQLAlchemyError as e:
             db.session.rollback()
             return False, f"Error updating task: {str(e)}", None
@@ -139,8 +182,11 @@ class TaskService:
             Tuple of (success, message)
         """
         try:
+            task_id, project_id = task.id, task.project_id
+            SyncService.record_task_change(project_id, [task_id], SyncService.DELETED)
             db.session.delete(task)
             db.session.commit()
+            SearchService.task_deleted(task_id, project_id)
             return True, "Task successfully deleted"
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -4,13 +4,20 @@ User Service
 Business logic for user operations.
 """
 from typing import List, Optional, Tuple
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
+from app.common.pagination import paginate_rows
+from app.core.events import publish_after_commit
 from app.core.extensions import db
 from app.core.security import hash_password
+from app.models.project import Projects
 from app.models.user import Users
 from app.schemas.user import UserResponse, UserBasicResponse, UserWithProjects
+from app.services.search_service import SearchService
+
+_USER_ROWS = select(Users.id, Users.name, Users.email, Users.created_at, Users.update_at).order_by(Users.id)
 
 
 class UserService:
@@ -21,7 +28,7 @@ class UserService:
         """
         Get all users with pagination.
         
-        Uses joinedload to eager load projects and prevent N+1 queries.
+        Selects only the listed columns; no ORM instances are built.
         
         Args:
             page: Page number (1-indexed)
@@ -30,10 +37,7 @@ class UserService:
         Returns:
             Dictionary with 'data' and 'meta' keys for paginated response
         """
-        # Use joinedload to fetch users and their projects in a single query
-        pagination = Users.query.options(
-            joinedload(Users.projects)
-        ).paginate(page=page, per_page=per_page, error_out=False)
+        pagination = paginate_rows(_USER_ROWS, page, per_page)
         data = [
             {
                 "user_id": user.id,
@@ -54,10 +58,48 @@ class UserService:
             }
         }
 
+    @staticmethod
+    def get_users_version(current_user: str) -> str:
+        """
+        Get a fingerprint of the user list from one aggregate query.
+        
+        Row count catches inserts and deletes; max(update_at) and the sum of
+        data versions catch edits, including several within the same second.
+        """
+        count, last_update, versions = db.session.execute(
+            select(func.count(Users.id), func.max(Users.update_at), func.sum(Users.data_version))
+        ).one()
+        return f"{count}:{last_update}:{versions}"
+
+    @staticmethod
+    def get_user_version(current_user: str, user_id: int) -> Optional[int]:
+        """Get the data version behind a user's own profile, or None for other users."""
+        if not UserService.check_user_permission(current_user, user_id):
+            return None
+        user = db.session.get(Users, user_id)
+        return user.data_version if user else None
+
+    @staticmethod
+    def get_user_cache_scopes(current_user: str, user_id: int) -> Optional[List[str]]:
+        """Response cache scopes read by a user's detail, or None if not accessible."""
+        if not UserService.check_user_permission(current_user, user_id):
+            return None
+        # The detail embeds the user's projects
+        return [f"user:{user_id}", f"projects:{user_id}"]
+
     @staticmethod
     def get_user_by_id(user_id: int) -> Optional[Users]:
         """Get a user by ID."""
-        return Users.query.get(user_id)
+        return db.session.get(Users, user_id)
+
+    @staticmethod
+    def get_user_with_projects(user_id: int) -> Optional[Users]:
+        """Get a user by ID with projects and their tasks loaded in two more queries, not one per project."""
+        return db.session.execute(
+            select(Users)
+            .where(Users.id == user_id)
+            .options(selectinload(Users.projects).selectinload(Projects.tasks))
+        ).scalar_one_or_none()
 
     @staticmethod
     def check_user_permission(current_user_id: str, target_user_id: int) -> bool:
@@ -81,6 +123,8 @@ class UserService:
         user.name = name
         user.email = email
         user.password = hash_password(password)
+        Users.bump_data_version(user.id)
+        publish_after_commit(user.id, "user.updated", id=user.id)
         db.session.commit()
         return user
 
@@ -93,8 +137,11 @@ class UserService:
             Tuple of (success, message)
         """
         try:
+            user_id = user.id
             db.session.delete(user)
+            publish_after_commit(user_id, "user.deleted", id=user_id)
             db.session.commit()
+            SearchService.user_deleted(user_id)
             return True, "User successfully deleted"
         except SQLAlchemyError:
             db.session.rollback()
@@ -0,0 +1,14 @@
+"""
+ASGI Entry Point
+
+Serves the app from an ASGI server, e.g.:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 4
+
+Requests still run the WSGI app on a thread pool; connections, idle
+keep-alive and event streams are handled on the event loop (see app.asgi).
+"""
+from app import create_app
+from app.asgi import create_asgi_app
+
+app = create_asgi_app(create_app())
@@ -0,0 +1,20 @@
+"""Shared setup for the benchmarks."""
+from app import create_app
+
+
+class BenchmarkConfig:
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SECRET_KEY = "benchmark-secret-key-not-for-production-use"
+    JWT_SECRET_KEY = "benchmark-jwt-key-not-for-production-use!"
+    RATELIMIT_ENABLED = False
+    LOG_LEVEL = "WARNING"
+
+
+def create_benchmark_app(database_url: str = None):
+    """Create an app on in-memory SQLite, or on `database_url` if given."""
+    config = BenchmarkConfig
+    if database_url:
+        config = type("BenchmarkConfig", (BenchmarkConfig,), {"SQLALCHEMY_DATABASE_URI": database_url})
+    return create_app(config)
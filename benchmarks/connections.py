@@ -0,0 +1,122 @@
+"""
+Concurrent Connection Benchmark
+
+Measures how many concurrent event streams (/api/events) a running server
+holds open, and how fast it still answers GET /health meanwhile. Start the
+server in each mode with the same number of worker processes and point
+this at it, with rate limiting off (RATELIMIT_ENABLED=false), e.g.:
+
+    python run.py                                   # sync (WSGI)
+    uvicorn asgi:app --port 5000 --workers 2        # ASGI
+
+Usage:
+    python -m benchmarks.connections --url http://127.0.0.1:5000 [--streams N]
+
+Registers (or logs in) a benchmark user first. Uses only the standard
+library, so it also runs from a machine without the app's dependencies.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+
+EMAIL = "connections-benchmark@example.com"
+PASSWORD = "BenchmarkPass123"
+
+
+def post_json(url: str, payload: dict) -> dict:
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return json.loads(e.read() or b"{}")
+
+
+def get_token(base_url: str) -> str:
+    post_json(f"{base_url}/api/auth/register", {"name": "Benchmark", "email": EMAIL, "password": PASSWORD})
+    token = post_json(f"{base_url}/api/auth/login", {"email": EMAIL, "password": PASSWORD}).get("access_token")
+    if not token:
+        raise SystemExit("Could not log in the benchmark user")
+    return token
+
+
+async def open_stream(host: str, port: int, token: str, timeout: float):
+    """Open an event stream; returns the connection once the 200 header arrived, else None."""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        writer.write(
+            f"GET /api/events HTTP/1.1\r\nHost: {host}:{port}\r\nAuthorization: Bearer {token}\r\n"
+            f"Accept: text/event-stream\r\n\r\n".encode("ascii")
+        )
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    if b" 200 " not in status_line:
+        writer.close()
+        return None
+    return reader, writer
+
+
+async def health_latency_ms(host: str, port: int, samples: int, timeout: float) -> list:
+    """Latencies of GET /health over fresh connections; failed requests are left out."""
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            writer.write(f"GET /health HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n\r\n".encode("ascii"))
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout)
+            writer.close()
+        except (OSError, asyncio.TimeoutError):
+            continue
+        if b" 200 " in status_line:
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def run(base_url: str, streams: int, timeout: float, samples: int) -> None:
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    token = get_token(base_url)
+
+    baseline = await health_latency_ms(host, port, samples, timeout)
+    start = time.perf_counter()
+    opened = await asyncio.gather(*(open_stream(host, port, token, timeout) for _ in range(streams)))
+    connections = [connection for connection in opened if connection is not None]
+    open_seconds = time.perf_counter() - start
+    loaded = await health_latency_ms(host, port, samples, timeout)
+
+    print(f"streams requested:        {streams}")
+    print(f"streams open:             {len(connections)} (in {open_seconds:.1f} s)")
+    for label, latencies in (("idle", baseline), (f"with {len(connections)} streams", loaded)):
+        if latencies:
+            print(f"/health {label + ':':<21}{statistics.median(latencies):.1f} ms median, "
+                  f"{len(latencies)}/{samples} answered")
+        else:
+            print(f"/health {label + ':':<21}no answer within {timeout:.0f} s")
+
+    for _, writer in connections:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--streams", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.url.rstrip("/"), args.streams, args.timeout, args.samples))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Endpoint Benchmark Suite
+
+Seeds datasets of users x projects x tasks and measures, per endpoint,
+through the test client with production settings:
+
+- latency percentiles (p50, p90, p99, max) over --requests requests
+- SQL queries and database time per request (from Server-Timing)
+- peak memory allocated while handling one request (tracemalloc, in a
+  separate pass since tracing slows everything down)
+
+Endpoints: the projects page, a project's tasks, a user with projects
+and tasks, and login (PBKDF2, so --login-requests is kept small). The
+response cache is off unless --cache is given, so every request does
+the work. Results are saved as JSON; --compare prints the change between
+two result files.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.endpoints [--dataset 10x10x10 --dataset 100x20x50] [--output results.json]
+    python -m benchmarks.endpoints --compare before.json after.json
+"""
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import sqlalchemy
+from werkzeug.security import generate_password_hash
+
+from app import create_app
+from app.core.extensions import db
+from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.user import Users
+from benchmarks.common import BenchmarkConfig
+
+ROOT = Path(__file__).resolve().parent.parent
+PASSWORD = "BenchmarkPass123"
+SERVER_TIMING = re.compile(r'db;dur=(?P<db>[\d.]+).*queries;desc="(?P<queries>\d+)"')
+METRICS = ("p50_ms", "p99_ms", "queries", "db_ms", "peak_kib")
+
+
+def parse_dataset(value: str) -> tuple:
+    """'USERSxPROJECTSxTASKS' (projects per user, tasks per project) as a tuple of ints."""
+    try:
+        users, projects, tasks = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected USERSxPROJECTSxTASKS, got {value!r}")
+    return users, projects, tasks
+
+
+def seed(users: int, projects: int, tasks: int) -> None:
+    """Insert the dataset in bulk; every user shares one password hash (hashing is the slow part)."""
+    password = generate_password_hash(PASSWORD, method="pbkdf2:sha256:600000")
+    db.session.execute(db.insert(Users), [
+        {"name": f"User {i}", "email": f"user{i}@example.com", "password": password} for i in range(users)
+    ])
+    user_ids = db.session.execute(db.select(Users.id).order_by(Users.id)).scalars().all()
+    db.session.execute(db.insert(Projects), [
+        {"project_name": f"Project {i}", "description": "Benchmark", "user_id": user_id}
+        for user_id in user_ids for i in range(projects)
+    ])
+    project_ids = db.session.execute(db.select(Projects.id).order_by(Projects.id)).scalars().all()
+    due_date = date.today() + timedelta(days=7)
+    for start in range(0, len(project_ids), 1000):
+        db.session.execute(db.insert(Tasks), [
+            {"task_name": f"Task {i}", "description": "Benchmark", "due_date": due_date,
+             "status": "pending", "project_id": project_id}
+            for project_id in project_ids[start:start + 1000] for i in range(tasks)
+        ])
+    db.session.commit()
+
+
+def percentile(sorted_values: list, share: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * share))]
+
+
+def measure(client, method: str, url: str, requests: int, **kwargs) -> dict:
+    """Latency, queries and peak allocated memory of one endpoint."""
+    latencies, queries, db_ms = [], [], []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.open(url, method=method, **kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, f"{method} {url}: {response.status_code}"
+        timing = SERVER_TIMING.search(response.headers.get("Server-Timing", ""))
+        queries.append(int(timing["queries"]))
+        db_ms.append(float(timing["db"]))
+
+    tracemalloc.start()
+    client.open(url, method=method, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p90_ms": round(percentile(latencies, 0.90), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3),
+        "queries": max(queries),
+        "db_ms": round(statistics.median(db_ms), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_dataset(users: int, projects: int, tasks: int, args) -> dict:
+    config = type("EndpointBenchmarkConfig", (BenchmarkConfig,), {
+        "SERVER_TIMING": True,
+        "RESPONSE_CACHE_URL": "memory://" if args.cache else "none://",
+    })
+    app = create_app(config)
+    with app.app_context():
+        db.create_all()
+        seed(users, projects, tasks)
+        client = app.test_client()
+        client.environ_base["HTTP_X_FORWARDED_PROTO"] = "https"  # Production mode redirects plain HTTP
+        login = {"email": "user0@example.com", "password": PASSWORD}
+        token = client.post("/api/auth/login", json=login).get_json()["access_token"]
+        auth = {"Authorization": f"Bearer {token}"}
+        user_id = db.session.execute(db.select(Users.id).order_by(Users.id).limit(1)).scalar()
+        project_id = db.session.execute(
+            db.select(Projects.id).where(Projects.user_id == user_id).order_by(Projects.id).limit(1)
+        ).scalar()
+
+        endpoints = {
+            "GET /api/projects/": ("GET", "/api/projects/?per_page=100", args.requests, {"headers": auth}),
+            "GET /api/tasks/<id>/tasks": (
+                "GET", f"/api/tasks/{project_id}/tasks?per_page=100", args.requests, {"headers": auth}
+            ),
+            "GET /api/users/<id>": ("GET", f"/api/users/{user_id}", args.requests, {"headers": auth}),
+            "POST /api/auth/login": ("POST", "/api/auth/login", args.login_requests, {"json": login}),
+        }
+        results = {}
+        for name, (method, url, requests, kwargs) in endpoints.items():
+            results[name] = measure(client, method, url, requests, **kwargs)
+            print(f"  {name:<28}" + "".join(f"{results[name][key]:>12}" for key in METRICS))
+        db.drop_all()
+    return results
+
+
+def git_commit() -> str:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip() or "unknown"
+
+
+def compare(before_path: str, after_path: str) -> None:
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"before: {before['meta']['commit']} ({before['meta']['created']})")
+    print(f"after:  {after['meta']['commit']} ({after['meta']['created']})")
+    for dataset, endpoints in after["results"].items():
+        if dataset not in before["results"]:
+            continue
+        print(f"\n{dataset}{''.join(f'{key:>22}' for key in METRICS)}")
+        for name, new in endpoints.items():
+            old = before["results"][dataset].get(name)
+            if old is None:
+                continue
+            cells = []
+            for key in METRICS:
+                change = f"{(new[key] - old[key]) / old[key] * 100:+.0f}%" if old[key] else "n/a"
+                cells.append(f"{old[key]:>9} -> {new[key]:<7}{change:>5}")
+            print(f"  {name:<28}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dataset", type=parse_dataset, action="append",
+                        help="USERSxPROJECTSxTASKS, repeatable (default: 10x10x10 and 100x20x50)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--login-requests", type=int, default=5)
+    parser.add_argument("--cache", action="store_true", help="keep the response cache on")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    datasets = args.dataset or [(10, 10, 10), (100, 20, 50)]
+    results = {}
+    for users, projects, tasks in datasets:
+        name = f"{users}x{projects}x{tasks}"
+        print(f"{name} (users x projects x tasks){''.join(f'{key:>12}' for key in METRICS)}")
+        results[name] = run_dataset(users, projects, tasks, args)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "requests": args.requests,
+            "login_requests": args.login_requests,
+            "cache": args.cache,
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nSaved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
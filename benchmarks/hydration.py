@@ -0,0 +1,128 @@
+"""
+ORM Hydration Benchmark
+
+Compares the list endpoints' service calls loading full ORM instances
+("before") with the column-row selects they now use ("after"): wall time
+and peak traced memory (tracemalloc) per call. The session is cleared
+before every call so the identity map starts empty, as in a request.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.hydration [--tasks N] [--users N] [--repeat N]
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy.orm import joinedload
+
+from app.core.extensions import db
+from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.user import Users
+from app.schemas.project import ProjectWithTasks
+from app.schemas.task import TaskResponse
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+from benchmarks.common import create_benchmark_app
+
+PER_PAGE = 100  # db.paginate's max_per_page
+
+
+def seed(task_count: int, user_count: int):
+    """Create users, one of them owning PER_PAGE projects that share `task_count` tasks."""
+    db.session.execute(db.insert(Users), [
+        {"name": f"User {i}", "email": f"user{i}@example.com", "password": "x"} for i in range(user_count)
+    ])
+    owner_id = db.session.execute(db.select(Users.id).order_by(Users.id).limit(1)).scalar()
+    db.session.execute(db.insert(Projects), [
+        {"project_name": f"Project {i}", "description": "Benchmark", "user_id": owner_id}
+        for i in range(PER_PAGE)
+    ])
+    project_ids = db.session.execute(db.select(Projects.id).order_by(Projects.id)).scalars().all()
+    due_date = date.today() + timedelta(days=7)
+    db.session.execute(db.insert(Tasks), [
+        {"task_name": f"Task {i}", "description": "Benchmark", "due_date": due_date,
+         "status": "pending", "project_id": project_ids[i % len(project_ids)]}
+        for i in range(task_count)
+    ])
+    db.session.commit()
+    return owner_id, project_ids[0]
+
+
+def orm_tasks(project_id: int):
+    tasks = db.session.execute(
+        db.select(Tasks).join(Projects, Tasks.project_id == Projects.id)
+        .where(Tasks.project_id == project_id).order_by(Tasks.id)
+    ).scalars()
+    return [TaskResponse.dump_orm_task(task) for task in tasks]
+
+
+def orm_projects(user_id: int):
+    pagination = db.paginate(
+        db.select(Projects).where(Projects.user_id == user_id).order_by(Projects.id),
+        page=1, per_page=PER_PAGE, error_out=False
+    )
+    return [ProjectWithTasks.dump_orm_project(project) for project in pagination.items]
+
+
+def orm_users():
+    pagination = Users.query.options(joinedload(Users.projects)).paginate(
+        page=1, per_page=PER_PAGE, error_out=False
+    )
+    return [
+        {"user_id": user.id, "name": user.name, "email": user.email,
+         "created_at": str(user.created_at), "update_at": str(user.update_at)}
+        for user in pagination.items
+    ]
+
+
+def measure(func, repeat: int):
+    """Best wall time in ms and peak traced KiB of one call."""
+    timings = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    db.session.expunge_all()
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return min(timings) * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        user_id, project_id = seed(args.tasks, args.users)
+        cases = [
+            (f"tasks of a project ({args.tasks // PER_PAGE})",
+             lambda: orm_tasks(project_id), lambda: TaskService.get_tasks_by_project(project_id)),
+            (f"projects page ({PER_PAGE}, {args.tasks} tasks)",
+             lambda: orm_projects(user_id),
+             lambda: ProjectService.get_user_projects(str(user_id), 1, PER_PAGE)["data"]),
+            (f"users page ({PER_PAGE})",
+             orm_users, lambda: UserService.get_all_users(1, PER_PAGE)["data"]),
+        ]
+
+        print(f"{'listing':<34}{'before ms':>11}{'after ms':>10}{'before KiB':>12}{'after KiB':>11}")
+        for name, before, after in cases:
+            before_ms, before_kib = measure(before, args.repeat)
+            after_ms, after_kib = measure(after, args.repeat)
+            print(f"{name:<34}{before_ms:>11.1f}{after_ms:>10.1f}{before_kib:>12.0f}{after_kib:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Import Throughput Benchmark
+
+Generates an NDJSON file of projects and tasks and measures sustained
+rows per second through ImportService: parsing, validation and chunked
+inserts. On in-memory SQLite this exercises the executemany path; pass
+--database-url with a scratch PostgreSQL database to exercise COPY.
+The tables are created and dropped, so never point it at real data.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.imports [--tasks N] [--chunk-size N] [--database-url URL]
+"""
+import argparse
+import io
+import json
+import time
+from datetime import date, timedelta
+
+from app.core.extensions import db
+from app.models.user import Users
+from app.services.import_service import ImportService
+from benchmarks.common import create_benchmark_app
+
+
+def generate(task_count: int, tasks_per_project: int = 100) -> str:
+    """An export-format NDJSON document with the given number of tasks."""
+    due_date = (date.today() + timedelta(days=30)).isoformat()
+    lines = []
+    for index in range(task_count):
+        project_id = index // tasks_per_project + 1
+        if index % tasks_per_project == 0:
+            lines.append(json.dumps({"type": "project", "id": project_id, "project_name": f"Project {project_id}"}))
+        lines.append(json.dumps({
+            "type": "task", "project_id": project_id, "task_name": f"Task {index}",
+            "description": "Imported by the benchmark", "due_date": due_date, "status": "pending",
+        }))
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    document = generate(args.tasks)
+    row_count = document.count("\n")
+    app = create_benchmark_app(args.database_url)
+    with app.app_context():
+        dialect = db.engine.dialect.name
+        db.create_all()
+        try:
+            user = Users(name="Bench", email="bench@example.com", password="x")
+            db.session.add(user)
+            db.session.commit()
+
+            start = time.perf_counter()
+            success, message, summary = ImportService.import_rows(
+                user.id, ImportService.parse(io.StringIO(document), "ndjson"), chunk_size=args.chunk_size
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+    print(f"{message}: {summary['projects_imported']} projects, {summary['tasks_imported']} tasks, "
+          f"{summary['error_count']} errors")
+    print(f"{row_count} rows in {elapsed:.2f}s = {row_count / elapsed:,.0f} rows/s on {dialect}")
+
+
+if __name__ == "__main__":
+    main()
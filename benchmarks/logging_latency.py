@@ -0,0 +1,91 @@
+"""
+Logging Latency Benchmark
+
+Compares request latency (p50/p99) when the log destination is slow,
+with a synchronous handler writing on the request thread (the previous
+setup) against the queued pipeline, where a listener thread does the
+writing. Every request writes its access log line; each write to the
+simulated disk takes --disk-ms, with a stall of --stall-ms every
+--stall-every writes.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.logging_latency [--requests N] [--disk-ms MS]
+"""
+import argparse
+import io
+import logging
+import statistics
+import time
+
+from app import create_app
+from app.core import logger as logger_module
+from app.core.logger import logging_stats
+from benchmarks.common import BenchmarkConfig
+
+
+class SlowDisk(io.StringIO):
+    """A log file whose writes block like a saturated disk."""
+
+    def __init__(self, delay: float, stall: float, stall_every: int):
+        super().__init__()
+        self.delay, self.stall, self.stall_every = delay, stall, stall_every
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        time.sleep(self.stall if self.writes % self.stall_every == 0 else self.delay)
+        return super().write(text)
+
+
+def build(variant: str, disk: SlowDisk):
+    config = type("LoggingBenchmarkConfig", (BenchmarkConfig,), {"LOG_LEVEL": "INFO"})
+    app = create_app(config)
+    pipeline = logger_module._pipeline
+    file_handler = pipeline.handlers[-1]
+    if variant == "queued":
+        file_handler.setStream(disk)
+        pipeline.handlers = [file_handler]  # keep the console quiet
+    else:
+        synchronous = logging.StreamHandler(disk)
+        synchronous.setFormatter(file_handler.formatter)
+        root = logging.getLogger()
+        root.removeHandler(pipeline.queue_handler)
+        root.addHandler(synchronous)
+    return app
+
+
+def measure(app, requests: int) -> list:
+    client = app.test_client()
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get("/ready", headers={"X-Forwarded-Proto": "https"})
+        response.close()  # the access log line is written here
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.status_code
+    return sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--disk-ms", type=float, default=1.0)
+    parser.add_argument("--stall-ms", type=float, default=50.0)
+    parser.add_argument("--stall-every", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests; disk write {args.disk_ms} ms, {args.stall_ms} ms stall "
+          f"every {args.stall_every} writes")
+    print(f"{'':<14}{'p50':>9}{'p99':>10}{'max':>10}  dropped")
+    for variant in ("synchronous", "queued"):
+        disk = SlowDisk(args.disk_ms / 1000, args.stall_ms / 1000, args.stall_every)
+        latencies = measure(build(variant, disk), args.requests)
+        p50 = statistics.median(latencies)
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        dropped = logging_stats()["dropped"] if variant == "queued" else "-"
+        print(f"{variant:<14}{p50:>7.2f}ms{p99:>8.2f}ms{latencies[-1]:>8.2f}ms  {dropped}")
+        logging.getLogger().handlers.clear()
+
+
+if __name__ == "__main__":
+    main()
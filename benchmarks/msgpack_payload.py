@@ -0,0 +1,73 @@
+"""
+MessagePack vs JSON Benchmark
+
+Encodes the task list response for N tasks through `generate_response`
+with `Accept: application/json` and `Accept: application/msgpack`, and
+reports body size (plain and gzipped), server-side encode time and
+client-side decode time. Needs the msgpack package.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.msgpack_payload [--tasks N] [--repeat N]
+"""
+import argparse
+import gzip
+import json
+import time
+from datetime import date, datetime, timedelta
+
+from app.common.response_util import generate_response
+from app.core import msgpack_codec
+from benchmarks.common import create_benchmark_app
+
+
+def make_tasks(count: int) -> list:
+    """Task dicts shaped like TaskService.get_tasks_by_project rows."""
+    now = datetime(2030, 1, 1, 12, 0, 0)
+    due_date = date(2030, 1, 1) + timedelta(days=7)
+    return [
+        {"task_id": i, "task_name": f"Task {i}", "description": "Benchmark task description",
+         "due_date": due_date, "status": "pending", "project_id": 1, "created_at": now, "update_at": now}
+        for i in range(count)
+    ]
+
+
+def best_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if not msgpack_codec.is_available():
+        raise SystemExit("msgpack is not installed")
+    import msgpack
+
+    app = create_benchmark_app()
+    tasks = make_tasks(args.tasks)
+    decoders = {
+        "application/json": json.loads,
+        "application/msgpack": lambda body: msgpack.unpackb(body, timestamp=3),
+    }
+
+    print(f"{args.tasks} tasks")
+    print(f"{'format':<22}{'bytes':>11}{'gzipped':>11}{'encode ms':>11}{'decode ms':>11}")
+    for mimetype, decode in decoders.items():
+        with app.test_request_context(headers={"Accept": mimetype}):
+            def encode():
+                return generate_response(True, "Tasks retrieved successfully", tasks)[0].get_data()
+
+            body = encode()
+            encode_ms = best_ms(encode, args.repeat)
+        decode_ms = best_ms(lambda: decode(body), args.repeat)
+        print(f"{mimetype:<22}{len(body):>11}{len(gzip.compress(body)):>11}{encode_ms:>11.1f}{decode_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
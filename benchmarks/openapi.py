@@ -0,0 +1,86 @@
+"""
+OpenAPI Spec Benchmark
+
+Compares app startup and /apispec.json latency with the spec built by
+flasgger at runtime (in debug mode it is rebuilt on every hit) against
+the precomputed file, with and without the Swagger UI. Each startup is
+measured in a fresh interpreter, imports included.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.openapi [--runs N] [--requests N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from app.core.openapi import write_spec
+from benchmarks.common import create_benchmark_app
+
+ROOT = Path(__file__).resolve().parent.parent
+
+VARIANTS = {
+    "runtime (debug)": {"spec": False, "ui": True, "debug": True},
+    "runtime": {"spec": False, "ui": True, "debug": False},
+    "precomputed + UI": {"spec": True, "ui": True, "debug": False},
+    "precomputed, no UI": {"spec": True, "ui": False, "debug": False},
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+from benchmarks.common import BenchmarkConfig
+
+class Config(BenchmarkConfig):
+    DEBUG = sys.argv[3] == "1"
+    OPENAPI_SPEC_FILE = sys.argv[1] or None
+    SWAGGER_UI = sys.argv[2] == "1"
+
+app = create_app(Config)
+startup = time.perf_counter() - start
+client = app.test_client()
+latencies = []
+for _ in range(int(sys.argv[4])):
+    start = time.perf_counter()
+    response = client.get("/apispec.json", base_url="https://localhost", headers={"Accept-Encoding": "gzip"})
+    latencies.append(time.perf_counter() - start)
+    assert response.status_code == 200, response.status_code
+print(json.dumps({"startup": startup, "latencies": latencies, "flasgger": "flasgger" in sys.modules}))
+"""
+
+
+def probe(spec_path: str, variant: dict, requests: int) -> dict:
+    args = [spec_path if variant["spec"] else "", str(int(variant["ui"])), str(int(variant["debug"])), str(requests)]
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        spec_path = os.path.join(directory, "openapi.json")
+        size = write_spec(create_benchmark_app(), spec_path)
+        print(f"spec: {size:,} bytes; startup median of {args.runs} runs, {args.requests} requests each")
+        print(f"{'':<20}{'startup':>10}{'1st hit':>10}{'later hits':>12}  flasgger")
+        for name, variant in VARIANTS.items():
+            results = [probe(spec_path, variant, args.requests) for _ in range(args.runs)]
+            startup = statistics.median(result["startup"] for result in results) * 1000
+            first = statistics.median(result["latencies"][0] for result in results) * 1000
+            later = statistics.median(t for result in results for t in result["latencies"][1:]) * 1000
+            loaded = "imported" if results[0]["flasgger"] else "not imported"
+            print(f"{name:<20}{startup:>8.0f}ms{first:>8.1f}ms{later:>10.2f}ms  {loaded}")
+
+
+if __name__ == "__main__":
+    main()
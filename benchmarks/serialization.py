@@ -0,0 +1,93 @@
+"""
+JSON Serialization Benchmark
+
+Encodes a list of tasks into the `{success, message, data}` response the
+task list endpoint returns, along the old path (Pydantic model, then
+`model_dump()`, then the stdlib JSON provider) and the new one (direct row
+dicts, then the orjson provider). Rows are loaded once up front so only
+serialization is timed.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.serialization [--tasks N] [--repeat N]
+"""
+import argparse
+import json
+import time
+from datetime import date, timedelta
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.common.response_util import generate_response
+from app.core.extensions import db
+from app.core.json_provider import OrjsonProvider
+from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.user import Users
+from app.schemas.task import TaskResponse
+from benchmarks.common import create_benchmark_app
+
+
+def seed(task_count: int) -> int:
+    """Create one user with a project holding `task_count` tasks."""
+    user = Users(name="Bench", email="bench@example.com", password="x")
+    db.session.add(user)
+    db.session.flush()
+    project = Projects(project_name="Bench", description="Benchmark", user_id=user.id)
+    db.session.add(project)
+    db.session.flush()
+    due_date = date.today() + timedelta(days=7)
+    db.session.execute(db.insert(Tasks), [
+        {"task_name": f"Task {i}", "description": "Benchmark", "due_date": due_date,
+         "status": "pending", "project_id": project.id}
+        for i in range(task_count)
+    ])
+    db.session.commit()
+    return project.id
+
+
+def best_ms(func, repeat: int) -> float:
+    """Fastest of `repeat` runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        project_id = seed(args.tasks)
+        tasks = db.session.execute(db.select(Tasks).where(Tasks.project_id == project_id)).scalars().all()
+
+        def old_path():
+            app.json = DefaultJSONProvider(app)
+            data = [TaskResponse.from_orm_task(task).model_dump() for task in tasks]
+            return generate_response(True, "Tasks retrieved successfully", data)[0].get_data()
+
+        def new_path():
+            app.json = OrjsonProvider(app)
+            data = [TaskResponse.dump_orm_task(task) for task in tasks]
+            return generate_response(True, "Tasks retrieved successfully", data)[0].get_data()
+
+        old_body, new_body = old_path(), new_path()
+        assert json.loads(old_body) == json.loads(new_body), "paths disagree"
+
+        old_ms = best_ms(old_path, args.repeat)
+        new_ms = best_ms(new_path, args.repeat)
+        print(f"{args.tasks} tasks, {len(new_body) / 1024:.0f} KiB response")
+        print(f"{'path':<44}{'ms':>10}")
+        print(f"{'model_dump + stdlib json (before)':<44}{old_ms:>10.1f}")
+        print(f"{'direct dicts + orjson (after)':<44}{new_ms:>10.1f}")
+        print(f"speedup: {old_ms / new_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
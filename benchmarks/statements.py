@@ -0,0 +1,114 @@
+"""
+Statement Caching Microbenchmark
+
+Measures the Python-side cost per call of the hot lookups: built through
+the legacy Query API on every call ("before") versus the prebuilt
+statements the services now use ("after"). Runs on in-memory SQLite so
+database time is negligible next to statement construction and compiling.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.statements [--iterations N]
+"""
+import argparse
+import time
+import warnings
+from datetime import date, timedelta
+
+from app.core.extensions import db
+from app.models.project import Projects
+from app.models.task import Tasks
+from app.models.token_blocklist import TokenBlocklist
+from app.models.user import Users
+from app.services.task_service import TaskService, _PROJECT_TASK_ROWS
+from benchmarks.common import create_benchmark_app
+
+
+def seed(task_count: int = 20):
+    """Create one user with a project, its tasks and a revoked token."""
+    user = Users(name="Bench", email="bench@example.com", password="x")
+    db.session.add(user)
+    db.session.flush()
+    project = Projects(project_name="Bench", description="Benchmark", user_id=user.id)
+    db.session.add(project)
+    db.session.flush()
+    due_date = date.today() + timedelta(days=7)
+    db.session.add_all(
+        Tasks(task_name=f"Task {i}", description="Benchmark", due_date=due_date,
+              status="pending", project_id=project.id)
+        for i in range(task_count)
+    )
+    db.session.add(TokenBlocklist(jti="0" * 36, token_type="access", user_id=user.id))
+    db.session.commit()
+    return user.id, project.id
+
+
+def per_call_us(func, iterations: int) -> float:
+    """Average microseconds per call after a short warm-up."""
+    for _ in range(min(iterations, 100)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def cases(user_id: int, project_id: int):
+    """(name, before, after) pairs for each hot lookup."""
+    return [
+        (
+            "project ownership check",
+            lambda: Projects.query.filter_by(id=project_id, user_id=user_id).first() is not None,
+            lambda: Projects.is_owned_by(project_id, user_id),
+        ),
+        (
+            "token blocklist lookup",
+            lambda: TokenBlocklist.query.filter_by(jti="1" * 36).first() is not None,
+            lambda: TokenBlocklist.is_token_revoked("1" * 36),
+        ),
+        (
+            "task listing",
+            lambda: db.session.execute(
+                db.select(Tasks)
+                .join(Projects, Tasks.project_id == Projects.id)
+                .filter(Tasks.project_id == project_id)
+                .order_by(Tasks.id)
+            ).scalars().all(),
+            lambda: db.session.execute(_PROJECT_TASK_ROWS, {"project_id": project_id}).all(),
+        ),
+        (
+            "task list version",
+            lambda: db.session.execute(
+                db.select(Users.data_version)
+                .join(Projects, Projects.user_id == Users.id)
+                .where(Projects.id == project_id, Users.id == user_id)
+            ).scalar(),
+            lambda: TaskService.get_tasks_version(str(user_id), project_id),
+        ),
+        (
+            "user by id",
+            lambda: Users.query.get(user_id),
+            lambda: db.session.get(Users, user_id),
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")  # Query.get() is deprecated; that's the point
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        user_id, project_id = seed()
+
+        print(f"{'query':<26}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+        for name, before, after in cases(user_id, project_id):
+            before_us = per_call_us(before, args.iterations)
+            after_us = per_call_us(after, args.iterations)
+            print(f"{name:<26}{before_us:>14.1f}{after_us:>14.1f}{before_us / after_us:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
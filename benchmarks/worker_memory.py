@@ -0,0 +1,123 @@
+"""
+Worker Memory Benchmark
+
+Starts gunicorn with gunicorn.conf.py three ways - each worker importing
+the app itself, the app preloaded in the master, and preloaded with
+gc.freeze() before forking - sends the same requests to each, and reports
+the memory of every worker: RSS, PSS (its fair share of pages shared with
+other processes), and how much of it is still shared or already private.
+The total PSS is what the server really costs.
+
+Usage (with the app's environment, e.g. .env, in place):
+    python -m benchmarks.worker_memory [--workers N] [--requests N]
+
+Needs gunicorn and Linux (/proc/<pid>/smaps_rollup).
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.core.process import memory_usage
+
+ROOT = Path(__file__).resolve().parent.parent
+
+VARIANTS = {
+    "no preload": {"GUNICORN_PRELOAD": "false", "GUNICORN_GC_FREEZE": "false"},
+    "preload": {"GUNICORN_PRELOAD": "true", "GUNICORN_GC_FREEZE": "false"},
+    "preload + gc.freeze": {"GUNICORN_PRELOAD": "true", "GUNICORN_GC_FREEZE": "true"},
+}
+# No database needed: the spec is the largest response and allocates the most
+PATHS = ("/apispec.json", "/health")
+
+
+def get(url: str) -> None:
+    # As from a TLS-terminating proxy, so production mode doesn't redirect to https
+    request = urllib.request.Request(url, headers={"X-Forwarded-Proto": "https"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+    except urllib.error.HTTPError:
+        pass
+
+
+def wait_until_up(url: str, process: subprocess.Popen, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"gunicorn exited with status {process.returncode}")
+        try:
+            get(url)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit("gunicorn did not start in time")
+
+
+def worker_pids(master_pid: int) -> list:
+    with open(f"/proc/{master_pid}/task/{master_pid}/children") as children:
+        return [int(pid) for pid in children.read().split()]
+
+
+def measure(overrides: dict, workers: int, requests: int, port: int) -> dict:
+    env = {
+        **os.environ,
+        **overrides,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_MAX_REQUESTS": "0",
+        "GUNICORN_LOG_LEVEL": "warning",
+        "RATELIMIT_ENABLED": "false",
+    }
+    base_url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "run:app"], cwd=ROOT, env=env
+    )
+    try:
+        wait_until_up(f"{base_url}/health", process)
+        # Let every worker finish booting before the first measurement
+        time.sleep(2)
+        booted = {pid: memory_usage(pid) for pid in worker_pids(process.pid)}
+
+        with ThreadPoolExecutor(workers * 4) as pool:
+            list(pool.map(get, (f"{base_url}{PATHS[i % len(PATHS)]}" for i in range(requests))))
+        served = {pid: memory_usage(pid) for pid in worker_pids(process.pid)}
+        master = memory_usage(process.pid)
+    finally:
+        process.terminate()
+        process.wait(30)
+    return {"master": master, "booted": booted, "served": served}
+
+
+def average(usages: dict, key: str) -> float:
+    return sum(usage[key] for usage in usages.values()) / len(usages) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--port", type=int, default=5077)
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {args.requests} requests; per-worker averages in MiB")
+    print(f"{'':<22}{'':<8}{'RSS':>8}{'PSS':>8}{'shared':>8}{'private':>8}{'total PSS':>11}")
+    for name, overrides in VARIANTS.items():
+        result = measure(overrides, args.workers, args.requests, args.port)
+        for phase in ("booted", "served"):
+            workers = result[phase]
+            total_pss = (sum(usage["pss"] for usage in workers.values()) + result["master"]["pss"]) / 1024
+            print(
+                f"{name if phase == 'booted' else '':<22}{phase:<8}"
+                + "".join(f"{average(workers, key):>8.1f}" for key in ("rss", "pss", "shared", "private"))
+                + f"{total_pss:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
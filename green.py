@@ -0,0 +1,26 @@
+"""
+Cooperative (gevent) Entry Point
+
+Serves the app from gevent greenlets, thousands of connections per process:
+
+    python green.py                                              # one process
+    gunicorn -k gevent -w 4 --worker-connections 2000 green:app
+
+The standard library is patched first thing, before the app or any
+library imports socket, ssl or threading; see app.core.green.
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import create_app  # noqa: E402
+from app.core.green import check_patched, patch  # noqa: E402
+
+patch()  # psycopg2's wait callback
+check_patched()
+app = create_app()
+
+if __name__ == "__main__":
+    from gevent.pywsgi import WSGIServer
+
+    WSGIServer(("0.0.0.0", 5000), app, log=None).serve_forever()
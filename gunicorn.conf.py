@@ -0,0 +1,118 @@
+"""
+Production Server Configuration (gunicorn)
+
+    gunicorn -c gunicorn.conf.py run:app
+
+- Workers: WEB_CONCURRENCY, by default 2 x usable cores + 1.
+- The app is imported once in the master (preload) and the workers are
+  forked from it. Right before forking, the imported objects are moved
+  out of the garbage collector's reach with gc.freeze(): a collection in
+  a worker would otherwise write to every object's header and turn the
+  shared copy-on-write pages into private copies.
+- Workers are recycled after GUNICORN_MAX_REQUESTS requests (with jitter,
+  so they don't all restart at once), which bounds slow leaks.
+- SIGHUP reloads gracefully: new workers start from the preloaded app
+  and old ones finish their requests (GUNICORN_GRACEFUL_TIMEOUT). Code
+  changes need a restart of the master, as the app is preloaded.
+- Every worker logs its memory when it boots and when it exits, split
+  into memory still shared with the master and private memory.
+- Workers write their Prometheus metrics to PROMETHEUS_MULTIPROC_DIR
+  (default: a directory under the temp dir, cleared at startup), so
+  /metrics on any worker reports all of them.
+
+The gevent mode runs with GUNICORN_WORKER_CLASS=gevent and green:app.
+"""
+import gc
+import os
+import tempfile
+
+
+def _usable_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS
+        return os.cpu_count() or 1
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * _usable_cores() + 1))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+preload_app = _env_flag("GUNICORN_PRELOAD", True)
+gc_freeze = _env_flag("GUNICORN_GC_FREEZE", True)
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Set for the master before it preloads the app, so prometheus_client starts in multiprocess mode
+metrics_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR") or os.path.join(tempfile.gettempdir(), "todo-api-metrics")
+raw_env = [f"PROMETHEUS_MULTIPROC_DIR={metrics_dir}"]
+
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def _memory_line() -> str:
+    # Imported late: the config file is read before green.py gets to monkey-patch
+    from app.core.process import memory_usage
+
+    return ", ".join(f"{key}={value // 1024} MiB" for key, value in memory_usage().items())
+
+
+def on_starting(server):
+    # Files left by a previous run would be summed into this one's metrics
+    os.makedirs(metrics_dir, exist_ok=True)
+    for name in os.listdir(metrics_dir):
+        if not name.endswith(f"_{os.getpid()}.db"):  # the preloaded master's own
+            os.remove(os.path.join(metrics_dir, name))
+
+
+def when_ready(server):
+    # Without preload, importing the app here would only inflate the master
+    memory = _memory_line() if preload_app else "app not preloaded"
+    server.log.info("Master ready: %d workers (%s), %s", workers, worker_class, memory)
+
+
+def pre_fork(server, worker):
+    if preload_app and gc_freeze:
+        # Collect first so no garbage ends up in the permanent generation
+        gc.collect()
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    from app.core.process import reset_after_fork
+
+    app = server.app.wsgi() if preload_app else None
+    if hasattr(app, "extensions"):
+        reset_after_fork(app)
+    worker.log.info("Worker %s booted: %s", worker.pid, _memory_line())
+
+
+def worker_exit(server, worker):
+    server.log.info(
+        "Worker %s exiting after %d requests: %s", worker.pid, worker.nr, _memory_line()
+    )
+
+
+def child_exit(server, worker):
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    # Drops the worker's gauges (in-flight requests, pool size...); its counters keep counting
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def on_reload(server):
+    server.log.info("SIGHUP: replacing workers gracefully")
@@ -0,0 +1,40 @@
+"""Add pg_trgm indexes for project and task name search
+
+Revision ID: 9c3e5a7d2f41
+Revises: 1554f2b83b9f
+Create Date: 2026-10-19 09:12:31.508214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3e5a7d2f41'
+down_revision = '1554f2b83b9f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Trigram indexes only exist on PostgreSQL; other backends fall back to a scan
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_projects_project_name_trgm '
+        'ON projects USING gin (lower(project_name) gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_tasks_task_name_trgm '
+        'ON tasks USING gin (lower(task_name) gin_trgm_ops)'
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_tasks_task_name_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_projects_project_name_trgm')
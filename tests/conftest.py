@@ -4,7 +4,11 @@ Test Configuration and Fixtures
 Provides pytest fixtures for testing the Flask application.
 """
 import pytest
-from typing import Dict, Generator
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, Generator, List
+
+from sqlalchemy import event
 
 from app import create_app
 from app.core.extensions import db
@@ -115,6 +119,42 @@ def get_auth_headers(client, email: str = "test@example.com",
     return {"Authorization": f"Bearer {token}"}
 
 
+def create_project(client, headers, name: str = "Project") -> int:
+    """
+    Helper function to create a project through the API.
+
+    Returns:
+        ID of the new project
+    """
+    response = client.post(
+        "/api/projects/",
+        json={"project_name": name, "description": "Test project"},
+        headers=headers
+    )
+    return response.get_json()["data"]["project_id"]
+
+
+def create_task(client, headers, project_id: int, name: str = "Task") -> int:
+    """
+    Helper function to create a task due in a week through the API.
+
+    Returns:
+        ID of the new task
+    """
+    response = client.post(
+        "/api/tasks/task",
+        json={
+            "task_name": name,
+            "description": "Test task",
+            "due_date": (date.today() + timedelta(days=7)).isoformat(),
+            "status": "pending",
+            "project_id": project_id
+        },
+        headers=headers
+    )
+    return response.get_json()["data"]["task_id"]
+
+
 @pytest.fixture
 def auth_headers(client) -> Dict[str, str]:
     """
@@ -140,3 +180,75 @@ def second_user_headers(client) -> Dict[str, str]:
         password="SecondPass123"
     )
     return get_auth_headers(client, "second@example.com", "SecondPass123")
+
+
+def seed_projects(email: str, count: int, tasks_per_project: int = 3) -> List[int]:
+    """
+    Helper function to insert projects with tasks for a registered user,
+    straight into the database (much faster than the API for many rows).
+
+    Returns:
+        IDs of the new projects
+    """
+    user = Users.query.filter_by(email=email).one()
+    projects = [
+        Projects(
+            project_name=f"Seeded {i}",
+            description="Seeded project",
+            user_id=user.id,
+            tasks=[Tasks(task_name=f"Task {j}", status="todo") for j in range(tasks_per_project)],
+        )
+        for i in range(count)
+    ]
+    db.session.add_all(projects)
+    db.session.commit()
+    return [project.id for project in projects]
+
+
+class QueryLog:
+    """SQL statements run while counting."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def report(self) -> str:
+        return "\n".join(f"  {i}. {statement}" for i, statement in enumerate(self.statements, 1))
+
+
+@contextmanager
+def count_queries(engine) -> Generator[QueryLog, None, None]:
+    """Record every statement the engine runs inside the block."""
+    log = QueryLog()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        log.statements.append(" ".join(statement.split()))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield log
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def query_budget(app):
+    """
+    Fixture asserting that a block (typically one request) runs at most
+    `budget` SQL statements; a failure lists the statements.
+
+    Usage:
+        with query_budget(3):
+            client.get("/api/projects/", headers=auth_headers)
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        with count_queries(db.engine) as log:
+            yield log
+        assert len(log) <= max_queries, (
+            f"{len(log)} queries, over the budget of {max_queries}:\n{log.report()}"
+        )
+
+    return budget
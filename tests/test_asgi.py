@@ -0,0 +1,115 @@
+"""
+ASGI Mode Tests
+
+Tests for serving the app through app.asgi, driven with in-process ASGI
+messages.
+"""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("asgiref")
+
+from flask_jwt_extended import decode_token  # noqa: E402
+
+from app.asgi import create_asgi_app  # noqa: E402
+from app.core.events import get_broker  # noqa: E402
+
+
+class ASGIClient:
+    """Sends one request to an ASGI app and records what it sends back."""
+
+    def __init__(self, asgi_app, method: str, path: str, headers: dict, body: bytes = b""):
+        self.scope = {
+            "type": "http", "http_version": "1.1", "method": method, "path": path, "root_path": "",
+            "query_string": b"", "scheme": "http", "server": ("testserver", 80), "client": ("127.0.0.1", 1234),
+            "headers": [(name.lower().encode("latin1"), value.encode("latin1")) for name, value in headers.items()],
+        }
+        self.asgi_app = asgi_app
+        self.body = body
+        self.messages: "asyncio.Queue[dict]" = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self._sent_body = False
+
+    async def receive(self) -> dict:
+        if not self._sent_body:
+            self._sent_body = True
+            return {"type": "http.request", "body": self.body, "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message: dict) -> None:
+        await self.messages.put(message)
+
+    def start(self) -> "asyncio.Task":
+        return asyncio.ensure_future(self.asgi_app(self.scope, self.receive, self.send))
+
+    async def next_message(self, timeout: float = 5) -> dict:
+        return await asyncio.wait_for(self.messages.get(), timeout)
+
+
+def run(coroutine):
+    return asyncio.new_event_loop().run_until_complete(coroutine)
+
+
+class TestASGIApp:
+    """Tests for the ASGI wrapper."""
+
+    def test_regular_request_runs_the_flask_app(self, app, auth_headers):
+        """Test that ordinary requests go through the WSGI app unchanged."""
+        asgi_app = create_asgi_app(app)
+
+        async def scenario():
+            client = ASGIClient(asgi_app, "GET", "/api/projects/", auth_headers)
+            await client.start()
+            start, body = await client.next_message(), b""
+            while True:
+                message = await client.next_message()
+                body += message.get("body", b"")
+                if not message.get("more_body"):
+                    return start, body
+
+        start, body = run(scenario())
+        assert start["status"] == 200
+        assert json.loads(body)["success"] is True
+
+    def test_event_stream_is_served_on_the_loop(self, app, auth_headers):
+        """Test that /api/events streams from the loop and unsubscribes on disconnect."""
+        asgi_app = create_asgi_app(app)
+        user_id = decode_token(auth_headers["Authorization"].split()[1])["sub"]
+        broker = get_broker()
+
+        async def scenario():
+            client = ASGIClient(asgi_app, "GET", "/api/events", auth_headers)
+            task = client.start()
+            start = await client.next_message()
+            assert start["status"] == 200
+            assert (b"content-type", b"text/event-stream; charset=utf-8") in start["headers"]
+            assert broker.subscriber_count() == 1
+
+            # Published from another thread, as after a commit in a request
+            await asyncio.get_running_loop().run_in_executor(
+                None, broker.publish, user_id, {"type": "project.created", "id": 7}
+            )
+            message = await client.next_message()
+            assert message["more_body"] is True
+            assert message["body"].startswith(b"event: project.created\n")
+
+            client.disconnected.set()
+            await asyncio.wait_for(task, 5)
+
+        run(scenario())
+        assert broker.subscriber_count() == 0
+
+    def test_rejected_event_stream_is_a_normal_response(self, app):
+        """Test that an unauthenticated stream request gets the view's 401."""
+        asgi_app = create_asgi_app(app)
+
+        async def scenario():
+            client = ASGIClient(asgi_app, "GET", "/api/events", {})
+            await client.start()
+            return await client.next_message()
+
+        assert run(scenario())["status"] == 401
+        assert get_broker().subscriber_count() == 0
@@ -1,10 +1,13 @@
 """
 Authentication API Tests
 
-Tests for user registration and login endpoints.
+Tests for user registration and login endpoints, and the query
+budgets of the account endpoints.
 """
 import pytest
 
+from tests.conftest import seed_projects
+
 
 class TestRegistration:
     """Tests for POST /api/auth/register endpoint."""
@@ -142,3 +145,46 @@ class TestLogin:
         assert response.status_code == 422
         data = response.get_json()
         assert data["success"] is False
+
+
+class TestQueryBudget:
+    """Tests that the account endpoints run a fixed number of queries, however many rows exist."""
+
+    def test_register(self, client, query_budget):
+        """Test that registering is a single insert."""
+        with query_budget(1):
+            response = client.post("/api/auth/register", json={
+                "name": "John Doe",
+                "email": "john@example.com",
+                "password": "SecurePass123"
+            })
+
+        assert response.status_code == 201
+
+    @pytest.mark.parametrize("projects", [1, 10, 100])
+    def test_login_and_refresh(self, client, auth_headers, query_budget, projects):
+        """Test that login and refresh don't touch the user's projects."""
+        seed_projects("test@example.com", projects)
+
+        with query_budget(1):
+            response = client.post("/api/auth/login", json={
+                "email": "test@example.com",
+                "password": "SecurePass123"
+            })
+        assert response.status_code == 200
+
+        refresh_token = response.get_json()["refresh_token"]
+        with query_budget(2):
+            response = client.post("/api/auth/refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("projects", [1, 10, 100])
+    def test_get_user_with_projects(self, client, auth_headers, query_budget, projects):
+        """Test GET /api/users/{id}, which nests every project with its tasks."""
+        seed_projects("test@example.com", projects)
+
+        with query_budget(6):
+            response = client.get("/api/users/1", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert len(response.get_json()["data"]["project_list"]) == projects
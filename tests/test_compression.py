@@ -0,0 +1,90 @@
+"""
+Response Compression Tests
+
+Tests for Accept-Encoding negotiation, the size threshold and cached
+compressed variants.
+"""
+import gzip
+import json
+
+import pytest
+from flask import Flask
+
+from app.core import compression
+from app.core.compression import init_compression
+from tests.conftest import create_project, create_task
+
+
+def gzip_headers(headers, accept: str = "gzip") -> dict:
+    return {**headers, "Accept-Encoding": accept}
+
+
+class TestCompression:
+    """Tests for compressed responses."""
+
+    def test_large_list_is_gzipped(self, app, client, auth_headers):
+        """Test that a response above the threshold is compressed when accepted."""
+        app.config["COMPRESSION_MIN_SIZE"] = 0
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+
+        plain = client.get(f"/api/tasks/{project_id}/tasks", headers=auth_headers)
+        compressed = client.get(f"/api/tasks/{project_id}/tasks", headers=gzip_headers(auth_headers))
+
+        assert "Content-Encoding" not in plain.headers
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert int(compressed.headers["Content-Length"]) == len(compressed.data)
+        assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+
+    def test_small_response_is_sent_as_is(self, app, client, auth_headers):
+        """Test that bodies under COMPRESSION_MIN_SIZE stay uncompressed."""
+        app.config["COMPRESSION_MIN_SIZE"] = 10_000
+
+        response = client.get("/api/projects/", headers=gzip_headers(auth_headers))
+
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_refused_encoding_is_not_used(self, app, client, auth_headers):
+        """Test that q=0 rules an encoding out."""
+        app.config["COMPRESSION_MIN_SIZE"] = 0
+
+        response = client.get("/api/projects/", headers=gzip_headers(auth_headers, "gzip;q=0, identity"))
+
+        assert "Content-Encoding" not in response.headers
+
+    def test_cache_hits_reuse_the_compressed_variant(self, app, client, auth_headers, monkeypatch):
+        """Test that a cached entry is compressed once, not on every hit."""
+        app.config["COMPRESSION_MIN_SIZE"] = 0
+        create_project(client, auth_headers)
+        calls = []
+        gzip_codec = compression.CODECS["gzip"]
+        monkeypatch.setitem(
+            compression.CODECS, "gzip", lambda data, level: calls.append(level) or gzip_codec(data, level)
+        )
+
+        first = client.get("/api/projects/", headers=gzip_headers(auth_headers))
+        second = client.get("/api/projects/", headers=gzip_headers(auth_headers))
+        plain = client.get("/api/projects/", headers=auth_headers)
+
+        assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+        assert first.headers["Content-Encoding"] == second.headers["Content-Encoding"] == "gzip"
+        assert second.data == first.data
+        assert json.loads(gzip.decompress(second.data)) == plain.get_json()
+        assert calls == [6]
+
+    def test_encoded_stream_is_left_alone(self, client, auth_headers):
+        """Test that the export's own gzip stream is not compressed twice."""
+        response = client.get("/api/export/", headers=gzip_headers(auth_headers))
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        gzip.decompress(response.data)
+
+    def test_unknown_encoding_is_rejected(self):
+        """Test that misconfigured encodings fail at startup."""
+        app = Flask(__name__)
+        app.config["COMPRESSION_ENCODINGS"] = ["gzip", "lzma"]
+
+        with pytest.raises(ValueError):
+            init_compression(app)
@@ -0,0 +1,83 @@
+"""
+Conditional Request Tests
+
+Tests for ETag / If-None-Match handling on read endpoints.
+"""
+from tests.conftest import create_project, create_task, create_test_user, get_auth_headers
+
+
+def revalidate(client, headers, url: str):
+    """Fetch a URL, then repeat the request with its ETag."""
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    assert first.headers.get("ETag")
+    second = client.get(url, headers={**headers, "If-None-Match": first.headers["ETag"]})
+    return first, second
+
+
+class TestConditionalGet:
+    """Tests for 304 Not Modified responses."""
+
+    def test_unchanged_listings_return_304(self, client, auth_headers):
+        """Test every listing answers 304 when nothing changed."""
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+        user_id = client.get("/api/projects/", headers=auth_headers).get_json()["data"][0]["user_id"]
+
+        for url in (
+            "/api/projects/",
+            f"/api/projects/{project_id}",
+            f"/api/tasks/{project_id}/tasks",
+            "/api/users/",
+            f"/api/users/{user_id}",
+        ):
+            first, second = revalidate(client, auth_headers, url)
+            assert second.status_code == 304, url
+            assert second.data == b""
+            assert second.headers["ETag"] == first.headers["ETag"]
+
+    def test_writes_change_etag(self, client, auth_headers):
+        """Test that task and project writes invalidate the listing ETags."""
+        project_id = create_project(client, auth_headers)
+        projects_etag = client.get("/api/projects/", headers=auth_headers).headers["ETag"]
+        tasks_url = f"/api/tasks/{project_id}/tasks"
+        tasks_etag = client.get(tasks_url, headers=auth_headers).headers["ETag"]
+
+        task_id = create_task(client, auth_headers, project_id)
+        response = client.get(tasks_url, headers={**auth_headers, "If-None-Match": tasks_etag})
+        assert response.status_code == 200
+        assert len(response.get_json()["data"]) == 1
+
+        client.delete(f"/api/tasks/{project_id}/task/{task_id}", headers=auth_headers)
+        response = client.get("/api/projects/", headers={**auth_headers, "If-None-Match": projects_etag})
+        assert response.status_code == 200
+
+    def test_etag_depends_on_query_args(self, client, auth_headers):
+        """Test that a different page never matches another page's ETag."""
+        create_project(client, auth_headers)
+        etag = client.get("/api/projects/?page=1", headers=auth_headers).headers["ETag"]
+
+        response = client.get("/api/projects/?page=2", headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+
+    def test_other_users_writes_keep_etag(self, client, auth_headers):
+        """Test that another user's writes do not invalidate this user's list."""
+        create_project(client, auth_headers)
+        etag = client.get("/api/projects/", headers=auth_headers).headers["ETag"]
+
+        create_test_user(client, "Other User", "other@example.com", "Password123")
+        other_headers = get_auth_headers(client, "other@example.com", "Password123")
+        create_project(client, other_headers)
+
+        response = client.get("/api/projects/", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_no_etag_for_other_users_resources(self, client, auth_headers, second_user_headers):
+        """Test that forbidden responses never carry an ETag."""
+        project_id = create_project(client, auth_headers)
+
+        response = client.get(f"/api/tasks/{project_id}/tasks", headers=second_user_headers)
+
+        assert response.status_code == 403
+        assert "ETag" not in response.headers
@@ -0,0 +1,141 @@
+"""
+Events API Tests
+
+Tests for the Server-Sent Events change stream and the local broker.
+"""
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.events import LocalBroker, RESYNC_EVENT
+from tests.conftest import create_project, create_task
+
+
+@pytest.fixture
+def open_stream(app, client):
+    """Open an event stream and return an iterator over its messages."""
+    app.config["EVENTS_HEARTBEAT_SECONDS"] = 0.05
+    streams = []
+
+    def _open(headers):
+        response = client.get("/api/events", headers=headers, buffered=False)
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        streams.append(response)
+        messages = (chunk.decode("utf-8") for chunk in response.response)
+        assert next(messages).startswith("retry:")
+        return messages
+
+    yield _open
+    for response in streams:
+        response.close()
+
+
+def next_event(messages) -> dict:
+    """Skip heartbeats and return the next event payload."""
+    for message in messages:
+        if not message.startswith(":"):
+            name, data = message.strip().split("\n")
+            payload = json.loads(data[len("data: "):])
+            assert name == f"event: {payload['type']}"
+            return payload
+
+
+class TestEventStream:
+    """Tests for GET /api/events endpoint."""
+
+    def test_stream_receives_changes_after_commit(self, client, auth_headers, open_stream):
+        """Test that project and task writes are pushed to the stream."""
+        messages = open_stream(auth_headers)
+
+        response = client.post(
+            "/api/projects/",
+            json={"project_name": "Live", "description": "Streamed"},
+            headers=auth_headers
+        )
+        project_id = response.get_json()["data"]["project_id"]
+        response = client.post(
+            "/api/tasks/task",
+            json={
+                "task_name": "Live task",
+                "description": "Streamed",
+                "due_date": (date.today() + timedelta(days=7)).isoformat(),
+                "status": "pending",
+                "project_id": project_id
+            },
+            headers=auth_headers
+        )
+        task_id = response.get_json()["data"]["task_id"]
+
+        assert next_event(messages) == {"type": "project.created", "id": project_id}
+        assert next_event(messages) == {
+            "type": "task.created", "id": task_id, "project_id": project_id
+        }
+
+    def test_move_between_own_projects_is_an_update(self, client, auth_headers, open_stream):
+        """Test that moving a task to another of the owner's projects sends no task.deleted."""
+        source = create_project(client, auth_headers, "Source")
+        target = create_project(client, auth_headers, "Target")
+        task_id = create_task(client, auth_headers, source)
+        messages = open_stream(auth_headers)
+
+        client.put(
+            f"/api/tasks/{target}/task/{task_id}",
+            json={
+                "task_name": "Moved",
+                "description": "Moved",
+                "due_date": (date.today() + timedelta(days=7)).isoformat(),
+                "status": "pending"
+            },
+            headers=auth_headers
+        )
+
+        assert next_event(messages) == {"type": "task.updated", "id": task_id, "project_id": target}
+        assert next(messages) == ": heartbeat\n\n"
+
+    def test_idle_stream_sends_heartbeats(self, auth_headers, open_stream):
+        """Test that an idle stream emits heartbeat comments."""
+        messages = open_stream(auth_headers)
+
+        assert next(messages) == ": heartbeat\n\n"
+
+    def test_stream_is_scoped_to_user(self, client, auth_headers, second_user_headers, open_stream):
+        """Test that users never see each other's events."""
+        messages = open_stream(second_user_headers)
+
+        client.post(
+            "/api/projects/",
+            json={"project_name": "Private", "description": "Not for others"},
+            headers=auth_headers
+        )
+
+        assert next(messages) == ": heartbeat\n\n"
+
+    def test_stream_without_auth(self, client):
+        """Test streaming without authentication."""
+        response = client.get("/api/events")
+
+        assert response.status_code == 401
+
+
+class TestLocalBroker:
+    """Tests for the in-process broker."""
+
+    def test_overflow_collapses_into_resync(self):
+        """Test that a slow subscriber gets a single resync event."""
+        broker = LocalBroker(queue_size=2)
+        subscription = broker.subscribe(1)
+        for i in range(5):
+            broker.publish(1, {"type": "task.updated", "id": i})
+
+        assert subscription.get(timeout=0) == RESYNC_EVENT
+        assert subscription.get(timeout=0) is None
+
+    def test_unsubscribe_on_close(self):
+        """Test that closed subscriptions stop receiving events."""
+        broker = LocalBroker()
+        with broker.subscribe(1):
+            assert broker.subscriber_count() == 1
+
+        assert broker.subscriber_count() == 0
@@ -0,0 +1,71 @@
+"""
+Export API Tests
+
+Tests for the streaming NDJSON/CSV export.
+"""
+import csv
+import gzip
+import io
+import json
+
+from tests.conftest import create_project, create_task
+
+
+def ndjson_rows(body: bytes) -> list:
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+class TestExport:
+    """Tests for GET /api/export endpoint."""
+
+    def test_ndjson_export(self, client, auth_headers):
+        """Test that projects come first and tasks reference them."""
+        project_id = create_project(client, auth_headers, "Website")
+        task_id = create_task(client, auth_headers, project_id, "Write docs")
+
+        response = client.get("/api/export", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert response.is_streamed
+        assert "attachment" in response.headers["Content-Disposition"]
+        rows = ndjson_rows(response.data)
+        assert [(row["type"], row["id"]) for row in rows] == [("project", project_id), ("task", task_id)]
+        assert rows[0]["project_name"] == "Website"
+        assert rows[1]["project_id"] == project_id
+        assert rows[1]["task_name"] == "Write docs"
+
+    def test_csv_export(self, client, auth_headers):
+        """Test the CSV format with a header row."""
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+
+        response = client.get("/api/export?format=csv", headers=auth_headers)
+
+        assert response.mimetype == "text/csv"
+        rows = list(csv.DictReader(io.StringIO(response.data.decode("utf-8"))))
+        assert [row["type"] for row in rows] == ["project", "task"]
+        assert rows[1]["project_id"] == str(project_id)
+
+    def test_gzip_export(self, client, auth_headers):
+        """Test that gzip is applied when the client accepts it."""
+        create_project(client, auth_headers)
+
+        response = client.get("/api/export", headers={**auth_headers, "Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert ndjson_rows(gzip.decompress(response.data))[0]["type"] == "project"
+
+    def test_export_is_scoped_to_user(self, client, auth_headers, second_user_headers):
+        """Test that exports never include other users' data."""
+        create_project(client, auth_headers)
+
+        response = client.get("/api/export", headers=second_user_headers)
+
+        assert response.data == b""
+
+    def test_invalid_format(self, client, auth_headers):
+        """Test that unknown formats are rejected."""
+        response = client.get("/api/export?format=xml", headers=auth_headers)
+
+        assert response.status_code == 422
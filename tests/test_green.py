@@ -0,0 +1,64 @@
+"""
+Cooperative Mode Tests
+
+Tests for the gevent patch checks and CPU offloading. Patching is
+process-wide, so the gevent side runs in a subprocess.
+"""
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core import green
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GREEN_SCRIPT = """
+import gevent
+import green
+from app.core.security import hash_password
+
+ticks = []
+ticker = gevent.spawn(lambda: [ticks.append(gevent.sleep(0.01)) for _ in range(1000)])
+hash_password("CooperativePass123")
+ticker.kill()
+print(green.app.extensions.get("green"), len(ticks))
+"""
+
+
+class TestWithoutGevent:
+    """Tests for the helpers in a normal (unpatched) process."""
+
+    def test_offload_runs_inline(self):
+        """Test that offload() just calls the function outside gevent mode."""
+        assert not green.is_active()
+        assert green.offload(sum, [1, 2, 3]) == 6
+
+    def test_check_patched_rejects_unpatched_process(self):
+        """Test that the startup check fails without monkey patching."""
+        with pytest.raises(RuntimeError, match="socket"):
+            green.check_patched()
+
+
+@pytest.mark.skipif(importlib.util.find_spec("gevent") is None, reason="gevent is not installed")
+def test_green_entry_point_patches_and_offloads_hashing(tmp_path):
+    """Test that green.py starts patched and hashing leaves the hub free."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'green.db'}",
+        "SECRET_KEY": "Qw8rTy7uIo9pAs6dFg5hJk4lZx3cVb2nMq1wErTyUiOp",
+        "JWT_SECRET_KEY": "Zx9cVb8nMq7wEr6tYu5iOp4aSd3fGh2jKl1QwErTyUiO",
+        "LOG_FILE": str(tmp_path / "app.log"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", GREEN_SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    active, ticks = result.stdout.split()
+    assert active == "True"
+    # Other greenlets kept running while PBKDF2 ran on a real thread
+    assert int(ticks) > 5
@@ -0,0 +1,148 @@
+"""
+Import API Tests
+
+Tests for the streaming NDJSON/CSV import and the import-data command.
+"""
+import gzip
+import json
+from datetime import date, timedelta
+
+from tests.conftest import create_project, create_task
+from tests.test_sync import sync
+
+DUE_DATE = (date.today() + timedelta(days=7)).isoformat()
+
+
+def ndjson(*rows) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+
+
+def import_body(client, headers, body: bytes, **kwargs):
+    response = client.post("/api/import", data=body, headers=headers, **kwargs)
+    return response.status_code, response.get_json()["data"]
+
+
+class TestImport:
+    """Tests for POST /api/import endpoint."""
+
+    def test_export_round_trip(self, client, auth_headers, second_user_headers):
+        """Test that one user's export imports into another account."""
+        project_id = create_project(client, auth_headers, "Website")
+        create_task(client, auth_headers, project_id, "Write docs")
+        exported = client.get("/api/export", headers=auth_headers).data
+
+        status, data = import_body(client, second_user_headers, exported)
+
+        assert status == 200
+        assert data == {"projects_imported": 1, "tasks_imported": 1, "error_count": 0, "errors": []}
+        projects = client.get("/api/projects/", headers=second_user_headers).get_json()["data"]
+        assert [project["project_name"] for project in projects] == ["Website"]
+        assert projects[0]["project_id"] != project_id
+        tasks = client.get(f"/api/tasks/{projects[0]['project_id']}/tasks", headers=second_user_headers)
+        assert [task["task_name"] for task in tasks.get_json()["data"]] == ["Write docs"]
+
+    def test_csv_import(self, client, auth_headers):
+        """Test importing CSV with empty cells as missing values."""
+        body = (
+            "type,id,project_id,project_name,task_name,description,due_date,status\n"
+            "project,7,,Imported,,,,\n"
+            f"task,,7,,From CSV,,{DUE_DATE},pending\n"
+        ).encode("utf-8")
+
+        status, data = import_body(client, auth_headers, body, content_type="text/csv")
+
+        assert (data["projects_imported"], data["tasks_imported"]) == (1, 1)
+
+    def test_row_errors_are_reported_by_line(self, client, auth_headers):
+        """Test that bad rows are skipped and reported while good rows import."""
+        body = ndjson(
+            {"type": "project", "id": 1, "project_name": "Good"},
+            {"type": "task", "project_id": 1, "task_name": "Good task", "due_date": DUE_DATE},
+            {"type": "task", "project_id": 1, "task_name": "Late", "due_date": "2000-01-01"},
+            {"type": "task", "project_id": 999, "task_name": "Orphan", "due_date": DUE_DATE},
+            {"type": "comment"},
+        ) + b"not json\n"
+
+        status, data = import_body(client, auth_headers, body)
+
+        assert status == 200
+        assert (data["projects_imported"], data["tasks_imported"]) == (1, 1)
+        assert [error["line"] for error in data["errors"]] == [3, 4, 5, 6]
+        assert "Due date must be later" in data["errors"][0]["error"]
+        assert "unknown project 999" in data["errors"][1]["error"]
+
+    def test_tasks_into_existing_projects(self, client, auth_headers, second_user_headers):
+        """Test that tasks may target owned projects but never other users' projects."""
+        own_project = create_project(client, auth_headers)
+        other_project = create_project(client, second_user_headers)
+        body = ndjson(
+            {"type": "task", "project_id": own_project, "task_name": "Mine", "due_date": DUE_DATE},
+            {"type": "task", "project_id": other_project, "task_name": "Theirs", "due_date": DUE_DATE},
+        )
+
+        status, data = import_body(client, auth_headers, body)
+
+        assert data["tasks_imported"] == 1
+        assert data["errors"][0]["line"] == 2
+
+    def test_gzip_body_and_small_chunks(self, app, client, auth_headers):
+        """Test a compressed body written over several chunks."""
+        app.config["IMPORT_CHUNK_SIZE"] = 2
+        rows = [{"type": "project", "id": 1, "project_name": "Bulk"}]
+        rows += [
+            {"type": "task", "project_id": 1, "task_name": f"Task {i}", "due_date": DUE_DATE}
+            for i in range(5)
+        ]
+
+        headers = {**auth_headers, "Content-Encoding": "gzip"}
+        status, data = import_body(client, headers, gzip.compress(ndjson(*rows)))
+
+        assert data["tasks_imported"] == 5
+
+    def test_imported_rows_reach_sync(self, client, auth_headers):
+        """Test that imported rows show up in delta sync."""
+        cursor = sync(client, auth_headers)["cursor"]
+        body = ndjson(
+            {"type": "project", "id": 1, "project_name": "Synced"},
+            {"type": "task", "project_id": 1, "task_name": "Synced task", "due_date": DUE_DATE},
+        )
+
+        import_body(client, auth_headers, body)
+        data = sync(client, auth_headers, cursor)
+
+        assert [project["project_name"] for project in data["projects"]] == ["Synced"]
+        assert [task["task_name"] for task in data["tasks"]] == ["Synced task"]
+
+    def test_invalid_format(self, client, auth_headers):
+        """Test that unknown formats are rejected."""
+        response = client.post("/api/import?format=xml", data=b"", headers=auth_headers)
+
+        assert response.status_code == 422
+
+
+class TestImportCommand:
+    """Tests for the flask import-data command."""
+
+    def test_import_file(self, runner, client, auth_headers, tmp_path):
+        """Test importing an NDJSON file into a user's account."""
+        path = tmp_path / "export.ndjson"
+        path.write_bytes(ndjson(
+            {"type": "project", "id": 1, "project_name": "From CLI"},
+            {"type": "task", "project_id": 1, "task_name": "CLI task", "due_date": DUE_DATE},
+        ))
+
+        result = runner.invoke(args=["import-data", "test@example.com", str(path)])
+
+        assert result.exit_code == 0
+        assert "1 projects and 1 tasks imported" in result.output
+        projects = client.get("/api/projects/", headers=auth_headers).get_json()["data"]
+        assert [project["project_name"] for project in projects] == ["From CLI"]
+
+    def test_unknown_user(self, runner, tmp_path):
+        """Test that an unknown email fails."""
+        path = tmp_path / "export.ndjson"
+        path.write_bytes(b"")
+
+        result = runner.invoke(args=["import-data", "nobody@example.com", str(path)])
+
+        assert result.exit_code != 0
@@ -0,0 +1,129 @@
+"""
+JSON Encoding Tests
+
+Tests for the orjson provider and the direct row serializers.
+"""
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.core.json_provider import OrjsonProvider, init_json
+from app.schemas.project import ProjectResponse, ProjectWithTasks
+from app.schemas.task import TaskResponse
+from tests.conftest import create_project, create_task
+
+PAYLOAD = {
+    "success": True,
+    "message": "Tasks retrieved successfully",
+    "data": [{
+        "b": 1,
+        "a": "Tâche",
+        "due_date": date(2030, 1, 2),
+        "created_at": datetime(2030, 1, 2, 3, 4, 5),
+        "update_at": datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))),
+        "amount": Decimal("1.50"),
+        "id": uuid.UUID(int=1),
+        "none": None,
+    }],
+}
+
+
+@pytest.fixture
+def stdlib_app():
+    app = Flask(__name__)
+    app.json = DefaultJSONProvider(app)
+    return app
+
+
+@pytest.fixture
+def orjson_app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+class TestOrjsonProvider:
+    """Tests for OrjsonProvider against Flask's default provider."""
+
+    @pytest.mark.parametrize("debug", [False, True])
+    def test_response_matches_default_provider(self, stdlib_app, orjson_app, debug):
+        """Test that responses decode to the same document with the same key order."""
+        stdlib_app.debug = orjson_app.debug = debug
+        with stdlib_app.app_context():
+            expected = stdlib_app.json.response(PAYLOAD)
+        with orjson_app.app_context():
+            actual = orjson_app.json.response(PAYLOAD)
+
+        assert actual.mimetype == expected.mimetype == "application/json"
+        assert actual.get_data().endswith(b"\n")
+        assert json.loads(actual.get_data()) == json.loads(expected.get_data())
+        assert list(json.loads(actual.get_data())) == ["data", "message", "success"]
+        assert (b"\n  " in actual.get_data()) is debug
+
+    def test_compact_output_is_byte_identical_for_ascii(self, stdlib_app, orjson_app):
+        """Test that ASCII payloads encode to exactly the same bytes."""
+        payload = {**PAYLOAD, "data": [{**PAYLOAD["data"][0], "a": "Task"}]}
+
+        with stdlib_app.app_context():
+            expected = stdlib_app.json.response(payload).get_data()
+        with orjson_app.app_context():
+            actual = orjson_app.json.response(payload).get_data()
+
+        assert actual == expected
+
+    def test_extra_arguments_fall_back_to_stdlib(self, orjson_app):
+        """Test that options orjson lacks are still honoured."""
+        assert orjson_app.json.dumps({"a": "é"}, ensure_ascii=True) == '{"a": "\\u00e9"}'
+        assert orjson_app.json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_config_selects_provider(self):
+        """Test that JSON_PROVIDER chooses the provider."""
+        app = Flask(__name__)
+        init_json(app)
+        assert isinstance(app.json, OrjsonProvider)
+
+        app = Flask(__name__)
+        app.config["JSON_PROVIDER"] = "json"
+        init_json(app)
+        assert not isinstance(app.json, OrjsonProvider)
+
+        app.config["JSON_PROVIDER"] = "ujson"
+        with pytest.raises(ValueError):
+            init_json(app)
+
+
+class TestRowSerializers:
+    """Tests for the direct row serializers."""
+
+    def test_serializers_match_model_dump(self, app, client, auth_headers):
+        """Test that the direct serializers produce the model_dump() dicts."""
+        from app.core.extensions import db
+        from app.models.project import Projects
+
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+        project = db.session.get(Projects, project_id)
+        task = project.tasks[0]
+
+        assert TaskResponse.dump_orm_task(task) == TaskResponse.from_orm_task(task).model_dump()
+        assert ProjectResponse.dump_orm_project(project) == ProjectResponse.from_orm_project(project).model_dump()
+        assert ProjectWithTasks.dump_orm_project(project) == ProjectWithTasks.from_orm_project(project).model_dump()
+
+    def test_list_endpoint_envelope(self, client, auth_headers):
+        """Test that the task list keeps the {success, message, data} envelope."""
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+
+        response = client.get(f"/api/tasks/{project_id}/tasks", headers=auth_headers)
+
+        body = response.get_json()
+        assert response.status_code == 200
+        assert set(body) == {"success", "message", "data"}
+        assert set(body["data"][0]) == {
+            "task_id", "task_name", "description", "due_date", "status", "project_id", "created_at", "update_at"
+        }
@@ -0,0 +1,248 @@
+"""
+Logging Tests
+
+Tests for the queued logging pipeline: JSON lines in the log file, the
+bounded queue and its drop counter, batched writes and rotation. Also
+tests the per-request access log line and its sampling.
+"""
+import json
+import logging
+import logging.handlers
+import time
+
+import pytest
+import structlog
+from flask.testing import FlaskClient
+
+from app import create_app
+from app.core import logger as logger_module
+from app.core.extensions import db
+from app.core.logger import BatchFileHandler, LogPipeline, logging_stats, setup_logging
+from tests.conftest import TestingConfig, create_project, create_test_user, get_auth_headers
+
+
+
+class HTTPSClient(FlaskClient):
+    """Test client whose requests look like they came through the TLS proxy."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.environ_base["HTTP_X_FORWARDED_PROTO"] = "https"
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def access_lines(caplog):
+    return [record.msg for record in caplog.records if isinstance(record.msg, dict) and record.msg["event"] == "request"]
+
+
+@pytest.fixture
+def production_app():
+    """Build an app outside debug mode, where the access log is on."""
+    apps = []
+
+    def build(**config):
+        class AccessLogConfig(TestingConfig):
+            DEBUG = False
+
+        for key, value in config.items():
+            setattr(AccessLogConfig, key, value)
+        app = create_app(AccessLogConfig)
+        app.test_client_class = HTTPSClient
+        with app.app_context():
+            db.create_all()
+        apps.append(app)
+        return app
+
+    yield build
+    for app in apps:
+        with app.app_context():
+            db.drop_all()
+
+
+class SlowHandler(logging.Handler):
+    """A destination whose writes take `delay` seconds, like a saturated disk."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def flush(self):
+        time.sleep(self.delay)
+        self.flushes += 1
+
+    def discard_pending(self):
+        pass
+
+
+class TestSetupLogging:
+    """Tests for the pipeline set up by create_app()."""
+
+    def test_structlog_and_stdlib_records_reach_the_file(self, tmp_path):
+        """Test that both kinds of records are written as one JSON line each."""
+        log_file = tmp_path / "app.log"
+        setup_logging("INFO", str(log_file))
+
+        structlog.get_logger().info("user_registered", user_id=7)
+        logging.getLogger("werkzeug").warning("port %d in use", 5000)
+        structlog.get_logger().debug("below_the_level")
+        logger_module._stop_pipeline()
+
+        lines = read_lines(log_file)
+        assert [line["event"] for line in lines] == ["user_registered", "port 5000 in use"]
+        assert lines[0]["user_id"] == 7
+        assert lines[0]["level"] == "info"
+        assert lines[1]["level"] == "warning"
+        assert "timestamp" in lines[1]
+
+    def test_calling_again_replaces_the_pipeline(self, tmp_path):
+        """Test that a second create_app() does not stack handlers or listener threads."""
+        setup_logging("INFO", str(tmp_path / "first.log"))
+        setup_logging("INFO", str(tmp_path / "second.log"))
+        structlog.get_logger().info("once")
+        logger_module._stop_pipeline()
+
+        queue_handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.handlers.QueueHandler)]
+        assert len(queue_handlers) == 1
+        assert (tmp_path / "first.log").read_text() == ""
+        assert [line["event"] for line in read_lines(tmp_path / "second.log")] == ["once"]
+
+    def test_health_reports_the_queue(self, client):
+        """Test that /health includes the logging queue depth and drop count."""
+        stats = client.get("/health").get_json()["logging"]
+
+        assert stats["queue_size"] == 10000
+        assert stats["dropped"] == 0
+        assert logging_stats() is not None
+
+
+class TestLogPipeline:
+    """Tests for the queue, the listener thread and batching."""
+
+    def test_slow_destination_does_not_block_the_caller(self):
+        """Test that logging returns immediately while the writer is stuck on the disk."""
+        handler = SlowHandler(delay=0.2)
+        pipeline = LogPipeline([handler], queue_size=1000)
+        pipeline.start()
+        record = logging.makeLogRecord({"msg": "x", "levelno": logging.INFO})
+
+        start = time.perf_counter()
+        for _ in range(200):
+            pipeline.queue_handler.handle(record)
+        elapsed = time.perf_counter() - start
+        pipeline.stop()
+
+        assert elapsed < 0.1
+        assert len(handler.records) == 200
+        assert handler.flushes < 200  # written in batches
+
+    def test_full_queue_drops_and_counts(self):
+        """Test that records beyond the queue size are dropped, counted and reported."""
+        handler = SlowHandler(delay=0)
+        pipeline = LogPipeline([handler], queue_size=3)
+        record = logging.makeLogRecord({"msg": "x", "levelno": logging.INFO})
+
+        for _ in range(5):
+            pipeline.queue_handler.handle(record)
+        assert pipeline.stats() == {"queued": 3, "queue_size": 3, "dropped": 2}
+
+        pipeline.start()
+        pipeline.stop()
+        warning = handler.records[-1]
+        assert warning.msg == {"event": "log_records_dropped", "count": 2, "total": 2}
+        assert len(handler.records) == 4
+
+    def test_child_gets_its_own_listener_after_fork(self):
+        """Test that the fork hook replaces the queue and restarts the listener thread."""
+        handler = SlowHandler(delay=0)
+        pipeline = LogPipeline([handler], queue_size=10)
+        pipeline.start()
+        old_queue = pipeline.queue_handler.queue
+
+        pipeline.after_fork_in_child()
+        pipeline.queue_handler.handle(logging.makeLogRecord({"msg": "x", "levelno": logging.INFO}))
+        pipeline.stop()
+        old_queue.put(None)  # a real fork leaves the parent's thread behind
+
+        assert pipeline.queue_handler.queue is not old_queue
+        assert len(handler.records) == 1
+
+
+class TestBatchFileHandler:
+    """Tests for batched writes and size-based rotation."""
+
+    def test_rotates_by_size(self, tmp_path):
+        """Test that a batch that would cross max_bytes starts a new file."""
+        log_file = tmp_path / "app.log"
+        handler = BatchFileHandler(str(log_file), max_bytes=100, backup_count=2)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        for batch in range(3):
+            for _ in range(4):
+                handler.handle(logging.makeLogRecord({"msg": f"batch {batch} line"}))
+            handler.flush()
+        handler.close()
+
+        assert log_file.read_text() == "batch 2 line\n" * 4
+        assert (tmp_path / "app.log.1").read_text() == "batch 1 line\n" * 4
+        assert (tmp_path / "app.log.2").exists()
+        assert not (tmp_path / "app.log.3").exists()
+
+
+class TestAccessLog:
+    """Tests for the access log line written per request."""
+
+    def test_one_line_per_request(self, production_app, caplog):
+        """Test that a request logs its route template, status, size, duration and user."""
+        client = production_app().test_client()
+        create_test_user(client)
+        headers = get_auth_headers(client)
+        project_id = create_project(client, headers)
+        caplog.clear()
+
+        response = client.get(f"/api/projects/{project_id}", headers=headers)
+        response.close()  # as the server does once the body is sent
+
+        [line] = access_lines(caplog)
+        assert line["method"] == "GET"
+        assert line["path"] == "/api/projects/<int:id>"
+        assert line["status"] == 200
+        assert line["bytes"] == len(response.data)
+        assert line["duration_ms"] >= 0
+        assert line["user_id"] is not None
+        assert not [r for r in caplog.records if isinstance(r.msg, dict) and r.msg["event"].startswith("request_")]
+
+    def test_logged_when_the_response_closes(self, production_app, caplog):
+        """Test that the line is written once the body is sent, not when the view returns."""
+        client = production_app().test_client()
+
+        response = client.get("/health")
+        body = response.get_data()
+        assert access_lines(caplog) == []
+        response.close()
+
+        [line] = access_lines(caplog)
+        assert line["bytes"] == len(body)
+
+    def test_sampling_keeps_errors_and_slow_requests(self, production_app, caplog):
+        """Test that sampled-out successes are skipped while errors and slow requests are kept."""
+        client = production_app(ACCESS_LOG_SAMPLE_RATE=0.0).test_client()
+        for path in ("/ready", "/api/projects/", "/missing"):
+            client.get(path).close()
+        assert [(line["path"], line["status"]) for line in access_lines(caplog)] == [
+            ("/api/projects/", 401),
+            ("/missing", 404),
+        ]
+
+        caplog.clear()
+        slow_client = production_app(ACCESS_LOG_SAMPLE_RATE=0.0, ACCESS_LOG_SLOW_MS=0).test_client()
+        slow_client.get("/ready").close()
+        [line] = access_lines(caplog)
+        assert line["slow"] is True
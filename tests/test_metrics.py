@@ -0,0 +1,131 @@
+"""
+Metrics Tests
+
+Tests for the Prometheus /metrics endpoint, in this process and summed
+over several worker processes.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app import create_app
+from app.core.extensions import db
+from app.core.startup import ROOT
+from tests.conftest import TestingConfig
+
+prometheus_client = pytest.importorskip("prometheus_client")
+from prometheus_client.parser import text_string_to_metric_families  # noqa: E402
+
+WORKER = """
+import sys
+from app import create_app
+from tests.test_metrics import MetricsConfig
+
+client = create_app(MetricsConfig).test_client()
+for _ in range(int(sys.argv[1])):
+    client.get("/missing")
+if sys.argv[2] == "scrape":
+    sys.stdout.write(client.get("/metrics").get_data(as_text=True))
+"""
+
+
+class MetricsConfig(TestingConfig):
+    METRICS_ENABLED = True
+
+
+@pytest.fixture
+def app():
+    test_app = create_app(MetricsConfig)
+    with test_app.app_context():
+        db.create_all()
+        yield test_app
+        db.session.remove()
+        db.drop_all()
+
+
+def samples(text: str) -> dict:
+    """Sample values by (name, sorted labels)."""
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+
+def request_count(values: dict, route: str, status: str, method: str = "GET") -> float:
+    labels = (("method", method), ("route", route), ("status", status))
+    return values.get(("http_request_duration_seconds_count", labels), 0)
+
+
+class TestMetricsEndpoint:
+    """Tests for /metrics in a single process."""
+
+    def test_counts_requests_per_route_template(self, client, auth_headers):
+        """Test that requests are observed under their route template and status."""
+        before = samples(client.get("/metrics").get_data(as_text=True))
+        for project_id in (1, 2):
+            client.get(f"/api/projects/{project_id}", headers=auth_headers)
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        after = samples(response.get_data(as_text=True))
+        route = "/api/projects/<int:id>"
+        assert request_count(after, route, "404") - request_count(before, route, "404") == 2
+        assert after[("http_requests_in_flight", ())] == 1  # the scrape itself
+        assert ("db_pool_size", (("engine", "primary"),)) not in after  # SQLite has no QueuePool
+        assert ("response_cache_hits", ()) in after
+
+    def test_counts_password_hashes_in_progress(self, app, monkeypatch):
+        """Test that the hashing gauge is up while a hash runs and down afterwards."""
+        from app.core import security
+
+        def in_progress():
+            return prometheus_client.REGISTRY.get_sample_value("auth_password_hashes_in_progress")
+
+        seen = []
+        offload = security.offload
+        monkeypatch.setattr(security, "offload", lambda *args: seen.append(in_progress()) or offload(*args))
+        security.verify_password("x", security.generate_password_hash("x", method="pbkdf2:sha256:1"))
+
+        assert seen == [1]
+        assert in_progress() == 0
+
+    def test_disabled_is_a_404(self):
+        """Test that without METRICS_ENABLED the endpoint does not exist."""
+        client = create_app(TestingConfig).test_client()
+
+        assert client.get("/metrics").status_code == 404
+
+    def test_apps_share_the_registered_metrics(self, app):
+        """Test that another app in the same process reuses the metric objects."""
+        assert create_app(MetricsConfig).extensions["metrics"] is app.extensions["metrics"]
+
+
+def test_sums_over_worker_processes(tmp_path):
+    """Test that in multiprocess mode /metrics on one worker reports every worker's requests."""
+    env = {
+        **os.environ,
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'metrics.db'}",
+        "SECRET_KEY": "Qw8rTy7uIo9pAs6dFg5hJk4lZx3cVb2nMq1wErTyUiOp",
+        "JWT_SECRET_KEY": "Zx9cVb8nMq7wEr6tYu5iOp4aSd3fGh2jKl1QwErTyUiO",
+        "LOG_FILE": str(tmp_path / "app.log"),
+    }
+
+    def worker(requests: int, scrape: bool = False) -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", WORKER, str(requests), "scrape" if scrape else ""],
+            cwd=ROOT, env=env, capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+    worker(3)
+    worker(4)
+    values = samples(worker(5, scrape=True))
+
+    assert request_count(values, "<unmatched>", "404") == 12
+    assert values[("http_requests_in_flight", ())] == 1  # exited workers' requests have ended
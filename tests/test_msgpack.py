@@ -0,0 +1,92 @@
+"""
+MessagePack Tests
+
+Tests for MessagePack responses and request bodies.
+"""
+import importlib.util
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.core import msgpack_codec
+from tests.conftest import create_project, create_task
+
+MSGPACK = "application/msgpack"
+requires_msgpack = pytest.mark.skipif(
+    importlib.util.find_spec("msgpack") is None, reason="msgpack is not installed"
+)
+
+
+def unpack(response):
+    import msgpack
+    return msgpack.unpackb(response.data, timestamp=3, raw=False)
+
+
+@requires_msgpack
+class TestMsgpackResponses:
+    """Tests for Accept: application/msgpack."""
+
+    def test_list_uses_the_same_envelope(self, client, auth_headers):
+        """Test that a MessagePack listing carries the JSON envelope and native dates."""
+        import msgpack
+
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+
+        json_body = client.get(f"/api/tasks/{project_id}/tasks", headers=auth_headers).get_json()
+        response = client.get(f"/api/tasks/{project_id}/tasks", headers={**auth_headers, "Accept": MSGPACK})
+
+        assert response.mimetype == MSGPACK
+        assert "Accept" in response.headers["Vary"]
+        body = unpack(response)
+        assert set(body) == {"success", "message", "data"}
+        task = body["data"][0]
+        assert task["task_name"] == json_body["data"][0]["task_name"]
+        assert isinstance(task["created_at"], datetime)
+        due_date = (date.today() + timedelta(days=7)).isoformat().encode("ascii")
+        assert task["due_date"] == msgpack.ExtType(msgpack_codec.DATE_EXT_TYPE, due_date)
+
+    def test_errors_are_negotiated_too(self, client):
+        """Test that error responses honour Accept as well."""
+        response = client.get("/api/projects/", headers={"Accept": MSGPACK})
+
+        assert response.status_code == 401
+        assert response.mimetype == MSGPACK
+
+    def test_msgpack_request_body(self, client, auth_headers):
+        """Test that views accept MessagePack bodies."""
+        body = msgpack_codec.packb({"project_name": "Packed", "description": "From msgpack"})
+
+        response = client.post(
+            "/api/projects/", data=body, headers={**auth_headers, "Content-Type": MSGPACK, "Accept": MSGPACK}
+        )
+
+        assert response.status_code == 201
+        assert unpack(response)["data"]["project_name"] == "Packed"
+
+    def test_formats_are_cached_separately(self, client, auth_headers):
+        """Test that a cached JSON listing is never served to a MessagePack client."""
+        create_project(client, auth_headers)
+        client.get("/api/projects/", headers=auth_headers)
+
+        response = client.get("/api/projects/", headers={**auth_headers, "Accept": MSGPACK})
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.mimetype == MSGPACK
+
+    def test_dates_round_trip_as_request_strings(self):
+        """Test that dates decode to the ISO strings the request schemas take."""
+        packed = msgpack_codec.packb({"due_date": date(2030, 1, 2), "at": datetime(2030, 1, 2, 3, 4, 5)})
+
+        assert msgpack_codec.unpackb(packed) == {
+            "due_date": "2030-01-02", "at": datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        }
+
+
+@pytest.mark.skipif(msgpack_codec.is_available(), reason="msgpack is installed")
+def test_without_msgpack_json_is_served(client, auth_headers):
+    """Test that clients asking for MessagePack still get JSON without the package."""
+    response = client.get("/api/projects/", headers={**auth_headers, "Accept": f"{MSGPACK}, application/json;q=0.5"})
+
+    assert response.status_code == 200
+    assert response.is_json
@@ -0,0 +1,82 @@
+"""
+OpenAPI Spec Tests
+
+Tests for building the spec with `flask openapi-spec` and serving the
+precomputed file.
+"""
+import gzip
+import json
+
+import pytest
+
+from app import create_app
+from tests.conftest import TestingConfig
+
+HTTPS = {"base_url": "https://localhost"}
+
+
+@pytest.fixture
+def spec_file(tmp_path, runner):
+    """The spec of the test app, built by the CLI command."""
+    path = tmp_path / "openapi.json"
+    result = runner.invoke(args=["openapi-spec", "--output", str(path)])
+    assert result.exit_code == 0, result.output
+    return path
+
+
+def create_spec_app(spec_file, swagger_ui: bool):
+    class SpecConfig(TestingConfig):
+        DEBUG = False
+        OPENAPI_SPEC_FILE = str(spec_file)
+        SWAGGER_UI = swagger_ui
+
+    return create_app(SpecConfig)
+
+
+class TestSpecCommand:
+    """Tests for the flask openapi-spec command."""
+
+    def test_writes_the_runtime_spec(self, client, spec_file):
+        """Test that the built file holds what flasgger serves at runtime."""
+        assert json.loads(spec_file.read_bytes()) == client.get("/apispec.json").get_json()
+        assert "/api/projects/" in json.loads(spec_file.read_bytes())["paths"]
+
+
+class TestPrecomputedSpec:
+    """Tests for serving the built spec."""
+
+    @pytest.mark.parametrize("swagger_ui", [True, False])
+    def test_serves_the_file_with_cache_headers(self, spec_file, swagger_ui):
+        """Test that /apispec.json returns the file's bytes, cacheable for a day."""
+        client = create_spec_app(spec_file, swagger_ui).test_client()
+
+        response = client.get("/apispec.json", **HTTPS)
+
+        assert response.status_code == 200
+        assert response.data == spec_file.read_bytes()
+        assert response.cache_control.public is True
+        assert response.cache_control.max_age == 86400
+        assert client.get("/apidocs/", **HTTPS).status_code == (200 if swagger_ui else 404)
+
+    def test_revalidation_and_compression(self, spec_file):
+        """Test that a known ETag gets 304 and compressed variants decode to the file."""
+        client = create_spec_app(spec_file, swagger_ui=False).test_client()
+
+        response = client.get("/apispec.json", headers={"Accept-Encoding": "gzip"}, **HTTPS)
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.data) == spec_file.read_bytes()
+
+        etag = response.headers["ETag"]
+        revalidated = client.get("/apispec.json", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}, **HTTPS)
+        assert revalidated.status_code == 304
+
+    def test_debug_mode_ignores_the_file(self, tmp_path):
+        """Test that the spec is built live in debug mode, so docstring edits show up."""
+        stale = tmp_path / "openapi.json"
+        stale.write_text('{"openapi": "3.0.0", "paths": {}}')
+
+        class DebugSpecConfig(TestingConfig):
+            OPENAPI_SPEC_FILE = str(stale)
+
+        client = create_app(DebugSpecConfig).test_client()
+        assert client.get("/apispec.json").get_json()["paths"]
@@ -0,0 +1,73 @@
+"""
+Connection Pool Tests
+
+Tests for engine options and pool telemetry.
+"""
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import NullPool
+
+from app.core.pool import InstrumentedQueuePool, build_engine_options, pool_stats
+
+POOL_ARGS = dict(
+    pool_size=3, max_overflow=2, pool_timeout=5, pool_recycle=600, pool_pre_ping=True, pgbouncer=False
+)
+
+
+class TestEngineOptions:
+    """Tests for build_engine_options."""
+
+    def test_postgres_gets_instrumented_pool(self):
+        """Test that PostgreSQL URLs get the configured pool."""
+        options = build_engine_options("postgresql://app@db/todo", **POOL_ARGS)
+
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["pool_size"] == 3
+        assert options["pool_pre_ping"] is True
+
+    def test_pgbouncer_mode_disables_app_pool(self):
+        """Test that PgBouncer mode leaves pooling to PgBouncer."""
+        options = build_engine_options("postgresql://app@pgbouncer/todo", **{**POOL_ARGS, "pgbouncer": True})
+
+        assert options["poolclass"] is NullPool
+        assert "pool_size" not in options
+
+    def test_sqlite_keeps_pool_defaults(self):
+        """Test that SQLite URLs only get the statement cache size."""
+        assert build_engine_options("sqlite:///todo.db", **POOL_ARGS) == {"query_cache_size": 500}
+
+
+class TestPoolTelemetry:
+    """Tests for InstrumentedQueuePool."""
+
+    def test_counts_checkouts_and_timeouts(self, tmp_path):
+        """Test that checkouts, waits and timeouts are recorded."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.01
+        )
+        with engine.connect():
+            assert pool_stats(engine)["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        stats = pool_stats(engine)
+        assert stats["checkouts"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["avg_checkout_ms"] > 0
+        engine.dispose()
+
+    def test_health_reports_pool(self, client):
+        """Test that /health exposes pool state per engine."""
+        data = client.get("/health").get_json()
+
+        assert data["database_pool"]["primary"]["pool"] == "StaticPool"
+
+    def test_health_reports_statement_cache(self, client, auth_headers):
+        """Test that repeated hot queries are served from the compiled cache."""
+        for _ in range(3):
+            client.get("/api/projects/", headers=auth_headers)
+
+        cache = client.get("/health").get_json()["database_pool"]["primary"]["statement_cache"]
+        assert cache["hits"] > cache["misses"] > 0
@@ -0,0 +1,75 @@
+"""
+Worker Process Tests
+
+Tests for the process helpers and the hooks of gunicorn.conf.py.
+"""
+import gc
+import runpy
+from pathlib import Path
+
+import pytest
+
+from app.core.extensions import db
+from app.core.process import memory_usage, reset_after_fork
+
+GUNICORN_CONF = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+
+@pytest.mark.skipif(not Path("/proc/self/smaps_rollup").exists(), reason="needs /proc/<pid>/smaps_rollup")
+def test_memory_usage_splits_shared_and_private():
+    """Test that the memory of this process is read from /proc."""
+    usage = memory_usage()
+
+    assert set(usage) == {"rss", "pss", "shared", "private"}
+    assert usage["rss"] > 0
+    assert usage["shared"] + usage["private"] == pytest.approx(usage["rss"], abs=64)
+
+
+def test_reset_after_fork_replaces_the_pool(app):
+    """Test that a forked worker gets a fresh connection pool."""
+    with app.app_context():
+        engine = db.engine
+        pool = engine.pool
+
+    reset_after_fork(app)
+
+    assert engine.pool is not pool
+
+
+class TestGunicornConf:
+    """Tests for the settings and hooks of gunicorn.conf.py."""
+
+    def test_settings_come_from_environment(self, monkeypatch):
+        """Test that the worker count and recycling honour the environment."""
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+        monkeypatch.setenv("GUNICORN_MAX_REQUESTS", "50")
+        conf = runpy.run_path(str(GUNICORN_CONF))
+
+        assert conf["workers"] == 3
+        assert conf["max_requests"] == 50
+        assert conf["preload_app"] is True
+
+    def test_default_workers_follow_cores(self, monkeypatch):
+        """Test that the default worker count is derived from the usable cores."""
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        conf = runpy.run_path(str(GUNICORN_CONF))
+
+        assert conf["workers"] == 2 * conf["_usable_cores"]() + 1
+
+    def test_pre_fork_freezes_the_heap(self, monkeypatch):
+        """Test that objects imported by the master are frozen before forking."""
+        monkeypatch.delenv("GUNICORN_GC_FREEZE", raising=False)
+        conf = runpy.run_path(str(GUNICORN_CONF))
+        try:
+            conf["pre_fork"](None, None)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+    def test_pre_fork_freeze_can_be_disabled(self, monkeypatch):
+        """Test that GUNICORN_GC_FREEZE=false leaves the collector alone."""
+        monkeypatch.setenv("GUNICORN_GC_FREEZE", "false")
+        conf = runpy.run_path(str(GUNICORN_CONF))
+
+        conf["pre_fork"](None, None)
+        assert gc.get_freeze_count() == 0
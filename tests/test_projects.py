@@ -1,10 +1,12 @@
 """
 Projects API Tests
 
-Tests for project CRUD endpoints.
+Tests for project CRUD endpoints and their query budgets.
 """
 import pytest
-from tests.conftest import create_test_user, get_auth_headers
+from tests.conftest import create_test_user, get_auth_headers, seed_projects
+
+SEEDED_PROJECTS = [1, 10, 100]
 
 
 class TestCreateProject:
@@ -88,7 +90,31 @@ class TestGetProjects:
         assert len(data["data"]) == 3
         assert "meta" in data
         assert data["meta"]["total_items"] == 3
-    
+
+    def test_row_listing_matches_orm_serialization(self, app, client, auth_headers):
+        """Test that the column-row listings equal serializing the ORM objects."""
+        from app.core.extensions import db
+        from app.models.project import Projects
+        from app.schemas.project import ProjectWithTasks
+        from app.services.project_service import ProjectService
+        from app.services.task_service import TaskService
+        from tests.conftest import create_project, create_task
+
+        project_ids = [create_project(client, auth_headers, f"Project {i}") for i in range(3)]
+        for project_id in project_ids[:2]:
+            create_task(client, auth_headers, project_id, "First")
+            create_task(client, auth_headers, project_id, "Second")
+        user_id = db.session.get(Projects, project_ids[0]).user_id
+
+        result = ProjectService.get_user_projects(str(user_id), page=1, per_page=2)
+        expected = [
+            ProjectWithTasks.dump_orm_project(db.session.get(Projects, project_id))
+            for project_id in project_ids[:2]
+        ]
+        assert result["data"] == expected
+        assert result["meta"] == {"page": 1, "per_page": 2, "total_pages": 2, "total_items": 3}
+        assert TaskService.get_tasks_by_project(project_ids[0]) == expected[0]["task"]
+
     def test_get_projects_without_auth(self, client):
         """Test getting projects without authentication."""
         response = client.get("/api/projects/")
@@ -169,3 +195,38 @@ class TestGetProjectById:
         response = client.get("/api/projects/99999", headers=auth_headers)
         
         assert response.status_code == 404
+
+
+class TestQueryBudget:
+    """Tests that the project endpoints run a fixed number of queries, however many rows exist."""
+
+    @pytest.mark.parametrize("projects", SEEDED_PROJECTS)
+    def test_list_projects(self, client, auth_headers, query_budget, projects):
+        """Test GET /api/projects/ with a full page of projects and their tasks."""
+        seed_projects("test@example.com", projects)
+
+        with query_budget(6):
+            response = client.get("/api/projects/?per_page=100", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert len(response.get_json()["data"]) == projects
+
+    @pytest.mark.parametrize("projects", SEEDED_PROJECTS)
+    def test_get_project(self, client, auth_headers, query_budget, projects):
+        """Test GET /api/projects/{id} among many projects, with as many tasks."""
+        project_id = seed_projects("test@example.com", projects, tasks_per_project=projects)[-1]
+
+        with query_budget(5):
+            response = client.get(f"/api/projects/{project_id}", headers=auth_headers)
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("tasks", SEEDED_PROJECTS)
+    def test_list_project_tasks(self, client, auth_headers, query_budget, tasks):
+        """Test GET /api/tasks/{project_id}/tasks with a growing number of tasks."""
+        project_id = seed_projects("test@example.com", 1, tasks_per_project=tasks)[0]
+
+        with query_budget(5):
+            response = client.get(f"/api/tasks/{project_id}/tasks?per_page=100", headers=auth_headers)
+
+        assert response.status_code == 200
@@ -0,0 +1,122 @@
+"""
+Read Replica Tests
+
+Tests for routing reads to replicas, read-your-writes pinning and fallback.
+"""
+import pytest
+from sqlalchemy import insert
+
+from app import create_app
+from app.core.extensions import db
+from app.models.project import Projects
+from tests.conftest import TestingConfig, create_test_user, get_auth_headers
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """An app whose primary and replica are separate SQLite files, with no replication."""
+    class ReplicaConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        DATABASE_REPLICA_URLS = [f"sqlite:///{tmp_path / 'replica.db'}"]
+        DATABASE_REPLICA_PIN_SECONDS = 60
+
+    test_app = create_app(ReplicaConfig)
+    with test_app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines["replica_0"])
+        yield test_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def replica_client(replica_app):
+    return replica_app.test_client()
+
+
+@pytest.fixture
+def replica_headers(replica_client):
+    create_test_user(replica_client)
+    return get_auth_headers(replica_client)
+
+
+def seed_replica(user_id: int, name: str) -> None:
+    """Write a project straight into the replica, as replication would."""
+    with db.engines["replica_0"].begin() as connection:
+        connection.execute(insert(Projects).values(project_name=name, description="Replicated", user_id=user_id))
+
+
+def project_names(client, headers) -> list:
+    response = client.get("/api/projects/", headers=headers)
+    assert response.status_code == 200
+    return [project["project_name"] for project in response.get_json()["data"]]
+
+
+class TestReplicaRouting:
+    """Tests for the replica router."""
+
+    def test_authenticated_reads_use_replica(self, replica_client, replica_headers):
+        """Test that list reads come from the replica when the user has not written."""
+        seed_replica(1, "Only on replica")
+
+        assert project_names(replica_client, replica_headers) == ["Only on replica"]
+
+    def test_user_reads_own_writes_from_primary(self, replica_client, replica_headers):
+        """Test that a user who just wrote is pinned to the primary."""
+        replica_client.post(
+            "/api/projects/",
+            json={"project_name": "Just written", "description": "Not replicated yet"},
+            headers=replica_headers
+        )
+
+        assert project_names(replica_client, replica_headers) == ["Just written"]
+
+    def test_pin_expires(self, replica_app, replica_client, replica_headers):
+        """Test that reads return to the replica after the pin window."""
+        replica_app.extensions["replicas"].pin_seconds = 0
+        replica_client.post(
+            "/api/projects/",
+            json={"project_name": "Just written", "description": "Not replicated yet"},
+            headers=replica_headers
+        )
+
+        assert project_names(replica_client, replica_headers) == []
+
+    def test_writes_go_to_primary(self, replica_client, replica_headers):
+        """Test that writes never reach the replica."""
+        replica_client.post(
+            "/api/projects/",
+            json={"project_name": "Primary only", "description": "Write"},
+            headers=replica_headers
+        )
+
+        with db.engines["replica_0"].connect() as connection:
+            assert connection.execute(db.select(Projects.id)).first() is None
+
+
+class TestReplicaFallback:
+    """Tests for falling back to the primary."""
+
+    def test_unreachable_replica_falls_back_to_primary(self, tmp_path):
+        """Test that reads use the primary while the replica can't be reached."""
+        class BrokenReplicaConfig(TestingConfig):
+            DATABASE_REPLICA_URLS = [f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"]
+            DATABASE_REPLICA_PIN_SECONDS = 0
+
+        test_app = create_app(BrokenReplicaConfig)
+        with test_app.app_context():
+            db.create_all()
+            client = test_app.test_client()
+            create_test_user(client)
+            headers = get_auth_headers(client)
+            client.post(
+                "/api/projects/",
+                json={"project_name": "On primary", "description": "Fallback"},
+                headers=headers
+            )
+
+            assert project_names(client, headers) == ["On primary"]
+            health = client.get("/health").get_json()
+            assert health["replicas"] == [{"name": "replica_0", "healthy": False}]
+            db.session.remove()
+            db.drop_all()
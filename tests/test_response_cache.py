@@ -0,0 +1,121 @@
+"""
+Response Cache Tests
+
+Tests for the per-user response cache and its write-driven invalidation.
+"""
+from app.core.cache import LocalCache, scopes_for_change
+from tests.conftest import create_project, create_task
+
+
+class TestCachedResponses:
+    """Tests for cached GET endpoints."""
+
+    def test_repeated_list_is_served_from_cache(self, app, client, auth_headers):
+        """Test that the second identical read is a hit with the same body."""
+        create_project(client, auth_headers)
+
+        first = client.get("/api/projects/", headers=auth_headers)
+        second = client.get("/api/projects/", headers=auth_headers)
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.get_json() == first.get_json()
+        stats = app.extensions["response_cache"].stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_query_args_are_part_of_the_key(self, client, auth_headers):
+        """Test that different pages are cached separately, in any arg order."""
+        client.get("/api/projects/?page=1&per_page=5", headers=auth_headers)
+
+        response = client.get("/api/projects/?per_page=5&page=1", headers=auth_headers)
+        assert response.headers["X-Cache"] == "HIT"
+        response = client.get("/api/projects/?page=2&per_page=5", headers=auth_headers)
+        assert response.headers["X-Cache"] == "MISS"
+
+    def test_task_write_invalidates_task_list(self, client, auth_headers):
+        """Test that creating a task is visible on the next read."""
+        project_id = create_project(client, auth_headers)
+        client.get(f"/api/tasks/{project_id}/tasks", headers=auth_headers)
+
+        create_task(client, auth_headers, project_id)
+        response = client.get(f"/api/tasks/{project_id}/tasks", headers=auth_headers)
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert len(response.get_json()["data"]) == 1
+
+    def test_project_write_invalidates_project_list(self, client, auth_headers):
+        """Test that renaming a project is visible on the next read."""
+        project_id = create_project(client, auth_headers, "Before")
+        client.get("/api/projects/", headers=auth_headers)
+
+        client.put(
+            f"/api/projects/{project_id}",
+            json={"project_name": "After", "description": "Renamed"},
+            headers=auth_headers
+        )
+        response = client.get("/api/projects/", headers=auth_headers)
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.get_json()["data"][0]["project_name"] == "After"
+
+    def test_cache_is_per_user(self, client, auth_headers, second_user_headers):
+        """Test that one user's cached list is never served to another."""
+        create_project(client, auth_headers)
+        client.get("/api/projects/", headers=auth_headers)
+
+        response = client.get("/api/projects/", headers=second_user_headers)
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.get_json()["data"] == []
+
+    def test_other_users_writes_keep_entries(self, client, auth_headers, second_user_headers):
+        """Test that writes by another user don't invalidate this user's entries."""
+        client.get("/api/projects/", headers=auth_headers)
+
+        create_project(client, second_user_headers)
+        response = client.get("/api/projects/", headers=auth_headers)
+
+        assert response.headers["X-Cache"] == "HIT"
+
+    def test_forbidden_user_detail_is_not_cached(self, client, auth_headers, second_user_headers):
+        """Test that requests for other users' data bypass the cache."""
+        create_project(client, auth_headers)
+        user_id = client.get("/api/projects/", headers=auth_headers).get_json()["data"][0]["user_id"]
+
+        response = client.get(f"/api/users/{user_id}", headers=second_user_headers)
+
+        assert response.status_code == 403
+        assert "X-Cache" not in response.headers
+
+    def test_health_reports_cache_stats(self, client):
+        """Test that /health exposes the cache counters."""
+        data = client.get("/health").get_json()
+
+        assert data["response_cache"]["backend"] == "memory"
+        assert data["response_cache"]["hits"] == 0
+
+
+class TestLocalCache:
+    """Tests for the in-process cache backend."""
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Test that the byte budget evicts the oldest entries."""
+        cache = LocalCache(max_bytes=30)
+        cache.set("a", b"x" * 10, ttl=60)
+        cache.set("b", b"x" * 10, ttl=60)
+        cache.get("a")
+        cache.set("c", b"x" * 10, ttl=60)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidation_changes_key(self):
+        """Test that invalidating a scope makes existing keys unreachable."""
+        cache = LocalCache(max_bytes=1024)
+        key = cache.build_key(1, "route", "", ["projects:1"])
+
+        cache.invalidate(scopes_for_change("1", {"type": "project.updated", "id": 5}))
+
+        assert cache.build_key(1, "route", "", ["projects:1"]) != key
@@ -0,0 +1,121 @@
+"""
+Search API Tests
+
+Tests for the typeahead suggestion endpoint.
+"""
+import threading
+
+import pytest
+
+from app.services.search_service import PrefixIndex, SearchIndexRegistry
+from tests.conftest import create_project, create_task, create_test_user, get_auth_headers
+
+
+def suggest(client, headers, prefix: str) -> list:
+    """Return suggestion names for a prefix."""
+    response = client.get(f"/api/search/suggest?prefix={prefix}", headers=headers)
+    assert response.status_code == 200
+    return [item["name"] for item in response.get_json()["data"]]
+
+
+class TestSuggest:
+    """Tests for GET /api/search/suggest endpoint."""
+
+    def test_suggest_matches_name_and_word_prefixes(self, client, auth_headers):
+        """Test that both the start of a name and the start of any word match."""
+        project_id = create_project(client, auth_headers, "Website Redesign")
+        create_task(client, auth_headers, project_id, "Write API docs")
+
+        assert suggest(client, auth_headers, "web") == ["Website Redesign"]
+        assert suggest(client, auth_headers, "RED") == ["Website Redesign"]
+        assert suggest(client, auth_headers, "api") == ["Write API docs"]
+        # Second call is served from the warm in-memory index
+        assert suggest(client, auth_headers, "w") == ["Website Redesign", "Write API docs"]
+
+    def test_warm_index_follows_writes(self, client, auth_headers):
+        """Test that creates, updates and deletes keep the warm index current."""
+        project_id = create_project(client, auth_headers, "Alpha")
+        assert suggest(client, auth_headers, "al") == ["Alpha"]
+
+        task_id = create_task(client, auth_headers, project_id, "Alpine hike")
+        assert suggest(client, auth_headers, "al") == ["Alpha", "Alpine hike"]
+
+        client.put(
+            f"/api/projects/{project_id}",
+            json={"project_name": "Beta", "description": "Renamed"},
+            headers=auth_headers
+        )
+        assert suggest(client, auth_headers, "al") == ["Alpine hike"]
+
+        client.delete(f"/api/tasks/{project_id}/task/{task_id}", headers=auth_headers)
+        assert suggest(client, auth_headers, "al") == []
+
+        create_task(client, auth_headers, project_id, "Beta launch")
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+        assert suggest(client, auth_headers, "beta") == []
+
+    def test_oversized_index_falls_back_to_database(self, app, client, auth_headers):
+        """Test that users over the entry budget are still answered."""
+        app.config["SEARCH_INDEX_MAX_ENTRIES"] = 2
+        for name in ("One", "Two", "Three"):
+            create_project(client, auth_headers, name)
+
+        assert suggest(client, auth_headers, "t") == ["Three", "Two"]
+        assert suggest(client, auth_headers, "t") == ["Three", "Two"]
+
+    def test_users_see_only_own_suggestions(self, client, auth_headers):
+        """Test that suggestions are scoped to the current user."""
+        create_project(client, auth_headers, "Shared name")
+        create_test_user(client, "Other User", "other@example.com", "Password123")
+        other_headers = get_auth_headers(client, "other@example.com", "Password123")
+
+        assert suggest(client, other_headers, "shared") == []
+
+    @pytest.mark.parametrize("query", ["", "prefix=", "prefix=a&limit=abc"])
+    def test_suggest_invalid_parameters(self, client, auth_headers, query):
+        """Test that a missing prefix or bad limit is rejected."""
+        response = client.get(f"/api/search/suggest?{query}", headers=auth_headers)
+
+        assert response.status_code == 422
+
+    def test_suggest_without_auth(self, client):
+        """Test suggestions without authentication."""
+        response = client.get("/api/search/suggest?prefix=a")
+
+        assert response.status_code == 401
+
+
+class TestSearchIndexRegistry:
+    """Tests for the per-user index registry."""
+
+    def test_search_while_writes_change_the_index(self):
+        """Test that searches never see an index halfway through a write."""
+        registry = SearchIndexRegistry()
+        index = PrefixIndex(max_entries=10000)
+        index.add("project", 1, "Project", 1)
+        registry.put("1", index, max_users=10)
+        errors = []
+        done = threading.Event()
+
+        def write():
+            for task_id in range(2000):
+                registry.add_task(task_id, f"Task {task_id}", 1)
+                registry.remove_task(task_id - 1, 1)
+            done.set()
+
+        def read():
+            try:
+                while not done.is_set():
+                    registry.search(index, "t", 5)
+            except Exception as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        write()
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert [doc["name"] for doc in registry.search(index, "t", 5)] == ["Task 1999"]
@@ -0,0 +1,90 @@
+"""
+Startup Tests
+
+Tests for the cold start budget, the lazily loaded dependencies and the
+startup-profile command. Cold starts run in fresh interpreters.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.core.config import FlaskConfig
+from app.core.startup import ROOT, measure_startup, module_group, parse_importtime
+
+LAZY_MODULES = ("flask_migrate", "alembic", "bleach", "email_validator")
+
+
+@pytest.fixture
+def cold_env(tmp_path):
+    """Environment for a child process building the app."""
+    return {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}",
+        "SECRET_KEY": "Qw8rTy7uIo9pAs6dFg5hJk4lZx3cVb2nMq1wErTyUiOp",
+        "JWT_SECRET_KEY": "Zx9cVb8nMq7wEr6tYu5iOp4aSd3fGh2jKl1QwErTyUiO",
+        "LOG_FILE": str(tmp_path / "app.log"),
+    }
+
+
+def test_cold_start_within_budget(cold_env):
+    """Test that importing the app and running create_app() stays within STARTUP_BUDGET_SECONDS."""
+    timings = measure_startup(cold_env)
+
+    slowest = sorted(timings["modules"].items(), key=lambda item: -item[1])[:5]
+    assert timings["total"] <= FlaskConfig.STARTUP_BUDGET_SECONDS, (
+        f"Cold start took {timings['total']:.2f}s; slowest imports: "
+        + ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in slowest)
+    )
+
+
+def test_heavy_dependencies_load_on_first_use(cold_env):
+    """Test that create_app() leaves migration, sanitizing and email validation libraries unimported."""
+    probe = "import sys; from app import create_app; create_app(); print(sorted(set(sys.modules) & set(sys.argv[1:])))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe, *LAZY_MODULES], cwd=ROOT, env=cold_env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_parse_importtime_groups_modules():
+    """Test that -X importtime output is summed per module group."""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:      1000 |       1000 |     sqlalchemy.sql\n"
+        "import time:      2000 |       3000 |   sqlalchemy\n"
+        "import time:       500 |        500 |     app.core.config\n"
+        "some other stderr line\n"
+    )
+
+    assert parse_importtime(output) == {"sqlalchemy": 0.003, "app.core": 0.0005}
+    assert module_group("app") == "app"
+
+
+class TestCommands:
+    """Tests for the startup-profile command and the lazily loaded `flask db`."""
+
+    def test_startup_profile_reports_modules(self, runner):
+        """Test that the profile lists the time per module group."""
+        result = runner.invoke(args=["startup-profile", "--top", "3", "--budget", "60"])
+
+        assert result.exit_code == 0, result.output
+        assert "create_app()" in result.output
+        assert "sqlalchemy" in result.output
+
+    def test_startup_profile_enforces_budget(self, runner):
+        """Test that a cold start over the budget fails the command."""
+        result = runner.invoke(args=["startup-profile", "--budget", "0.001"])
+
+        assert result.exit_code != 0
+        assert "over the 0.00s budget" in result.output
+
+    def test_db_commands_still_available(self, runner):
+        """Test that `flask db` loads Flask-Migrate's commands on demand."""
+        result = runner.invoke(args=["db", "--help"])
+
+        assert result.exit_code == 0, result.output
+        assert "upgrade" in result.output
@@ -0,0 +1,108 @@
+"""
+Sync API Tests
+
+Tests for the delta sync endpoint and delete tombstones.
+"""
+import pytest
+
+from tests.conftest import create_project, create_task
+
+
+def sync(client, headers, since=None) -> dict:
+    """Call the sync endpoint and return its data."""
+    url = "/api/sync" if since is None else f"/api/sync?since={since}"
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return response.get_json()["data"]
+
+
+class TestSync:
+    """Tests for GET /api/sync endpoint."""
+
+    def test_snapshot_without_cursor(self, client, auth_headers):
+        """Test that omitting the cursor returns everything."""
+        project_id = create_project(client, auth_headers)
+        create_task(client, auth_headers, project_id)
+
+        data = sync(client, auth_headers)
+
+        assert len(data["projects"]) == 1
+        assert len(data["tasks"]) == 1
+        assert data["cursor"] != "0"
+        assert data["has_more"] is False
+
+    def test_delta_returns_only_changed_rows(self, client, auth_headers):
+        """Test that a sync after two edits transfers two rows."""
+        project_id = create_project(client, auth_headers)
+        task_ids = [create_task(client, auth_headers, project_id, f"Task {i}") for i in range(5)]
+        cursor = sync(client, auth_headers)["cursor"]
+
+        client.put(
+            f"/api/projects/{project_id}",
+            json={"project_name": "Renamed", "description": "Updated"},
+            headers=auth_headers
+        )
+        client.delete(f"/api/tasks/{project_id}/task/{task_ids[0]}", headers=auth_headers)
+        data = sync(client, auth_headers, cursor)
+
+        assert [p["project_name"] for p in data["projects"]] == ["Renamed"]
+        assert data["tasks"] == []
+        assert data["deleted"] == {"projects": [], "tasks": [task_ids[0]]}
+
+        assert sync(client, auth_headers, data["cursor"])["projects"] == []
+
+    def test_move_between_own_projects_leaves_no_tombstone(self, client, auth_headers):
+        """Test that a task moved within one owner's projects syncs as an update only."""
+        source = create_project(client, auth_headers, "Source")
+        target = create_project(client, auth_headers, "Target")
+        task_id = create_task(client, auth_headers, source)
+        cursor = sync(client, auth_headers)["cursor"]
+
+        client.put(
+            f"/api/tasks/{target}/task/{task_id}",
+            json={"task_name": "Moved", "description": "Moved", "due_date": "2030-01-01", "status": "pending"},
+            headers=auth_headers
+        )
+        data = sync(client, auth_headers, cursor)
+
+        assert [(t["id"], t["project_id"]) for t in data["tasks"]] == [(task_id, target)]
+        assert data["deleted"] == {"projects": [], "tasks": []}
+
+    def test_project_delete_leaves_task_tombstones(self, client, auth_headers):
+        """Test that cascaded task deletes are reported too."""
+        project_id = create_project(client, auth_headers)
+        task_id = create_task(client, auth_headers, project_id)
+        cursor = sync(client, auth_headers)["cursor"]
+
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+        data = sync(client, auth_headers, cursor)
+
+        assert data["deleted"] == {"projects": [project_id], "tasks": [task_id]}
+
+    def test_delta_pages_with_has_more(self, app, client, auth_headers):
+        """Test that large deltas are paged."""
+        app.config["SYNC_MAX_CHANGES"] = 2
+        for i in range(3):
+            create_project(client, auth_headers, f"Project {i}")
+
+        first = sync(client, auth_headers, 0)
+        second = sync(client, auth_headers, first["cursor"])
+
+        assert len(first["projects"]) == 2 and first["has_more"] is True
+        assert len(second["projects"]) == 1 and second["has_more"] is False
+
+    def test_users_sync_only_own_changes(self, client, auth_headers, second_user_headers):
+        """Test that changes are scoped to the current user."""
+        create_project(client, auth_headers)
+
+        data = sync(client, second_user_headers, 0)
+
+        assert data["projects"] == []
+        assert data["cursor"] == "0"
+
+    @pytest.mark.parametrize("cursor", ["abc", "-1"])
+    def test_invalid_cursor(self, client, auth_headers, cursor):
+        """Test that malformed cursors are rejected."""
+        response = client.get(f"/api/sync?since={cursor}", headers=auth_headers)
+
+        assert response.status_code == 422
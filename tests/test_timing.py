@@ -0,0 +1,94 @@
+"""
+Server Timing Tests
+
+Tests for the per-request query count and database time in the
+Server-Timing header and the access log.
+"""
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from app.core.extensions import db
+from app.core.timing import _before_cursor_execute
+from tests.conftest import TestingConfig, create_project, create_test_user, get_auth_headers
+from tests.test_logging import HTTPSClient, access_lines
+
+SERVER_TIMING = re.compile(r'^db;dur=(?P<db>[\d.]+), app;dur=(?P<app>[\d.]+), queries;desc="(?P<queries>\d+)"$')
+
+
+@pytest.fixture
+def timed_app():
+    """Build an app with SERVER_TIMING on."""
+    apps = []
+
+    def build(**config):
+        class TimedConfig(TestingConfig):
+            SERVER_TIMING = True
+
+        for key, value in config.items():
+            setattr(TimedConfig, key, value)
+        app = create_app(TimedConfig)
+        app.test_client_class = HTTPSClient
+        with app.app_context():
+            db.create_all()
+        apps.append(app)
+        return app
+
+    yield build
+    for app in apps:
+        with app.app_context():
+            db.drop_all()
+
+
+def server_timing(response) -> dict:
+    match = SERVER_TIMING.match(response.headers["Server-Timing"])
+    assert match, response.headers["Server-Timing"]
+    return {"db": float(match["db"]), "app": float(match["app"]), "queries": int(match["queries"])}
+
+
+class TestServerTiming:
+    """Tests for the Server-Timing header."""
+
+    def test_counts_the_queries_of_each_request(self, timed_app):
+        """Test that the header reports this request's queries and DB time only."""
+        client = timed_app().test_client()
+        create_test_user(client)
+        headers = get_auth_headers(client)
+        create_project(client, headers, "One")
+
+        one = server_timing(client.get("/api/projects/", headers=headers))
+        create_project(client, headers, "Two")
+        two = server_timing(client.get("/api/projects/", headers=headers))
+
+        assert one["queries"] >= 1
+        assert two["queries"] == one["queries"]
+        assert one["db"] > 0
+        assert one["app"] > 0
+
+    def test_requests_without_queries(self, timed_app):
+        """Test that a request not touching the database reports zero queries."""
+        client = timed_app().test_client()
+
+        timing = server_timing(client.get("/missing"))
+
+        assert timing["queries"] == 0
+        assert timing["db"] == 0
+
+    def test_off_by_default(self, app, client):
+        """Test that without SERVER_TIMING there is no header and no cursor hook."""
+        assert "Server-Timing" not in client.get("/health").headers
+        assert not event.contains(db.engine, "before_cursor_execute", _before_cursor_execute)
+
+    def test_totals_in_the_access_log(self, timed_app, caplog):
+        """Test that the access log line carries the query count and DB time."""
+        client = timed_app(DEBUG=False).test_client()
+
+        response = client.get("/health")
+        response.close()
+
+        [line] = access_lines(caplog)
+        timing = server_timing(response)
+        assert line["queries"] == timing["queries"] >= 1
+        assert line["db_ms"] == round(timing["db"], 2)